@@ -0,0 +1,40 @@
+"""add workspace_ssh_ports
+
+Revision ID: 2026_10_17_0001
+Revises: 2026_01_08_0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_17_0001"
+down_revision = "2026_01_08_0001"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(bind, table_name: str) -> bool:
+    insp = sa.inspect(bind)
+    return table_name in insp.get_table_names()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _table_exists(bind, "workspace_ssh_ports"):
+        op.create_table(
+            "workspace_ssh_ports",
+            sa.Column("workspace_id", sa.String(length=100), primary_key=True),
+            sa.Column("port", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+            sa.UniqueConstraint("port", name="uq_workspace_ssh_ports_port"),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _table_exists(bind, "workspace_ssh_ports"):
+        op.drop_table("workspace_ssh_ports")
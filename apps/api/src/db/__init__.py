@@ -15,6 +15,7 @@ from .models import (
     WorkspacePlacementModel,
     PlacementPolicyModel,
     UserSessionModel,
+    WorkspaceSSHPortModel,
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     "WorkspacePlacementModel",
     "PlacementPolicyModel",
     "UserSessionModel",
+    "WorkspaceSSHPortModel",
 ]
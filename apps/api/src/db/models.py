@@ -262,6 +262,20 @@ class PlacementPolicyModel(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 
+class WorkspaceSSHPortModel(Base):
+    """
+    워크스페이스 SSH 포트 할당
+
+    - 워크스페이스당 1개 포트, 포트는 전역 유니크 (충돌은 할당 시 1회만 해결)
+    - 컨테이너 기준으로 동작하는 SSH API 특성상 workspaces FK는 두지 않음
+    """
+    __tablename__ = "workspace_ssh_ports"
+    
+    workspace_id = Column(String(100), primary_key=True)
+    port = Column(Integer, unique=True, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class UserSessionModel(Base):
     """사용자 세션 테이블"""
     __tablename__ = "user_sessions"
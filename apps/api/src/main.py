@@ -386,6 +386,25 @@ async def startup_event():
         logger.warning(f"Redis 연결 실패 (계속 진행): {e}")
         # Redis는 선택적이므로 실패해도 계속 진행
     
+    # RAG 서비스 사전 초기화 (임베딩 모델 로드/Qdrant 연결을 첫 요청이 아닌 시작 시점에 수행)
+    # 라우터는 Depends(services.rag_dependencies)로 app.state에 보관된 인스턴스를 주입받는다.
+    try:
+        from .services.embedding_service import get_embedding_service
+        from .services.vector_store import get_vector_store
+        from .services.context_builder import get_context_builder
+        from .services.code_indexer import get_code_indexer
+        app.state.embedding_service = await get_embedding_service()
+        app.state.vector_store = await get_vector_store()
+        app.state.context_builder = await get_context_builder()
+        app.state.code_indexer = await get_code_indexer()
+    except Exception as e:
+        logger.warning(f"RAG 서비스 사전 초기화 실패 (요청 시 지연 초기화): {e}")
+        # Qdrant 등이 아직 준비되지 않았어도 앱은 계속 실행 (라우터에서 지연 초기화)
+    
+    # SSH RSA 키 생성 요청이 키 생성 시간을 기다리지 않도록 백그라운드에서 미리 생성
+    from .routers.ssh import prewarm_rsa_key_pool
+    prewarm_rsa_key_pool()
+    
     logger.info("애플리케이션 시작 완료")
     # vLLM 클라이언트는 필요 시 자동 생성됨 (get_llm_client)
 
@@ -393,6 +412,18 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 실행"""
+    # 진행 중인 git clone 작업 취소
+    from .services.git_clone_service import get_git_clone_service
+    await get_git_clone_service().shutdown()
+    
+    # WebSocket 백그라운드 태스크 중지 및 남은 Redis 발행 전송
+    from .routers.ws import manager as ws_manager
+    await ws_manager.shutdown()
+    
+    # 코드 인덱서 청킹 프로세스 풀 종료
+    if getattr(app.state, "code_indexer", None) is not None:
+        app.state.code_indexer.shutdown()
+    
     # Redis 캐시 연결 종료
     from .services.cache_service import cache_service
     await cache_service.disconnect()
@@ -16,6 +16,8 @@ from .base import (
     UpdateProjectRequest,
     ProjectResponse,
     CloneGitHubRequest,
+    CloneWorkspaceResponse,
+    CloneStatusResponse,
     FileType,
     FileTreeItem,
     FileTreeResponse,
@@ -123,6 +125,8 @@ __all__ = [
     "UpdateProjectRequest",
     "ProjectResponse",
     "CloneGitHubRequest",
+    "CloneWorkspaceResponse",
+    "CloneStatusResponse",
     # Files
     "FileType",
     "FileTreeItem",
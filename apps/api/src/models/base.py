@@ -5,6 +5,7 @@ Task B: API 명세 반영
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional, List
+from datetime import datetime
 from enum import Enum
 import re
 
@@ -164,6 +165,7 @@ class CloneGitHubRequest(BaseModel):
     branch: Optional[str] = Field(default=None, max_length=100)
     project_id: Optional[str] = Field(default=None, alias="projectId", max_length=100, description="기존 프로젝트에 워크스페이스를 추가할 때 사용")
     project_name: Optional[str] = Field(default=None, alias="projectName", max_length=255, description="projectId가 없을 때 새 프로젝트 생성용 이름(선택)")
+    full_history: bool = Field(default=False, alias="fullHistory", description="전체 히스토리 클론 여부 (기본: 얕은 클론)")
     
     @field_validator("repository_url")
     @classmethod
@@ -180,6 +182,23 @@ class CloneGitHubRequest(BaseModel):
     model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
 
 
+class CloneWorkspaceResponse(WorkspaceResponse):
+    """GitHub 클론 요청 응답 (클론은 백그라운드에서 진행)"""
+    status: str = Field(default="cloning", description="클론 상태 (pending, cloning, ready, failed)")
+
+
+class CloneStatusResponse(BaseModel):
+    """GitHub 클론 진행 상태"""
+    workspace_id: str = Field(..., alias="workspaceId")
+    status: str = Field(..., description="pending, cloning, ready, failed")
+    error: Optional[str] = None
+    progress: Optional[str] = Field(default=None, description="git 진행 상태 (마지막 진행 줄)")
+    started_at: datetime = Field(..., alias="startedAt")
+    completed_at: Optional[datetime] = Field(default=None, alias="completedAt")
+    
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
+
 # ============================================================
 # Files
 # ============================================================
@@ -493,6 +512,7 @@ class WSMessageType(str, Enum):
     """WebSocket 메시지 타입"""
     FILE_CHANGE = "file_change"
     CURSOR_MOVE = "cursor_move"
+    CURSOR_MOVE_BATCH = "cursor_move_batch"  # 서버 → 클라이언트: 짧은 구간의 커서 이동을 사용자별 최신값으로 묶음
     AI_STREAM = "ai_stream"
     ERROR = "error"
 
@@ -212,6 +212,9 @@ class SetupSSHPasswordRequest(BaseModel):
             raise ValueError("Password must contain at least one lowercase letter")
         if not any(c.isdigit() for c in v):
             raise ValueError("Password must contain at least one digit")
+        # chpasswd 입력은 "user:password" 한 줄이므로 줄바꿈 금지
+        if "\n" in v or "\r" in v:
+            raise ValueError("Password must not contain line breaks")
         return v
 
 
@@ -1656,8 +1656,7 @@ async def advanced_chat(request: AIAdvancedChatRequest):
     - 클립보드 텍스트/이미지
     - Agent/Plan/Debug/Ask 모드 지원
     """
-    import os
-    dev_mode = os.getenv("DEV_MODE", "true").lower() == "true"
+    dev_mode = settings.DEV_MODE
     
     # 컨텍스트 조합
     context_parts = []
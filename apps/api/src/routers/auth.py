@@ -142,12 +142,13 @@ async def get_current_user(
 @router.get("/jwks")
 async def jwks():
     """
-    AI Gateway 검증용 JWKS 제공 (RS256)
+    AI Gateway 검증용 JWKS 제공 (RS256 / ES256)
 
     - 금융권 VDE: 외부 IdP 없이 내부 JWKS 사용 가능
     - Gateway는 JWT_JWKS_URL로 이 엔드포인트를 참조
+    - 게이트웨이/사이드카가 자주 폴링하므로 미리 직렬화한 본문을 그대로 반환
     """
-    return jwt_auth_service.get_gateway_jwks()
+    return Response(content=jwt_auth_service.get_gateway_jwks_json(), media_type="application/json")
 
 
 @router.post("/gateway-token", response_model=GatewayTokenResponse)
@@ -230,7 +231,7 @@ async def signup(
     
     # 사용자 생성
     user_id = f"u_{secrets.token_urlsafe(8)}"
-    password_hash = password_service.hash_password(request.password)
+    password_hash = await password_service.hash_password_async(request.password)
     role = "developer"
     
     user = UserModel(
@@ -338,7 +339,7 @@ async def login(
     
     # 비밀번호 검증
     if user.password_hash:
-        if not password_service.verify_password(login_request.password, user.password_hash):
+        if not await password_service.verify_password_async(login_request.password, user.password_hash):
             await rate_limit_service.record_login_attempt(login_request.email.lower(), ip_address, success=False)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -9,32 +9,65 @@ Projects 라우터
 - project_id(pid)는 gateway 토큰/감사 로그의 핵심 스코프
 """
 
+import re
 import secrets
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
 
 from ..db.connection import get_db
 from ..db.models import ProjectModel, WorkspaceModel, UserModel
 from ..models import CreateProjectRequest, UpdateProjectRequest, ProjectResponse, WorkspaceResponse, ErrorResponse
 from ..services.rbac_service import require_permission, Permission
+from ..utils.http_cache import compute_etag, is_not_modified, not_modified_response, set_etag_headers
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 logger = logging.getLogger(__name__)
 
 
+# slug에 허용하지 않는 문자 (영숫자/유니코드 문자, '-', '_' 외)
+_PROJECT_SLUG_STRIP_RE = re.compile(r"[^\w-]")
+
+
 def _new_project_id(name: str) -> str:
-    # 직관성 + 충돌 방지(짧은 suffix)
-    suffix = secrets.token_urlsafe(4).replace("-", "").replace("_", "")
-    safe = name.strip().lower().replace(" ", "-")
-    safe = "".join(ch for ch in safe if ch.isalnum() or ch in "-_")
-    safe = safe[:50] if safe else "project"
+    # 직관성 + 충돌 방지(짧은 suffix, [0-9a-f] 6자라 별도 치환 불필요)
+    suffix = secrets.token_hex(3)
+    safe = _PROJECT_SLUG_STRIP_RE.sub("", name.strip().lower().replace(" ", "-"))[:50] or "project"
     return f"prj_{safe}_{suffix}"
 
 
+# project_id + owner_id 조회 문장은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 재사용한다.
+# (project_id는 unique 컬럼이지만 PK는 UUID id이므로 Session.get 대상이 아님)
+_OWNED_PROJECT_STMT = select(ProjectModel).where(
+    ProjectModel.project_id == bindparam("project_id"),
+    ProjectModel.owner_id == bindparam("owner_id"),
+)
+
+
+# 목록 응답: 컬럼 라벨을 ProjectResponse alias에 맞춰 조회 결과를 그대로 검증에 사용
+_PROJECT_RESPONSE_COLUMNS = (
+    ProjectModel.project_id.label("projectId"),
+    ProjectModel.name,
+    ProjectModel.description,
+    ProjectModel.owner_id.label("ownerId"),
+    ProjectModel.org_id.label("orgId"),
+)
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+
+
+async def _get_owned_project(db: AsyncSession, project_id: str, current_user: UserModel) -> ProjectModel:
+    """현재 사용자가 소유한 프로젝트 조회 (없으면 404)"""
+    res = await db.execute(_OWNED_PROJECT_STMT, {"project_id": project_id, "owner_id": current_user.user_id})
+    p = res.scalar_one_or_none()
+    if not p:
+        raise HTTPException(status_code=404, detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"})
+    return p
+
+
 @router.post(
     "",
     response_model=ProjectResponse,
@@ -71,26 +104,33 @@ async def create_project(
 @router.get(
     "",
     response_model=List[ProjectResponse],
-    responses={401: {"model": ErrorResponse}},
+    responses={401: {"model": ErrorResponse}, 304: {"description": "Not Modified (If-None-Match 일치)"}},
     summary="프로젝트 목록 조회",
 )
 async def list_projects(
+    request: Request,
+    response: Response,
     current_user: UserModel = Depends(require_permission(Permission.WORKSPACE_READ)),
     db: AsyncSession = Depends(get_db),
 ):
-    q = select(ProjectModel).where(ProjectModel.owner_id == current_user.user_id).order_by(ProjectModel.created_at.desc())
+    # 변경 여부는 집계 1회로 판단 (생성/수정/삭제 시 count 또는 max 시각이 바뀜)
+    version = await db.execute(
+        select(func.count(), func.max(ProjectModel.created_at), func.max(ProjectModel.updated_at))
+        .where(ProjectModel.owner_id == current_user.user_id)
+    )
+    etag = compute_etag(current_user.user_id, *version.one())
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+
+    q = (
+        select(*_PROJECT_RESPONSE_COLUMNS)
+        .where(ProjectModel.owner_id == current_user.user_id)
+        .order_by(ProjectModel.created_at.desc())
+    )
     res = await db.execute(q)
-    projects = res.scalars().all()
-    return [
-        ProjectResponse(
-            projectId=p.project_id,
-            name=p.name,
-            description=p.description,
-            ownerId=p.owner_id,
-            orgId=p.org_id,
-        )
-        for p in projects
-    ]
+    # ORM 엔티티 대신 응답 필드 컬럼만 조회하고, 목록 전체를 pydantic-core에서 한 번에 검증한다.
+    return _PROJECT_LIST_ADAPTER.validate_python(res.mappings().all())
 
 
 @router.get(
@@ -104,12 +144,7 @@ async def get_project(
     current_user: UserModel = Depends(require_permission(Permission.WORKSPACE_READ)),
     db: AsyncSession = Depends(get_db),
 ):
-    res = await db.execute(
-        select(ProjectModel).where(ProjectModel.project_id == project_id, ProjectModel.owner_id == current_user.user_id)
-    )
-    p = res.scalar_one_or_none()
-    if not p:
-        raise HTTPException(status_code=404, detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"})
+    p = await _get_owned_project(db, project_id, current_user)
     return ProjectResponse(projectId=p.project_id, name=p.name, description=p.description, ownerId=p.owner_id, orgId=p.org_id)
 
 
@@ -125,12 +160,7 @@ async def update_project(
     current_user: UserModel = Depends(require_permission(Permission.WORKSPACE_WRITE)),
     db: AsyncSession = Depends(get_db),
 ):
-    res = await db.execute(
-        select(ProjectModel).where(ProjectModel.project_id == project_id, ProjectModel.owner_id == current_user.user_id)
-    )
-    p = res.scalar_one_or_none()
-    if not p:
-        raise HTTPException(status_code=404, detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"})
+    p = await _get_owned_project(db, project_id, current_user)
 
     if request.name is not None:
         p.name = request.name
@@ -151,12 +181,7 @@ async def delete_project(
     current_user: UserModel = Depends(require_permission(Permission.WORKSPACE_DELETE)),
     db: AsyncSession = Depends(get_db),
 ):
-    res = await db.execute(
-        select(ProjectModel).where(ProjectModel.project_id == project_id, ProjectModel.owner_id == current_user.user_id)
-    )
-    p = res.scalar_one_or_none()
-    if not p:
-        raise HTTPException(status_code=404, detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"})
+    p = await _get_owned_project(db, project_id, current_user)
 
     ws_res = await db.execute(
         select(WorkspaceModel.workspace_id).where(WorkspaceModel.project_id == project_id).limit(1)
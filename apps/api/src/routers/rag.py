@@ -11,7 +11,7 @@ RAG (Retrieval-Augmented Generation) API 라우터
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -19,11 +19,19 @@ from sqlalchemy import select
 from ..db import WorkspaceModel, UserModel
 from ..db.connection import get_db
 from ..services.rbac_service import get_current_user
-from ..services.code_indexer import get_code_indexer, IndexingProgress
-from ..services.context_builder import get_context_builder
-from ..services.vector_store import get_vector_store
-from ..services.embedding_service import get_embedding_service
+from ..services.code_indexer import CodeIndexerService
+from ..services.context_builder import ContextBuilderService
+from ..services.vector_store import VectorStoreService
+from ..services.embedding_service import EmbeddingService
+from ..services.rag_dependencies import (
+    get_code_indexer_dep,
+    get_context_builder_dep,
+    get_embedding_service_dep,
+    get_vector_store_dep,
+    indexing_status_response,
+)
 from ..utils.filesystem import get_workspace_root
+from ..utils.http_cache import compute_etag, is_not_modified, not_modified_response, set_etag_headers
 
 logger = logging.getLogger(__name__)
 
@@ -152,9 +160,9 @@ class StatsResponse(BaseModel):
 )
 async def index_workspace(
     request: IndexWorkspaceRequest,
-    background_tasks: BackgroundTasks,
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     """워크스페이스 인덱싱 시작"""
     # 워크스페이스 존재 확인
@@ -175,29 +183,26 @@ async def index_workspace(
     # 워크스페이스 경로
     workspace_path = get_workspace_root(request.workspace_id)
     
-    # 백그라운드에서 인덱싱 실행
-    async def run_indexing():
-        try:
-            indexer = await get_code_indexer()
-            # 증분 인덱싱(기본) + 강제 재인덱싱 옵션 지원
-            await indexer.index_workspace_incremental(
-                workspace_id=request.workspace_id,
-                workspace_path=str(workspace_path),
-                db=db,
-                tenant_id=current_user.org_id,
-                project_id=workspace.project_id,
-                force_reindex=request.force_reindex,
-            )
-        except Exception as e:
-            logger.error(f"Background indexing failed: {e}")
-    
-    background_tasks.add_task(run_indexing)
+    # 백그라운드에서 인덱싱 실행 (작업 전용 DB 세션, 워크스페이스당 1개 작업)
+    # 증분 인덱싱(기본) + 강제 재인덱싱 옵션 지원
+    started = indexer.start_incremental_indexing(
+        workspace_id=request.workspace_id,
+        workspace_path=str(workspace_path),
+        tenant_id=current_user.org_id,
+        project_id=workspace.project_id,
+        force_reindex=request.force_reindex,
+    )
+    if not started:
+        # 이미 실행 중인 작업이 있으면 그 진행 상태를 그대로 응답
+        return indexing_status_response(
+            IndexingStatusResponse, request.workspace_id, indexer.get_progress(request.workspace_id)
+        )
     
-    logger.info(f"Indexing started for workspace: {request.workspace_id}")
+    logger.info(f"Indexing queued for workspace: {request.workspace_id}")
     
     return IndexingStatusResponse(
         workspace_id=request.workspace_id,
-        status="running",
+        status="queued",
         total_files=0,
         indexed_files=0,
         total_chunks=0,
@@ -215,33 +220,10 @@ async def index_workspace(
 async def get_indexing_status(
     workspace_id: str,
     current_user: UserModel = Depends(get_current_user),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     """인덱싱 상태 조회"""
-    indexer = await get_code_indexer()
-    progress = indexer.get_progress(workspace_id)
-    
-    if not progress:
-        # 진행 중인 인덱싱 없음 - 완료된 것으로 간주
-        return IndexingStatusResponse(
-            workspace_id=workspace_id,
-            status="completed",
-            total_files=0,
-            indexed_files=0,
-            total_chunks=0,
-            indexed_chunks=0,
-            progress_percent=100.0,
-        )
-    
-    return IndexingStatusResponse(
-        workspace_id=progress.workspace_id,
-        status=progress.status,
-        total_files=progress.total_files,
-        indexed_files=progress.indexed_files,
-        total_chunks=progress.total_chunks,
-        indexed_chunks=progress.indexed_chunks,
-        progress_percent=progress.progress_percent,
-        error=progress.error,
-    )
+    return indexing_status_response(IndexingStatusResponse, workspace_id, indexer.get_progress(workspace_id))
 
 
 @router.delete(
@@ -254,6 +236,7 @@ async def delete_index(
     workspace_id: str,
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     """인덱스 삭제"""
     # 워크스페이스 소유권 확인
@@ -271,7 +254,6 @@ async def delete_index(
             detail="Workspace not found",
         )
     
-    indexer = await get_code_indexer()
     await indexer.delete_workspace_index(workspace_id)
     
     logger.info(f"Index deleted for workspace: {workspace_id}")
@@ -287,19 +269,19 @@ async def search_code(
     request: SearchRequest,
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    embedding_service: EmbeddingService = Depends(get_embedding_service_dep),
+    vector_store: VectorStoreService = Depends(get_vector_store_dep),
 ):
     """코드 검색"""
-    embedding_service = await get_embedding_service()
-    vector_store = await get_vector_store()
-
     # 스코프 확보 (workspace -> project/tenant)
+    # project_id 컬럼만 조회 (ORM 엔티티/관계 로딩 없이 단일 쿼리)
     result = await db.execute(
-        select(WorkspaceModel).where(
+        select(WorkspaceModel.project_id).where(
             WorkspaceModel.workspace_id == request.workspace_id,
         )
     )
-    workspace = result.scalar_one_or_none()
-    if not workspace:
+    project_id = result.scalar_one_or_none()
+    if project_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
     
     # 쿼리 임베딩
@@ -310,16 +292,18 @@ async def search_code(
         query_embedding=query_embedding,
         workspace_id=request.workspace_id,
         tenant_id=current_user.org_id,
-        project_id=workspace.project_id,
+        project_id=project_id,
         limit=request.limit,
         file_filter=request.file_filter,
         language_filter=request.language_filter,
     )
     
+    # 벡터 저장소 결과는 서버 내부에서 생성된 신뢰 데이터이므로 항목별 검증을 생략한다.
+    # (응답 직렬화 시 response_model 검증은 1회 수행됨)
     return SearchResponse(
         query=request.query,
         results=[
-            SearchResultItem(
+            SearchResultItem.model_construct(
                 chunk_id=r.chunk_id,
                 file_path=r.file_path,
                 content=r.content,
@@ -344,27 +328,26 @@ async def build_context(
     request: ContextRequest,
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    context_builder: ContextBuilderService = Depends(get_context_builder_dep),
 ):
     """컨텍스트 빌드"""
-    # 워크스페이스 경로 조회
+    # 워크스페이스 경로 조회 (project_id 컬럼만 조회)
     result = await db.execute(
-        select(WorkspaceModel).where(
+        select(WorkspaceModel.project_id).where(
             WorkspaceModel.workspace_id == request.workspace_id,
         )
     )
-    workspace = result.scalar_one_or_none()
+    project_id = result.scalar_one_or_none()
     
     workspace_path = None
-    if workspace:
+    if project_id is not None:
         workspace_path = str(get_workspace_root(request.workspace_id))
     
-    context_builder = await get_context_builder()
-    
     context_result = await context_builder.build_context(
         query=request.query,
         workspace_id=request.workspace_id,
         tenant_id=current_user.org_id,
-        project_id=workspace.project_id if workspace else None,
+        project_id=project_id,
         workspace_path=workspace_path,
         max_results=request.max_results,
         include_file_tree=request.include_file_tree,
@@ -378,7 +361,7 @@ async def build_context(
     return ContextResponse(
         query=context_result.query,
         contexts=[
-            ContextItem(
+            ContextItem.model_construct(
                 file_path=ctx.file_path,
                 content=ctx.content,
                 start_line=ctx.start_line,
@@ -406,10 +389,9 @@ async def get_related_files(
     workspace_id: str,
     limit: int = 5,
     current_user: UserModel = Depends(get_current_user),
+    context_builder: ContextBuilderService = Depends(get_context_builder_dep),
 ):
     """관련 파일 조회"""
-    context_builder = await get_context_builder()
-    
     files = await context_builder.get_related_files(
         query=query,
         workspace_id=workspace_id,
@@ -429,15 +411,29 @@ async def get_related_files(
     "/stats",
     response_model=StatsResponse,
     summary="벡터 DB 통계",
-    description="벡터 데이터베이스의 통계 정보를 조회합니다.",
+    description="벡터 데이터베이스의 통계 정보를 조회합니다. If-None-Match가 일치하면 304를 반환합니다.",
+    responses={304: {"description": "Not Modified (If-None-Match 일치)"}},
 )
 async def get_stats(
+    http_request: Request,
+    response: Response,
     current_user: UserModel = Depends(get_current_user),
+    vector_store: VectorStoreService = Depends(get_vector_store_dep),
 ):
     """벡터 DB 통계"""
-    vector_store = await get_vector_store()
     stats = await vector_store.get_collection_stats()
     
+    # 통계가 그대로면 본문 직렬화/전송 생략
+    etag = compute_etag(
+        stats.get("vectors_count"),
+        stats.get("points_count"),
+        stats.get("status"),
+        sorted(stats.get("config", {}).items()),
+    )
+    if is_not_modified(http_request, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+    
     return StatsResponse(
         vectors_count=stats.get("vectors_count", 0),
         points_count=stats.get("points_count", 0),
@@ -7,20 +7,28 @@ Gateway 경유 RAG 라우터 (Financial VDE)
 """
 
 import logging
+from types import SimpleNamespace
 from typing import List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from ..db import WorkspaceModel
 from ..db.connection import get_db
+from ..services.workspace_service import workspace_scope_cache
 from ..services.internal_gateway_auth import GatewayRequestIdentity, require_gateway_internal
-from ..services.code_indexer import get_code_indexer
-from ..services.context_builder import get_context_builder
-from ..services.vector_store import get_vector_store
-from ..services.embedding_service import get_embedding_service
+from ..services.code_indexer import CodeIndexerService
+from ..services.context_builder import ContextBuilderService
+from ..services.vector_store import VectorStoreService
+from ..services.query_batcher import get_query_batcher
+from ..services.rag_dependencies import (
+    get_code_indexer_dep,
+    get_context_builder_dep,
+    get_vector_store_dep,
+    indexing_status_response,
+)
 from ..utils.filesystem import get_workspace_root
 
 logger = logging.getLogger(__name__)
@@ -110,72 +118,74 @@ class StatsResponse(BaseModel):
     config: dict
 
 
-async def _load_workspace_and_check_scope(db: AsyncSession, req_ws_id: str, ident: GatewayRequestIdentity) -> WorkspaceModel:
+# 모든 엔드포인트가 거치는 워크스페이스 조회 구문은 모듈 로드 시 한 번만 구성한다.
+_WS_BY_ID_STMT = select(WorkspaceModel).where(WorkspaceModel.workspace_id == bindparam("ws_id"))
+
+
+async def _load_workspace_and_check_scope(db: AsyncSession, req_ws_id: str, ident: GatewayRequestIdentity):
+    """
+    워크스페이스 스코프 확인
+
+    반환값은 workspace_id/org_id/project_id 속성만 가진 객체이다.
+    (org_id, project_id)는 workspace_scope_cache에 보관해 반복 요청 시 DB 조회를 생략한다.
+    """
     if req_ws_id != ident.workspace_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace scope mismatch")
 
-    result = await db.execute(select(WorkspaceModel).where(WorkspaceModel.workspace_id == req_ws_id))
-    ws = result.scalar_one_or_none()
-    if not ws:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-
-    # tenant/project 스코프도 강제
-    if getattr(ws, "org_id", None) and ws.org_id != ident.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant scope mismatch")
-    if getattr(ws, "project_id", None) and ws.project_id != ident.project_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Project scope mismatch")
-    return ws
+    scope = workspace_scope_cache.get(req_ws_id)
+    if scope is None:
+        result = await db.execute(_WS_BY_ID_STMT, {"ws_id": req_ws_id})
+        row = result.scalar_one_or_none()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+        scope = (getattr(row, "org_id", None), getattr(row, "project_id", None))
+        workspace_scope_cache.set(req_ws_id, scope)
+    org_id, project_id = scope
+
+    # tenant/project 스코프도 강제 (정상 경로는 단일 분기, 상세 메시지는 거부 시에만 결정)
+    tenant_mismatch = bool(org_id) and org_id != ident.tenant_id
+    if tenant_mismatch or (project_id and project_id != ident.project_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Tenant scope mismatch" if tenant_mismatch else "Project scope mismatch",
+        )
+    return SimpleNamespace(workspace_id=req_ws_id, org_id=org_id, project_id=project_id)
 
 
 @router.post("/index", response_model=IndexingStatusResponse, status_code=status.HTTP_202_ACCEPTED)
 async def index_workspace(
     request: IndexWorkspaceRequest,
-    background_tasks: BackgroundTasks,
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
     db: AsyncSession = Depends(get_db),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     ws = await _load_workspace_and_check_scope(db, request.workspace_id, ident)
     workspace_path = get_workspace_root(request.workspace_id)
 
-    async def run_indexing():
-        try:
-            indexer = await get_code_indexer()
-            await indexer.index_workspace_incremental(
-                workspace_id=request.workspace_id,
-                workspace_path=str(workspace_path),
-                db=db,
-                tenant_id=ident.tenant_id,
-                project_id=ws.project_id,
-                force_reindex=request.force_reindex,
-            )
-        except Exception as e:
-            logger.error(f"Gateway indexing failed: {e}")
-
-    background_tasks.add_task(run_indexing)
-    return IndexingStatusResponse(workspace_id=request.workspace_id, status="running")
+    started = indexer.start_incremental_indexing(
+        workspace_id=request.workspace_id,
+        workspace_path=str(workspace_path),
+        tenant_id=ident.tenant_id,
+        project_id=ws.project_id,
+        force_reindex=request.force_reindex,
+    )
+    if not started:
+        # 이미 실행 중인 작업이 있으면 그 진행 상태를 그대로 응답
+        return indexing_status_response(
+            IndexingStatusResponse, request.workspace_id, indexer.get_progress(request.workspace_id)
+        )
+    return IndexingStatusResponse(workspace_id=request.workspace_id, status="queued")
 
 
 @router.get("/index/{workspace_id}", response_model=IndexingStatusResponse)
 async def get_indexing_status(
     workspace_id: str,
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     if workspace_id != ident.workspace_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Workspace scope mismatch")
-    indexer = await get_code_indexer()
-    progress = indexer.get_progress(workspace_id)
-    if not progress:
-        return IndexingStatusResponse(workspace_id=workspace_id, status="completed", progress_percent=100.0)
-    return IndexingStatusResponse(
-        workspace_id=progress.workspace_id,
-        status=progress.status,
-        total_files=progress.total_files,
-        indexed_files=progress.indexed_files,
-        total_chunks=progress.total_chunks,
-        indexed_chunks=progress.indexed_chunks,
-        progress_percent=progress.progress_percent,
-        error=progress.error,
-    )
+    return indexing_status_response(IndexingStatusResponse, workspace_id, indexer.get_progress(workspace_id))
 
 
 @router.delete("/index/{workspace_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -183,9 +193,9 @@ async def delete_index(
     workspace_id: str,
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
     db: AsyncSession = Depends(get_db),
+    indexer: CodeIndexerService = Depends(get_code_indexer_dep),
 ):
     ws = await _load_workspace_and_check_scope(db, workspace_id, ident)
-    indexer = await get_code_indexer()
     ok = await indexer.delete_workspace_index(workspace_id=workspace_id, db_session=db)
     if not ok:
         raise HTTPException(status_code=500, detail="Failed to delete index")
@@ -199,11 +209,9 @@ async def search_code(
     db: AsyncSession = Depends(get_db),
 ):
     ws = await _load_workspace_and_check_scope(db, request.workspace_id, ident)
-    embedding_service = await get_embedding_service()
-    vector_store = await get_vector_store()
-    query_embedding = await embedding_service.embed_text(request.query)
-    results = await vector_store.search(
-        query_embedding=query_embedding,
+    # 동시 요청은 마이크로 배처가 임베딩 1회 + 벡터 검색 1회로 묶어 처리
+    results = await get_query_batcher().search(
+        query=request.query,
         workspace_id=request.workspace_id,
         tenant_id=ident.tenant_id,
         project_id=ws.project_id,
@@ -211,10 +219,12 @@ async def search_code(
         file_filter=request.file_filter,
         language_filter=request.language_filter,
     )
+    # 벡터 저장소 결과는 서버 내부에서 생성된 신뢰 데이터이므로 항목별 검증을 생략한다.
+    # (응답 직렬화 시 response_model 검증은 1회 수행됨)
     return SearchResponse(
         query=request.query,
         results=[
-            SearchResultItem(
+            SearchResultItem.model_construct(
                 chunk_id=r.chunk_id,
                 file_path=r.file_path,
                 content=r.content,
@@ -234,10 +244,10 @@ async def build_context(
     request: ContextRequest,
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
     db: AsyncSession = Depends(get_db),
+    context_builder: ContextBuilderService = Depends(get_context_builder_dep),
 ):
     ws = await _load_workspace_and_check_scope(db, request.workspace_id, ident)
     workspace_path = str(get_workspace_root(request.workspace_id))
-    context_builder = await get_context_builder()
     context_result = await context_builder.build_context(
         query=request.query,
         workspace_id=request.workspace_id,
@@ -255,7 +265,7 @@ async def build_context(
     return ContextResponse(
         query=context_result.query,
         contexts=[
-            ContextItem(
+            ContextItem.model_construct(
                 file_path=ctx.file_path,
                 content=ctx.content,
                 start_line=ctx.start_line,
@@ -279,9 +289,9 @@ async def get_related_files(
     limit: int = 5,
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
     db: AsyncSession = Depends(get_db),
+    context_builder: ContextBuilderService = Depends(get_context_builder_dep),
 ):
     ws = await _load_workspace_and_check_scope(db, workspace_id, ident)
-    context_builder = await get_context_builder()
     files = await context_builder.get_related_files(query=query, workspace_id=workspace_id, limit=limit)
     return [RelatedFile(file_path=f["file_path"], relevance_score=f["relevance_score"]) for f in files]
 
@@ -289,8 +299,8 @@ async def get_related_files(
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
     ident: GatewayRequestIdentity = Depends(require_gateway_internal),
+    vector_store: VectorStoreService = Depends(get_vector_store_dep),
 ):
-    vector_store = await get_vector_store()
     stats = await vector_store.get_collection_stats()
     return StatsResponse(
         vectors_count=stats.get("vectors_count", 0),
@@ -9,11 +9,20 @@ SSH 라우터
 """
 
 import os
+import queue
+import binascii
 import secrets
 import hashlib
+import asyncio
 import logging
-from typing import Optional
+import functools
+import threading
+from typing import Any, Dict, Optional, Tuple
 from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
 
 from ..models import (
     ErrorResponse,
@@ -26,21 +35,72 @@ from ..models import (
     GenerateSSHKeyResponse,
 )
 from ..services.workspace_manager import get_workspace_manager, WorkspaceManager
+from ..services.ssh_port_service import SSHPortExhaustedError, get_workspace_ssh_port
+from ..services.rbac_service import get_current_user, rbac_service
+from ..db.connection import get_db
+from ..db.models import UserModel, WorkspaceModel
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/workspaces/{ws_id}/ssh", tags=["ssh"])
 
-# SSH 포트 범위 (동적 할당)
-SSH_PORT_BASE = int(os.getenv("SSH_PORT_BASE", "22000"))
+# SSH 포트는 services.ssh_port_service에서 할당 (workspace_ssh_ports 테이블)
 SSH_HOST = os.getenv("SSH_HOST", "localhost")  # 외부 접속 호스트
 
+# 컨테이너 authorized_keys에 공개키 추가 (exec 1회)
+# 키는 셸 문자열에 끼워 넣지 않고 환경변수로 전달하며, 이미 등록된 키는 다시 추가하지 않는다.
+_AUTHORIZED_KEYS_PATH = "/home/developer/.ssh/authorized_keys"
+_APPEND_AUTHORIZED_KEY_CMD = (
+    f'(grep -qsxF "$SSH_PUBLIC_KEY" {_AUTHORIZED_KEYS_PATH} '
+    f'|| printf \'%s\\n\' "$SSH_PUBLIC_KEY" >> {_AUTHORIZED_KEYS_PATH}) '
+    f'&& chmod 600 {_AUTHORIZED_KEYS_PATH}'
+)
+
+
+# RSA-4096 키 생성은 소수 탐색으로 수백 ms~수 초가 걸리므로 백그라운드에서 미리 만들어 둔다 (0이면 비활성화)
+SSH_RSA_KEY_POOL_SIZE = int(os.getenv("SSH_RSA_KEY_POOL_SIZE", "2"))
+
+_rsa_key_pool: "queue.Queue[rsa.RSAPrivateKey]" = queue.Queue(maxsize=max(SSH_RSA_KEY_POOL_SIZE, 1))
+_rsa_refill_lock = threading.Lock()
+_rsa_refill_running = False
 
-def _get_ssh_port(workspace_id: str) -> int:
-    """워크스페이스 ID로 SSH 포트 계산 (해시 기반)"""
-    # 워크스페이스 ID를 해시하여 일관된 포트 번호 생성
-    hash_val = int(hashlib.md5(workspace_id.encode()).hexdigest()[:8], 16)
-    return SSH_PORT_BASE + (hash_val % 1000)  # 22000 ~ 22999 범위
+
+def _new_rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=4096)
+
+
+def _refill_rsa_key_pool() -> None:
+    global _rsa_refill_running
+    try:
+        while _rsa_key_pool.qsize() < SSH_RSA_KEY_POOL_SIZE:
+            _rsa_key_pool.put_nowait(_new_rsa_key())
+    except queue.Full:
+        pass
+    finally:
+        with _rsa_refill_lock:
+            _rsa_refill_running = False
+
+
+def prewarm_rsa_key_pool() -> None:
+    """RSA 키 풀 채우기 시작 (데몬 스레드 1개, 이미 실행 중이면 무시)"""
+    global _rsa_refill_running
+    if SSH_RSA_KEY_POOL_SIZE <= 0:
+        return
+    with _rsa_refill_lock:
+        if _rsa_refill_running:
+            return
+        _rsa_refill_running = True
+    threading.Thread(target=_refill_rsa_key_pool, name="ssh-rsa-prewarm", daemon=True).start()
+
+
+def _take_rsa_key() -> rsa.RSAPrivateKey:
+    """미리 생성한 RSA 키 꺼내기 (풀이 비었으면 즉시 생성) 후 풀 다시 채우기"""
+    try:
+        private_key = _rsa_key_pool.get_nowait()
+    except queue.Empty:
+        private_key = _new_rsa_key()
+    prewarm_rsa_key_pool()
+    return private_key
 
 
 def _generate_ssh_command(host: str, port: int, username: str = "developer") -> str:
@@ -54,25 +114,130 @@ def _generate_vscode_remote_uri(host: str, port: int, username: str = "developer
     return f"vscode://vscode-remote/ssh-remote+{username}@{host}:{port}{path}"
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_ssh_connection_strings(ssh_port: int) -> Tuple[str, str]:
+    """포트별 (SSH 명령어, VS Code URI) - SSH_HOST가 고정이므로 캐시"""
+    return (
+        _generate_ssh_command(SSH_HOST, ssh_port),
+        _generate_vscode_remote_uri(SSH_HOST, ssh_port),
+    )
+
+
+_WORKSPACE_OWNER_STMT = select(WorkspaceModel.owner_id).where(
+    WorkspaceModel.workspace_id == bindparam("workspace_id"),
+    WorkspaceModel.status != "deleted",
+)
+
+
+async def _ensure_workspace_owner(db: AsyncSession, workspace_id: str, user: UserModel) -> None:
+    """워크스페이스 존재/소유 확인 (없으면 404, 소유자/관리자가 아니면 403)"""
+    result = await db.execute(_WORKSPACE_OWNER_STMT, {"workspace_id": workspace_id})
+    owner_id = result.scalar_one_or_none()
+    if owner_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "Workspace not found", "code": "WORKSPACE_NOT_FOUND"},
+        )
+    if owner_id != user.user_id and not rbac_service.is_admin(user.role or "viewer"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"error": "Forbidden", "code": "WS_ACCESS_DENIED"},
+        )
+
+
+async def _resolve_ssh_port(db: AsyncSession, workspace_id: str, user: UserModel) -> int:
+    """
+    할당된 SSH 포트 조회 (포트 소진 시 503)
+
+    존재하지 않거나 남의 워크스페이스 ID로 포트 범위를 소진시키지 않도록 할당 전에 소유자를 확인한다.
+    """
+    await _ensure_workspace_owner(db, workspace_id, user)
+    try:
+        return await get_workspace_ssh_port(db, workspace_id)
+    except SSHPortExhaustedError as e:
+        logger.error(f"SSH port allocation failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": "No SSH port available", "code": "SSH_PORT_EXHAUSTED"},
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_cursor_command_payload(workspace_id: str, ssh_port: int) -> Dict[str, Any]:
+    """
+    Cursor Remote SSH 접속 설정 응답 (워크스페이스별 캐시)
+
+    캐시된 dict를 공유하므로 호출 측에서 수정하지 않는다.
+    """
+    ssh_command, vscode_uri = _get_ssh_connection_strings(ssh_port)
+    return {
+        "workspaceId": workspace_id,
+        "instructions": {
+            "step1": "Cursor에서 Ctrl+Shift+P (macOS: Cmd+Shift+P) 실행",
+            "step2": "'Remote-SSH: Connect to Host...' 선택",
+            "step3": f"'{ssh_command}' 입력",
+        },
+        "sshConfig": {
+            "description": "~/.ssh/config에 추가할 설정",
+            "content": f"""Host cursor-{workspace_id}
+    HostName {SSH_HOST}
+    Port {ssh_port}
+    User developer
+    IdentityFile ~/.ssh/id_ed25519
+    StrictHostKeyChecking no
+""",
+        },
+        "vscodeRemoteUri": vscode_uri,
+        "directCommand": ssh_command,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _fingerprint_key_blob(key_b64: str) -> str:
+    """base64 키 본문 → OpenSSH SHA256 fingerprint (재접속 시 같은 키는 캐시 재사용)"""
+    # base64 모듈 래퍼 대신 C 구현 binascii를 직접 사용
+    try:
+        key_data = binascii.a2b_base64(key_b64)
+    except (binascii.Error, ValueError):
+        return "unknown"
+    digest = hashlib.sha256(key_data).digest()
+    return "SHA256:" + binascii.b2a_base64(digest, newline=False).decode("ascii").rstrip("=")
+
+
 def _get_ssh_key_fingerprint(public_key: str) -> str:
     """SSH 공개키 fingerprint 계산"""
-    import base64
-    try:
-        # SSH 키의 두 번째 부분 (base64 인코딩된 부분)
-        parts = public_key.strip().split()
-        if len(parts) >= 2:
-            key_data = base64.b64decode(parts[1])
-            fingerprint = hashlib.sha256(key_data).digest()
-            return "SHA256:" + base64.b64encode(fingerprint).decode().rstrip("=")
-    except Exception:
-        pass
+    # SSH 키의 두 번째 부분 (base64 인코딩된 부분)
+    parts = public_key.split(maxsplit=2)
+    if len(parts) >= 2:
+        return _fingerprint_key_blob(parts[1])
     return "unknown"
 
 
+def _generate_keypair_sync(key_type: str, comment: str) -> Tuple[str, str]:
+    """SSH 키 쌍 생성 (동기, 스레드 풀에서 실행) → (OpenSSH 공개키, OpenSSH 개인키)"""
+    if key_type == "ed25519":
+        # Ed25519 키 생성
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        # RSA 키 (4096 bits, 사전 생성 풀에서 꺼냄)
+        private_key = _take_rsa_key()
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.OpenSSH,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_bytes = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.OpenSSH,
+        format=serialization.PublicFormat.OpenSSH,
+    )
+    return public_bytes.decode() + f" {comment}", private_pem.decode()
+
+
 @router.get(
     "/info",
     response_model=SSHConnectionResponse,
     responses={
+        403: {"model": ErrorResponse, "description": "Forbidden - No access to workspace"},
         404: {"model": ErrorResponse, "description": "Workspace not found"},
         503: {"model": ErrorResponse, "description": "SSH not available"},
     },
@@ -82,6 +247,8 @@ def _get_ssh_key_fingerprint(public_key: str) -> str:
 async def get_ssh_connection_info(
     ws_id: str,
     workspace_manager: WorkspaceManager = Depends(get_workspace_manager),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
 ):
     """
     SSH 연결 정보 조회
@@ -100,8 +267,9 @@ async def get_ssh_connection_info(
             detail={"error": "Workspace container not found", "code": "CONTAINER_NOT_FOUND"},
         )
     
-    # SSH 포트 계산
-    ssh_port = _get_ssh_port(ws_id)
+    # SSH 포트(할당 테이블, 프로세스 내 캐시) / 접속 문자열 (포트별 캐시)
+    ssh_port = await _resolve_ssh_port(db, ws_id, current_user)
+    ssh_command, vscode_uri = _get_ssh_connection_strings(ssh_port)
     
     # 컨테이너가 실행 중인지 확인
     is_running = container_status.status.value == "running"
@@ -113,9 +281,6 @@ async def get_ssh_connection_info(
         auth_type="key",  # 기본은 키 인증
     )
     
-    ssh_command = _generate_ssh_command(SSH_HOST, ssh_port)
-    vscode_uri = _generate_vscode_remote_uri(SSH_HOST, ssh_port)
-    
     return SSHConnectionResponse(
         workspaceId=ws_id,
         connection=connection,
@@ -160,7 +325,8 @@ async def setup_ssh_key(
         # 컨테이너 내에서 키 추가 명령 실행
         result = await workspace_manager.execute_command(
             workspace_id=ws_id,
-            command=f'echo "{public_key}" >> /home/developer/.ssh/authorized_keys && chmod 600 /home/developer/.ssh/authorized_keys',
+            command=_APPEND_AUTHORIZED_KEY_CMD,
+            env={"SSH_PUBLIC_KEY": public_key},
             timeout=10,
         )
         
@@ -222,9 +388,11 @@ async def setup_ssh_password(
     
     try:
         # 비밀번호 설정 (chpasswd 사용)
-        result = await workspace_manager.execute_command(
+        # 비밀번호는 명령 문자열이 아닌 stdin으로만 전달 (셸 없이 exec 1회)
+        result = await workspace_manager.execute_with_stdin(
             workspace_id=ws_id,
-            command=f'echo "developer:{request.password}" | sudo chpasswd',
+            argv=["sudo", "chpasswd"],
+            input_data=f"developer:{request.password}\n".encode(),
             timeout=10,
         )
         
@@ -272,45 +440,12 @@ async def generate_ssh_keypair(
     반드시 안전한 곳에 저장하세요.
     """
     try:
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
-        from cryptography.hazmat.backends import default_backend
-        
         comment = request.comment or f"cursor-workspace-{ws_id}"
         
-        if request.key_type == "ed25519":
-            # Ed25519 키 생성
-            private_key = ed25519.Ed25519PrivateKey.generate()
-            private_pem = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.OpenSSH,
-                encryption_algorithm=serialization.NoEncryption(),
-            )
-            public_key = private_key.public_key()
-            public_bytes = public_key.public_bytes(
-                encoding=serialization.Encoding.OpenSSH,
-                format=serialization.PublicFormat.OpenSSH,
-            )
-        else:
-            # RSA 키 생성 (4096 bits)
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=4096,
-                backend=default_backend(),
-            )
-            private_pem = private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.OpenSSH,
-                encryption_algorithm=serialization.NoEncryption(),
-            )
-            public_key = private_key.public_key()
-            public_bytes = public_key.public_bytes(
-                encoding=serialization.Encoding.OpenSSH,
-                format=serialization.PublicFormat.OpenSSH,
-            )
-        
-        public_key_str = public_bytes.decode() + f" {comment}"
-        private_key_str = private_pem.decode()
+        # 키 생성(특히 RSA-4096)은 수백 ms~수 초의 CPU 작업이므로 이벤트 루프 밖에서 실행
+        public_key_str, private_key_str = await asyncio.to_thread(
+            _generate_keypair_sync, request.key_type, comment
+        )
         fingerprint = _get_ssh_key_fingerprint(public_key_str)
         
         logger.info(f"SSH keypair generated for workspace {ws_id}: {fingerprint}")
@@ -323,11 +458,6 @@ async def generate_ssh_keypair(
             fingerprint=fingerprint,
         )
         
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail={"error": "Cryptography library not available", "code": "CRYPTO_NOT_AVAILABLE"},
-        )
     except Exception as e:
         logger.error(f"Failed to generate SSH keypair: {e}")
         raise HTTPException(
@@ -338,13 +468,20 @@ async def generate_ssh_keypair(
 
 @router.get(
     "/cursor-command",
+    responses={
+        403: {"model": ErrorResponse, "description": "Forbidden - No access to workspace"},
+        404: {"model": ErrorResponse, "description": "Workspace not found"},
+        503: {"model": ErrorResponse, "description": "SSH not available"},
+    },
     summary="Cursor Remote SSH 접속 명령어",
     description="Cursor IDE에서 Remote SSH 접속을 위한 설정 정보를 반환합니다.",
 )
 async def get_cursor_ssh_command(
     ws_id: str,
     workspace_manager: WorkspaceManager = Depends(get_workspace_manager),
-):
+    db: AsyncSession = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+) -> Dict[str, Any]:
     """
     Cursor IDE Remote SSH 접속 설정
     
@@ -353,25 +490,5 @@ async def get_cursor_ssh_command(
     2. 반환된 SSH 명령어 입력
     3. 또는 VS Code 설정에 호스트 추가
     """
-    ssh_port = _get_ssh_port(ws_id)
-    
-    return {
-        "workspaceId": ws_id,
-        "instructions": {
-            "step1": "Cursor에서 Ctrl+Shift+P (macOS: Cmd+Shift+P) 실행",
-            "step2": "'Remote-SSH: Connect to Host...' 선택",
-            "step3": f"'{_generate_ssh_command(SSH_HOST, ssh_port)}' 입력",
-        },
-        "sshConfig": {
-            "description": "~/.ssh/config에 추가할 설정",
-            "content": f"""Host cursor-{ws_id}
-    HostName {SSH_HOST}
-    Port {ssh_port}
-    User developer
-    IdentityFile ~/.ssh/id_ed25519
-    StrictHostKeyChecking no
-""",
-        },
-        "vscodeRemoteUri": _generate_vscode_remote_uri(SSH_HOST, ssh_port),
-        "directCommand": _generate_ssh_command(SSH_HOST, ssh_port),
-    }
+    ssh_port = await _resolve_ssh_port(db, ws_id, current_user)
+    return _build_cursor_command_payload(ws_id, ssh_port)
@@ -2,24 +2,29 @@
 Workspaces 라우터
 - POST /api/workspaces
 - GET /api/workspaces
-- POST /api/workspaces/clone (GitHub 클론)
+- POST /api/workspaces/clone (GitHub 클론, 백그라운드)
+- GET /api/workspaces/clone/status/{workspace_id} (클론 진행 상태)
 
 워크스페이스 생성 시 VSCode Server 컨테이너도 자동 생성됩니다.
 """
 
 import os
-import subprocess
 import re
+import asyncio
 import secrets
 import logging
+from itertools import islice
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status, Depends, Query, BackgroundTasks
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from ..models import (
     CreateWorkspaceRequest,
     CloneGitHubRequest,
+    CloneStatusResponse,
+    CloneWorkspaceResponse,
     WorkspaceResponse,
     ErrorResponse,
 )
@@ -33,14 +38,49 @@ from ..utils.filesystem import (
     workspace_exists,
 )
 from ..db.connection import get_db
-from ..services.workspace_service import WorkspaceService
-from ..services.workspace_manager import WorkspaceManager
-from ..services.rbac_service import require_permission, Permission
+from ..services.workspace_service import WorkspaceService, get_workspace_service
+from ..services.workspace_manager import WorkspaceManager, get_workspace_manager
+from ..services.rbac_service import require_permission, Permission, rbac_service
 from ..services.ide_service import get_ide_service
+from ..services.git_clone_service import get_git_clone_service
 
 router = APIRouter(prefix="/api/workspaces", tags=["workspaces"])
 logger = logging.getLogger(__name__)
 
+# 저장소 URL에서 이름 추출 (https://github.com/owner/repo(.git), git@github.com:owner/repo.git)
+_REPO_NAME_RE = re.compile(r"/([^/]+?)(?:\.git)?$")
+# 클론 워크스페이스 이름 허용 문자
+_WORKSPACE_NAME_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+# DB 도입 이전 워크스페이스 디렉토리 (하위 호환용 목록 조회)
+_LEGACY_WORKSPACES_DIR = Path("/workspaces")
+
+
+def _scan_legacy_workspaces(offset: int, limit: int) -> List[WorkspaceResponse]:
+    """
+    파일시스템의 ws_* 디렉토리를 워크스페이스 목록으로 반환
+
+    os.scandir의 DirEntry는 디렉토리 여부를 dirent에서 바로 읽으므로 항목별 stat 호출이 없고,
+    필요한 페이지(offset~offset+limit)까지만 순회한다.
+    """
+    try:
+        with os.scandir(_LEGACY_WORKSPACES_DIR) as it:
+            entries = (
+                entry for entry in it
+                if entry.name.startswith("ws_") and entry.is_dir(follow_symlinks=False)
+            )
+            return [
+                WorkspaceResponse(
+                    workspaceId=entry.name,
+                    projectId=None,
+                    name=entry.name.replace("ws_", ""),
+                    rootPath=entry.path,
+                )
+                for entry in islice(entries, offset, offset + limit)
+            ]
+    except FileNotFoundError:
+        return []
+
 
 @router.post(
     "",
@@ -64,8 +104,8 @@ async def create_workspace(
     새 워크스페이스를 생성합니다.
     
     워크스페이스 생성 시 다음이 수행됩니다:
-    1. 워크스페이스 디렉토리 생성
-    2. DB에 메타데이터 저장
+    1. DB에 메타데이터 저장 (workspace_id 중복 시 409)
+    2. 워크스페이스 디렉토리 생성
     3. VSCode Server 컨테이너 자동 프로비저닝 (백그라운드)
     
     인증 필수: JWT 토큰, 권한: workspace:create
@@ -75,33 +115,6 @@ async def create_workspace(
     workspace_id = f"ws_{request.name}_{suffix}"
     workspace_root = get_workspace_root(workspace_id)
     
-    # 워크스페이스 존재 여부 확인 (디렉토리)
-    if workspace_exists(workspace_root):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={"error": "Workspace already exists", "code": "WS_ALREADY_EXISTS"},
-        )
-    
-    # DB에서도 중복 확인
-    existing = await db.execute(
-        select(WorkspaceModel).where(WorkspaceModel.workspace_id == workspace_id)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={"error": "Workspace already exists in database", "code": "WS_ALREADY_EXISTS"},
-        )
-    
-    # 워크스페이스 디렉토리 생성
-    try:
-        create_workspace_directory(workspace_id, workspace_root)
-    except OSError as e:
-        logger.error(f"Failed to create workspace directory: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to create workspace", "code": "WS_CREATE_FAILED"},
-        )
-    
     # project 선택 또는 자동 생성
     project_id: Optional[str] = None
     if request.project_id:
@@ -132,24 +145,50 @@ async def create_workspace(
         await db.flush()
 
     # DB에 메타데이터 저장
+    # - workspace_id UNIQUE 제약으로 중복을 판정 (사전 SELECT/stat 없이 경합에도 안전)
+    # - 파일시스템은 DB 저장이 성공한 뒤에만 변경
+    workspace_model = WorkspaceModel(
+        workspace_id=workspace_id,
+        project_id=project_id,
+        name=request.name,
+        owner_id=current_user.user_id,
+        org_id=current_user.org_id,
+        root_path=str(workspace_root),
+        status="provisioning",  # 초기 상태: 프로비저닝 중
+    )
+    db.add(workspace_model)
     try:
-        workspace_model = WorkspaceModel(
-            workspace_id=workspace_id,
-            project_id=project_id,
-            name=request.name,
-            owner_id=current_user.user_id,
-            org_id=current_user.org_id,
-            root_path=str(workspace_root),
-            status="provisioning",  # 초기 상태: 프로비저닝 중
-        )
-        db.add(workspace_model)
         await db.commit()
-        await db.refresh(workspace_model)
-        logger.info(f"Workspace created: {workspace_id} by {current_user.user_id}")
-    except Exception as e:
-        logger.error(f"Failed to save workspace to DB: {e}")
-        # DB 저장 실패해도 디렉토리는 생성됨 - 로그만 남기고 계속 진행
+    except IntegrityError:
         await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"error": "Workspace already exists", "code": "WS_ALREADY_EXISTS"},
+        )
+    # 응답 값은 모두 insert 전에 알고 있으므로 refresh(SELECT) 하지 않음
+    logger.info(f"Workspace created: {workspace_id} by {current_user.user_id}")
+    
+    # 워크스페이스 디렉토리 생성
+    try:
+        create_workspace_directory(workspace_id, workspace_root)
+    except OSError as e:
+        # 디렉토리 없는 워크스페이스가 남지 않도록 방금 저장한 메타데이터 정리
+        await db.delete(workspace_model)
+        if not request.project_id:
+            await db.delete(project)
+        await db.commit()
+        if isinstance(e, FileExistsError):
+            # DB에 없는 디렉토리가 남아 있음 (이전 삭제/실패의 잔여물) - 내용을 덮어쓰지 않고 충돌로 응답
+            logger.warning(f"Orphan workspace directory exists: {workspace_root}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"error": "Workspace already exists", "code": "WS_ALREADY_EXISTS"},
+            )
+        logger.error(f"Failed to create workspace directory: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "Failed to create workspace", "code": "WS_CREATE_FAILED"},
+        )
     
     # VSCode Server 컨테이너 자동 생성 (백그라운드)
     background_tasks.add_task(
@@ -229,6 +268,10 @@ async def list_workspaces(
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=100, description="페이지당 항목 수"),
     status_filter: Optional[str] = Query(default=None, description="상태 필터 (running, stopped)"),
+    include_orphans: bool = Query(
+        default=False,
+        description="DB에 워크스페이스가 없을 때 /workspaces 디렉토리도 조회 (DB 도입 이전 워크스페이스 하위 호환)",
+    ),
 ):
     """
     사용자가 접근 가능한 워크스페이스 목록을 반환합니다.
@@ -239,15 +282,17 @@ async def list_workspaces(
     인증 필수: JWT 토큰, 권한: workspace:read
     페이지네이션 지원: page, limit 파라미터
     """
-    from ..services.rbac_service import rbac_service
-    
-    workspaces: List[WorkspaceResponse] = []
     offset = (page - 1) * limit
     
-    # 기본 쿼리
-    query = select(WorkspaceModel)
+    # 기본 쿼리 (응답에 필요한 컬럼만 조회 - ORM 객체 생성 생략)
+    query = select(
+        WorkspaceModel.workspace_id,
+        WorkspaceModel.project_id,
+        WorkspaceModel.name,
+        WorkspaceModel.root_path,
+    )
     
-    # 관리자가 아니면 자신의 워크스페이스만
+    # 관리자가 아니면 자신의 워크스페이스만 (idx_workspace_owner_created 인덱스 사용)
     if not rbac_service.is_admin(current_user.role or "viewer"):
         query = query.where(WorkspaceModel.owner_id == current_user.user_id)
     
@@ -260,50 +305,40 @@ async def list_workspaces(
     
     # DB에서 조회
     result = await db.execute(query)
-    db_workspaces = result.scalars().all()
-    
-    for ws in db_workspaces:
-        workspaces.append(
-            WorkspaceResponse(
-                workspaceId=ws.workspace_id,
-                projectId=ws.project_id,
-                name=ws.name,
-                rootPath=ws.root_path,
-            )
+    workspaces: List[WorkspaceResponse] = [
+        WorkspaceResponse(
+            workspaceId=row.workspace_id,
+            projectId=row.project_id,
+            name=row.name,
+            rootPath=row.root_path,
         )
+        for row in result.all()
+    ]
     
-    # DB에 없는 경우 파일시스템에서 조회 (하위 호환성)
-    if not workspaces:
-        workspaces_dir = Path("/workspaces")
-        if workspaces_dir.exists():
-            for entry in list(workspaces_dir.iterdir())[offset:offset+limit]:
-                if entry.is_dir() and entry.name.startswith("ws_"):
-                    workspace_id = entry.name
-                    workspace_name = workspace_id.replace("ws_", "")
-                    workspaces.append(
-                        WorkspaceResponse(
-                            workspaceId=workspace_id,
-                            projectId=None,
-                            name=workspace_name,
-                            rootPath=str(entry),
-                        )
-                    )
+    # DB에 없는 경우 파일시스템에서 조회 (하위 호환성, 요청 시에만)
+    # - 디렉토리 순회는 블로킹 syscall이므로 워커 스레드에서 실행
+    if not workspaces and include_orphans:
+        workspaces = await asyncio.to_thread(_scan_legacy_workspaces, offset, limit)
     
     return workspaces
 
 
 @router.post(
     "/clone",
-    response_model=WorkspaceResponse,
-    status_code=status.HTTP_201_CREATED,
+    response_model=CloneWorkspaceResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
+        404: {"model": ErrorResponse, "description": "Project not found"},
         409: {"model": ErrorResponse, "description": "Workspace already exists"},
-        500: {"model": ErrorResponse, "description": "Failed to clone repository"},
+        500: {"model": ErrorResponse, "description": "Failed to create workspace directory"},
     },
     summary="GitHub 저장소 클론",
-    description="GitHub 저장소를 클론하여 새 워크스페이스를 생성합니다.",
+    description=(
+        "GitHub 저장소 클론 작업을 시작하고 즉시 응답합니다. "
+        "진행 상태는 GET /api/workspaces/clone/status/{workspace_id}로 조회합니다."
+    ),
 )
 async def clone_github_repository(
     request: CloneGitHubRequest,
@@ -314,6 +349,8 @@ async def clone_github_repository(
     GitHub 저장소를 클론하여 새 워크스페이스를 생성합니다.
     
     저장소 URL에서 자동으로 이름을 추출하거나, name을 지정할 수 있습니다.
+    클론은 백그라운드에서 진행되며, 완료되면 워크스페이스 메타데이터가 DB에 저장됩니다.
+    같은 저장소/브랜치 클론이 이미 진행 중이면 기존 작업을 반환합니다.
     
     인증 필수: JWT 토큰, 권한: workspace:create
     """
@@ -324,7 +361,7 @@ async def clone_github_repository(
         # URL에서 저장소 이름 추출
         # https://github.com/owner/repo -> repo
         # git@github.com:owner/repo.git -> repo
-        match = re.search(r"/([^/]+?)(?:\.git)?$", request.repository_url)
+        match = _REPO_NAME_RE.search(request.repository_url)
         if not match:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -332,131 +369,189 @@ async def clone_github_repository(
             )
         workspace_name = match.group(1)
     
+    # 워크스페이스 ID/경로에 들어가므로 이름 문자 제한
+    if not _WORKSPACE_NAME_RE.match(workspace_name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Invalid workspace name", "code": "INVALID_WORKSPACE_NAME"},
+        )
+    
+    # 기존 프로젝트 확인 (클론 시작 전에 검증)
+    existing_project_id: Optional[str] = None
+    if request.project_id:
+        existing_project = await db.execute(
+            select(ProjectModel.project_id).where(
+                ProjectModel.project_id == request.project_id,
+                ProjectModel.owner_id == current_user.user_id,
+            )
+        )
+        existing_project_id = existing_project.scalar_one_or_none()
+        if not existing_project_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"},
+            )
+    
+    clone_service = get_git_clone_service()
+    
+    # 같은 저장소/브랜치/히스토리 옵션의 클론이 진행 중이면 기존 작업 반환
+    active_job = clone_service.find_active_job(
+        current_user.user_id, request.repository_url, request.branch, full_history=request.full_history
+    )
+    if active_job is not None:
+        return CloneWorkspaceResponse(
+            workspaceId=active_job.workspace_id,
+            projectId=None,
+            name=workspace_name,
+            rootPath=str(get_workspace_root(active_job.workspace_id)),
+            status=active_job.status,
+        )
+    
     suffix = secrets.token_urlsafe(4).replace("-", "").replace("_", "")
     workspace_id = f"ws_{workspace_name}_{suffix}"
     workspace_root = get_workspace_root(workspace_id)
+    project_id = existing_project_id or f"prj_{workspace_name}_{suffix}"
     
-    # 워크스페이스 존재 여부 확인
-    if workspace_exists(workspace_root):
+    # 워크스페이스 디렉토리 생성 (exist_ok=False로 존재 확인과 생성을 한 번에 처리)
+    # DB 메타데이터는 클론 완료 후 저장되며 workspace_id UNIQUE 제약으로 중복이 걸러진다.
+    try:
+        workspace_root.mkdir(parents=True, exist_ok=False)
+    except FileExistsError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={"error": "Workspace already exists", "code": "WS_ALREADY_EXISTS"},
         )
-    
-    # 워크스페이스 디렉토리 생성
-    try:
-        workspace_root.mkdir(parents=True, exist_ok=False)
     except OSError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "Failed to create workspace directory", "code": "WS_CREATE_FAILED"},
         )
     
-    # Git 클론 실행
-    try:
-        clone_cmd = ["git", "clone"]
-        if request.branch:
-            clone_cmd.extend(["-b", request.branch])
-        clone_cmd.append(request.repository_url)
-        clone_cmd.append(str(workspace_root))
-        
-        result = subprocess.run(
-            clone_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5분 타임아웃
-        )
-        
-        if result.returncode != 0:
-            # 실패 시 디렉토리 정리
-            if workspace_root.exists():
-                import shutil
-                shutil.rmtree(workspace_root)
-            
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "Failed to clone repository",
-                    "code": "GIT_CLONE_FAILED",
-                    "detail": result.stderr[:500] if result.stderr else "Unknown error",
-                },
-            )
-    except subprocess.TimeoutExpired:
-        # 타임아웃 시 디렉토리 정리
-        if workspace_root.exists():
-            import shutil
-            shutil.rmtree(workspace_root)
-        
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail={"error": "Clone operation timed out", "code": "GIT_CLONE_TIMEOUT"},
-        )
-    except Exception as e:
-        # 기타 오류 시 디렉토리 정리
-        if workspace_root.exists():
-            import shutil
-            shutil.rmtree(workspace_root)
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to clone repository", "code": "GIT_CLONE_FAILED", "detail": str(e)},
-        )
-    
-    # DB에 메타데이터 저장
-    try:
-        # project 선택 또는 자동 생성 (create_workspace와 동일 정책)
-        project_id: Optional[str] = None
-        if request.project_id:
-            existing_project = await db.execute(
-                select(ProjectModel).where(
-                    ProjectModel.project_id == request.project_id,
-                    ProjectModel.owner_id == current_user.user_id,
-                )
-            )
-            p = existing_project.scalar_one_or_none()
-            if not p:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={"error": "Project not found", "code": "PROJECT_NOT_FOUND"},
-                )
-            project_id = p.project_id
-        else:
-            project_name = request.project_name or workspace_name
-            project_id = f"prj_{workspace_name}_{suffix}"
-            project = ProjectModel(
-                project_id=project_id,
-                name=project_name,
-                owner_id=current_user.user_id,
-                org_id=current_user.org_id,
-            )
-            db.add(project)
-            await db.flush()
-
-        workspace_model = WorkspaceModel(
+    async def _save_metadata() -> None:
+        await _save_cloned_workspace(
             workspace_id=workspace_id,
+            workspace_name=workspace_name,
+            workspace_root=workspace_root,
             project_id=project_id,
-            name=workspace_name,
+            create_project_name=None if existing_project_id else (request.project_name or workspace_name),
             owner_id=current_user.user_id,
             org_id=current_user.org_id,
-            root_path=str(workspace_root),
-            status="stopped",
         )
-        db.add(workspace_model)
-        await db.commit()
-        await db.refresh(workspace_model)
         logger.info(f"Workspace cloned: {workspace_id} from {request.repository_url} by {current_user.user_id}")
-    except Exception as e:
-        logger.error(f"Failed to save workspace to DB: {e}")
-        await db.rollback()
     
-    return WorkspaceResponse(
+    job = clone_service.start_clone(
+        workspace_id=workspace_id,
+        owner_id=current_user.user_id,
+        repository_url=request.repository_url,
+        branch=request.branch,
+        workspace_root=workspace_root,
+        on_success=_save_metadata,
+        full_history=request.full_history,
+    )
+    
+    return CloneWorkspaceResponse(
         workspaceId=workspace_id,
         projectId=project_id,
         name=workspace_name,
         rootPath=str(workspace_root),
+        status=job.status,
     )
 
 
+async def _save_cloned_workspace(
+    workspace_id: str,
+    workspace_name: str,
+    workspace_root: Path,
+    project_id: str,
+    create_project_name: Optional[str],
+    owner_id: str,
+    org_id: Optional[str],
+) -> None:
+    """
+    클론 완료 후 워크스페이스 메타데이터 저장
+
+    요청 수명과 분리된 작업에서 호출되므로 요청 DB 세션 대신 전용 세션을 사용한다.
+    create_project_name이 있으면 프로젝트도 함께 생성한다 (create_workspace와 동일 정책).
+    """
+    from ..db.connection import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        if create_project_name is not None:
+            db.add(ProjectModel(
+                project_id=project_id,
+                name=create_project_name,
+                owner_id=owner_id,
+                org_id=org_id,
+            ))
+            await db.flush()
+        db.add(WorkspaceModel(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            name=workspace_name,
+            owner_id=owner_id,
+            org_id=org_id,
+            root_path=str(workspace_root),
+            status="stopped",
+        ))
+        await db.commit()
+
+
+@router.get(
+    "/clone/status/{workspace_id}",
+    response_model=CloneStatusResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        404: {"model": ErrorResponse, "description": "Clone job not found"},
+    },
+    summary="GitHub 클론 진행 상태",
+    description="POST /api/workspaces/clone으로 시작한 클론 작업의 상태를 반환합니다.",
+)
+async def get_clone_status(
+    workspace_id: str,
+    current_user: UserModel = Depends(require_permission(Permission.WORKSPACE_READ)),
+):
+    """
+    클론 작업 상태를 반환합니다. (pending, cloning, ready, failed)
+    
+    인증 필수: JWT 토큰, 권한: workspace:read
+    """
+    job = get_git_clone_service().get_job(workspace_id)
+    # 다른 사용자의 작업은 존재 여부도 노출하지 않음 (관리자 제외)
+    if job is None or (
+        job.owner_id != current_user.user_id
+        and not rbac_service.is_admin(current_user.role or "viewer")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "Clone job not found", "code": "CLONE_JOB_NOT_FOUND"},
+        )
+    
+    return CloneStatusResponse(
+        workspaceId=job.workspace_id,
+        status=job.status,
+        error=job.error,
+        progress=job.progress,
+        startedAt=job.started_at,
+        completedAt=job.completed_at,
+    )
+
+
+async def _remove_workspace_container(manager: WorkspaceManager, workspace_id: str) -> None:
+    """워크스페이스 컨테이너 제거 (없거나 이미 삭제된 경우 무시)"""
+    try:
+        success, message = await manager.remove_container(
+            workspace_id,
+            force=True,
+            remove_volumes=True
+        )
+        if success:
+            logger.info(f"Container removed for workspace {workspace_id}: {message}")
+        else:
+            logger.warning(f"Failed to remove container for workspace {workspace_id}: {message}")
+    except Exception as e:
+        logger.info(f"No container to remove for workspace {workspace_id}: {e}")
+
+
 @router.delete(
     "/{workspace_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -471,16 +566,18 @@ async def clone_github_repository(
 )
 async def delete_workspace(
     workspace_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    manager: WorkspaceManager = Depends(get_workspace_manager),
+    service: WorkspaceService = Depends(get_workspace_service),
 ):
     """
     워크스페이스를 완전히 삭제합니다.
 
     다음을 수행합니다:
     1. 워크스페이스 존재 확인
-    2. 실행 중인 컨테이너 정리 (있는 경우)
+    2. 실행 중인 컨테이너 정리 (있는 경우) + 데이터베이스 메타데이터 삭제 (동시 실행)
     3. 파일시스템에서 워크스페이스 디렉토리 삭제
-    4. 데이터베이스에서 메타데이터 삭제
+    4. 디렉토리 삭제 성공 시 메타데이터 삭제 커밋 (실패 시 롤백)
 
     WARNING: 이 작업은 되돌릴 수 없습니다.
     """
@@ -500,27 +597,26 @@ async def delete_workspace(
     # if not has_permission(current_user, workspace_id):
     #     raise HTTPException(status_code=403, detail="Forbidden")
 
-    # 1. 실행 중인 컨테이너 정리
-    manager = WorkspaceManager.get_instance()
-    try:
-        success, message = await manager.remove_container(
-            workspace_id,
-            force=True,
-            remove_volumes=True
-        )
-        if success:
-            logger.info(f"Container removed for workspace {workspace_id}: {message}")
-        else:
-            logger.warning(f"Failed to remove container for workspace {workspace_id}: {message}")
-    except Exception as e:
-        # 컨테이너가 없거나 이미 삭제된 경우 무시
-        logger.info(f"No container to remove for workspace {workspace_id}: {e}")
+    # 1. 컨테이너 정리 + DB 메타데이터 삭제(flush)를 동시에 실행 (서로 의존성 없음)
+    #    - 메타데이터 삭제는 디렉토리 삭제가 성공한 뒤에만 커밋
+    #    - 디렉토리 삭제는 컨테이너 제거 후 실행 (실행 중인 컨테이너가 바인드 마운트에 파일을 다시 쓸 수 있음)
+    _, deleted = await asyncio.gather(
+        _remove_workspace_container(manager, workspace_id),
+        service.hard_delete_workspace(workspace_id),
+        return_exceptions=True,
+    )
+    if isinstance(deleted, Exception):
+        logger.error(f"Failed to delete workspace metadata: {deleted}")
+        await db.rollback()
+        # DB 삭제 실패는 치명적이지 않으므로 경고만 로깅하고 계속 진행
+        deleted = None
 
-    # 2. 워크스페이스 디렉토리 삭제
+    # 2. 워크스페이스 디렉토리 삭제 (대형 트리 삭제가 이벤트 루프를 막지 않도록 스레드에서 실행)
     try:
-        delete_workspace_directory(workspace_root)
+        await asyncio.to_thread(delete_workspace_directory, workspace_root)
         logger.info(f"Workspace directory deleted: {workspace_id}")
     except ValueError as e:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -530,6 +626,7 @@ async def delete_workspace(
             },
         )
     except OSError as e:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -539,22 +636,18 @@ async def delete_workspace(
             },
         )
 
-    # 3. 데이터베이스에서 메타데이터 삭제
-    try:
-        service = WorkspaceService(db)
-        deleted = await service.hard_delete_workspace(workspace_id)
-        if deleted:
-            logger.info(f"Workspace metadata deleted from database: {workspace_id}")
-        else:
-            logger.warning(f"Workspace metadata not found in database: {workspace_id}")
-
-        # 커밋
-        await db.commit()
-    except Exception as e:
-        logger.error(f"Failed to delete workspace metadata: {e}")
-        await db.rollback()
-        # DB 삭제 실패는 치명적이지 않으므로 경고만 로깅
-        # 파일은 이미 삭제되었으므로 계속 진행
+    # 3. 메타데이터 삭제 커밋
+    if deleted is not None:
+        try:
+            await db.commit()
+            if deleted:
+                logger.info(f"Workspace metadata deleted from database: {workspace_id}")
+            else:
+                logger.warning(f"Workspace metadata not found in database: {workspace_id}")
+        except Exception as e:
+            logger.error(f"Failed to delete workspace metadata: {e}")
+            await db.rollback()
+            # 파일은 이미 삭제되었으므로 계속 진행
 
     # 204 No Content 응답
     return None
@@ -9,26 +9,95 @@ WebSocket 라우터
 
 import logging
 import os
+import re
 import asyncio
+import socket
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
-from typing import Dict, Set, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 import json
-from ..models import WSMessageType, WSMessage
+from ..models import WSMessageType
 from ..services.auth_service import jwt_auth_service
+from ..utils.json import dumps_str as _dumps, loads as _loads
 
 logger = logging.getLogger(__name__)
 
 # Redis 설정
 REDIS_URL = os.getenv("REDIS_URL")  # 예: redis://localhost:6379
 
+# 워크스페이스별 Redis 채널 접두사
+_CHANNEL_PREFIX = "ws:workspace:"
+
+# 메시지 타입 문자열 (수신 루프에서 Enum .value 조회 반복 방지)
+_T_FILE = WSMessageType.FILE_CHANGE.value
+_T_CURSOR = WSMessageType.CURSOR_MOVE.value
+_T_CURSOR_BATCH = WSMessageType.CURSOR_MOVE_BATCH.value
+_T_ERR = WSMessageType.ERROR.value
+
+
+def _error_text(error: str, code: str) -> str:
+    return _dumps({"type": _T_ERR, "payload": {"error": error, "code": code}})
+
+
+def _cursor_batch_text(cursors: List[dict]) -> str:
+    return _dumps({"type": _T_CURSOR_BATCH, "payload": {"cursors": cursors}})
+
+
+# file_change 경로 검증: 절대 경로 또는 ".." 경로 구성요소 (단일 패스 검사)
+_BAD_PATH_RE = re.compile(r"^[/\\]|(?:^|[/\\])\.\.(?:[/\\]|$)")
+_MAX_FILE_PATH_LEN = 4096
+
+# 수신 프레임 최대 크기 (파싱 전에 거부)
+# 프로토콜 수준 상한은 uvicorn --ws-max-size로 별도 설정 (Dockerfile 참고)
+WS_MAX_FRAME_BYTES = int(os.getenv("WS_MAX_FRAME_BYTES", str(1024 * 1024)))
+
+# 고정 에러 응답 (미리 직렬화 - 잘못된 메시지가 쏟아져도 에러 경로에서 할당/인코딩 없음)
+_ERR_BAD_PATH = _error_text("Invalid file path", "WS_INVALID_PATH")
+_ERR_UNKNOWN = _error_text("Unknown message type", "WS_UNKNOWN_TYPE")
+_ERR_BAD_JSON = _error_text("Invalid JSON", "WS_INVALID_JSON")
+_ERR_TOO_BIG = _error_text("Message too large", "WS_MESSAGE_TOO_LARGE")
+
+# Redis publish 파이프라인 1회에 묶을 최대 메시지 수
+_PUBLISH_BATCH_MAX = 64
+
+# 발행 태스크 종료 신호 (shutdown 시 대기열 끝에 넣어 앞선 메시지를 모두 발행한 뒤 종료)
+_PUBLISH_STOP = None
+
+# Redis 발행 대기열 최대 크기 (가득 차면 커서 이동은 버리고 파일 변경은 대기)
+WS_PUBLISH_QUEUE_MAX = int(os.getenv("WS_PUBLISH_QUEUE_MAX", "1024"))
+
+# JWT 서명 검증을 스레드에서 실행할지 여부
+# 현재 액세스 토큰은 HS256(수 µs)이라 기본 비활성. RS256/ES256 등 비대칭 서명으로 바꾸면 켠다.
+WS_JWT_OFFLOAD = os.getenv("WS_JWT_OFFLOAD", "false").lower() == "true"
+
+# 커서 이동 묶음 전송 간격 (ms, 0 이하이면 즉시 개별 cursor_move 전송 - 기본)
+# 양수로 설정하면 cursor_move_batch 프레임으로 묶어 전송하므로 클라이언트가 해당 프레임을 지원해야 한다.
+CURSOR_FLUSH_MS = int(os.getenv("WS_CURSOR_FLUSH_MS", "0"))
+
+# Redis 연결 풀 크기 (발행 파이프라인 + 구독 연결)
+WS_REDIS_MAX_CONNECTIONS = int(os.getenv("WS_REDIS_MAX_CONNECTIONS", "32"))
+
+
+def _keepalive_options() -> Dict[int, int]:
+    """TCP keepalive 옵션 (플랫폼에 있는 상수만 사용)"""
+    names = {"TCP_KEEPIDLE": 60, "TCP_KEEPINTVL": 30, "TCP_KEEPCNT": 3}
+    return {getattr(socket, n): v for n, v in names.items() if hasattr(socket, n)}
+
+
 # Redis 클라이언트 (선택적)
 redis_client = None
-redis_pubsub = None
 
 if REDIS_URL:
     try:
         import redis.asyncio as aioredis
-        redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
+        # decode_responses=True 유지: 수신 메시지는 텍스트 프레임으로 그대로 전달하므로 어차피 str이 필요
+        redis_client = aioredis.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            max_connections=WS_REDIS_MAX_CONNECTIONS,
+            socket_keepalive=True,
+            socket_keepalive_options=_keepalive_options(),
+            health_check_interval=30,
+        )
         logger.info(f"Redis pub/sub enabled: {REDIS_URL}")
     except ImportError:
         logger.warning("redis package not installed. Using local mode.")
@@ -37,9 +106,6 @@ if REDIS_URL:
 
 router = APIRouter(tags=["websocket"])
 
-# 연결된 클라이언트 관리 (로컬 메모리)
-connected_clients: Dict[str, Set[WebSocket]] = {}
-
 
 class ConnectionManager:
     """
@@ -51,83 +117,362 @@ class ConnectionManager:
     """
     
     def __init__(self):
-        # workspace_id -> set of websockets (로컬 연결)
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # workspace_id -> list of websockets (로컬 연결, 브로드캐스트 순회용)
+        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # workspace_id -> id(websocket) -> active_connections 내 위치 (O(1) 제거용)
+        self._index: Dict[str, Dict[int, int]] = {}
+        # workspace_id -> 직렬화된 연결 성공 메시지 (연결이 있는 동안만 보관)
+        self._connected_messages: Dict[str, str] = {}
+        # workspace_id -> Redis 채널 이름 (연결이 있는 동안만 보관, 발행마다 문자열 생성 방지)
+        self._channels: Dict[str, str] = {}
+        # 로컬 연결이 있는 워크스페이스 채널만 구독하는 pub/sub 연결과 수신 태스크
+        self._pubsub = None
         self._pubsub_task: Optional[asyncio.Task] = None
+        # Redis 발행 대기열 (channel, text)과 파이프라인 발행 태스크
+        self._pub_queue: "asyncio.Queue[Optional[Tuple[str, str]]]" = asyncio.Queue(maxsize=WS_PUBLISH_QUEUE_MAX)
+        self._publisher_task: Optional[asyncio.Task] = None
+        # workspace_id -> user_id -> (최신 커서 payload, 보낸 연결) (전송 대기)
+        self._cursor_buffers: Dict[str, Dict[str, Tuple[dict, Optional[WebSocket]]]] = {}
+        # workspace_id -> 예약된 커서 flush 태스크
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, workspace_id: str):
         """새 연결 수락"""
         await websocket.accept()
-        if workspace_id not in self.active_connections:
-            self.active_connections[workspace_id] = set()
-        self.active_connections[workspace_id].add(websocket)
+        first = self._add_connection(websocket, workspace_id)
         
-        # Redis pub/sub 구독 시작 (첫 연결 시)
-        if redis_client and not self._pubsub_task:
+        # 워크스페이스의 첫 로컬 연결이면 해당 채널 구독
+        if redis_client and first:
+            await self._subscribe(workspace_id)
+        self._ensure_publisher()
+    
+    def _ensure_publisher(self):
+        """Redis 발행 태스크 시작 (미실행 시)"""
+        if redis_client and not self._publisher_task:
+            self._publisher_task = asyncio.create_task(self._redis_publisher())
+    
+    async def disconnect(self, websocket: WebSocket, workspace_id: str):
+        """연결 종료 (워크스페이스의 마지막 로컬 연결이면 채널 구독 해제)"""
+        if self._remove_connection(websocket, workspace_id):
+            self._connected_messages.pop(workspace_id, None)
+            await self._unsubscribe(workspace_id)
+            if workspace_id not in self.active_connections:
+                self._channels.pop(workspace_id, None)
+    
+    def _channel(self, workspace_id: str) -> str:
+        """워크스페이스 Redis 채널 이름 (로컬 연결이 없으면 새로 생성)"""
+        channel = self._channels.get(workspace_id)
+        return channel if channel is not None else _CHANNEL_PREFIX + workspace_id
+    
+    async def send_connected(self, websocket: WebSocket, workspace_id: str):
+        """연결 성공 메시지 전송 (워크스페이스별로 1회만 직렬화)"""
+        text = self._connected_messages.get(workspace_id)
+        if text is None:
+            text = self._connected_messages[workspace_id] = _dumps({
+                "type": _T_FILE,
+                "payload": {
+                    "event": "connected",
+                    "workspace_id": workspace_id,
+                    "message": "WebSocket connected (stub)",
+                },
+            })
+        await websocket.send_text(text)
+    
+    def _add_connection(self, websocket: WebSocket, workspace_id: str) -> bool:
+        """로컬 연결 등록 (워크스페이스의 첫 연결이면 True)"""
+        connections = self.active_connections.get(workspace_id)
+        first = connections is None
+        if first:
+            connections = self.active_connections[workspace_id] = []
+            self._index[workspace_id] = {}
+            self._channels[workspace_id] = _CHANNEL_PREFIX + workspace_id
+        index = self._index[workspace_id]
+        if id(websocket) not in index:
+            index[id(websocket)] = len(connections)
+            connections.append(websocket)
+        return first
+    
+    def _remove_connection(self, websocket: WebSocket, workspace_id: str) -> bool:
+        """
+        로컬 연결 제거 (워크스페이스의 마지막 연결이 제거되면 True)
+
+        마지막 원소를 빈자리로 옮기는 swap-remove로 O(1) 제거한다 (순서는 보장하지 않음).
+        """
+        index = self._index.get(workspace_id)
+        if index is None:
+            return False
+        i = index.pop(id(websocket), None)
+        if i is None:
+            return False
+        connections = self.active_connections[workspace_id]
+        last = connections.pop()
+        if i < len(connections):
+            connections[i] = last
+            index[id(last)] = i
+        if connections:
+            return False
+        del self.active_connections[workspace_id]
+        del self._index[workspace_id]
+        return True
+    
+    async def _subscribe(self, workspace_id: str):
+        """
+        워크스페이스 채널 구독 및 수신 태스크 시작
+
+        패턴 구독(ws:workspace:*) 대신 채널을 직접 구독해 Redis의 패턴 매칭을 피하고,
+        이 인스턴스에 연결이 없는 워크스페이스의 메시지는 받지 않는다.
+        """
+        try:
+            if self._pubsub is None:
+                self._pubsub = redis_client.pubsub()
+            await self._pubsub.subscribe(self._channel(workspace_id))
+        except Exception as e:
+            logger.error(f"Redis subscribe failed for {workspace_id}: {e}")
+            return
+        # 구독이 모두 해제되면 수신 태스크가 종료되므로 필요 시 다시 시작
+        if self._pubsub_task is None or self._pubsub_task.done():
             self._pubsub_task = asyncio.create_task(self._redis_subscriber())
     
-    def disconnect(self, websocket: WebSocket, workspace_id: str):
-        """연결 종료"""
-        if workspace_id in self.active_connections:
-            self.active_connections[workspace_id].discard(websocket)
-            if not self.active_connections[workspace_id]:
-                del self.active_connections[workspace_id]
+    async def _unsubscribe(self, workspace_id: str):
+        """워크스페이스 채널 구독 해제"""
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self._channel(workspace_id))
+        except Exception as e:
+            logger.error(f"Redis unsubscribe failed for {workspace_id}: {e}")
     
     async def send_personal(self, message: dict, websocket: WebSocket):
         """개인 메시지 전송"""
-        await websocket.send_json(message)
+        await websocket.send_text(_dumps(message))
     
-    async def broadcast(self, message: dict, workspace_id: str, exclude: WebSocket = None):
+    async def broadcast(
+        self,
+        message: dict,
+        workspace_id: str,
+        exclude: WebSocket = None,
+        droppable: bool = False,
+    ):
         """
         워크스페이스 내 브로드캐스트
         
         Redis 활성화 시: pub/sub으로 다른 인스턴스에도 전파
+        메시지는 1회만 직렬화해 모든 수신자와 Redis publish에 재사용한다.
+        Redis publish는 대기열에 넣고 반환하며, 발행 태스크가 파이프라인으로 묶어 전송한다.
+        
+        발행 대기열이 가득 찬 경우(Redis 지연):
+        - droppable=True (커서 이동): 버림. 다음 묶음이 최신 위치를 다시 보내므로 손실 없음
+        - droppable=False (파일 변경): 자리가 날 때까지 대기해 순서와 전달을 보장
         """
+        text = _dumps(message)
+
         # 로컬 브로드캐스트
-        await self._broadcast_local(message, workspace_id, exclude)
+        await self._broadcast_local(text, workspace_id, exclude)
         
-        # Redis pub/sub으로 다른 인스턴스에 전파
+        # Redis pub/sub으로 다른 인스턴스에 전파 (RTT를 기다리지 않음)
         if redis_client:
-            try:
-                channel = f"ws:workspace:{workspace_id}"
-                await redis_client.publish(channel, json.dumps(message))
-            except Exception as e:
-                logger.error(f"Redis publish failed: {e}")
+            await self._publish(text, workspace_id, droppable)
+
+    async def _publish(self, text: str, workspace_id: str, droppable: bool):
+        """Redis 발행 대기열에 추가 (대기열이 가득 차면 droppable에 따라 버리거나 대기)"""
+        self._ensure_publisher()
+        item = (self._channel(workspace_id), text)
+        try:
+            self._pub_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if droppable:
+                logger.debug(f"Redis publish queue full, dropping message for {workspace_id}")
+            else:
+                await self._pub_queue.put(item)
     
-    async def _broadcast_local(self, message: dict, workspace_id: str, exclude: WebSocket = None):
-        """로컬 인스턴스 내 브로드캐스트"""
-        if workspace_id not in self.active_connections:
+    async def _broadcast_local(self, text: str, workspace_id: str, exclude: WebSocket = None):
+        """
+        로컬 인스턴스 내 브로드캐스트 (직렬화된 JSON 텍스트 전송)
+
+        수신자별 전송을 순차 await 하지 않고 동시에 실행해 지연이 가장 느린 전송 1회 수준이 되게 한다.
+        전송에 실패한 연결은 끊긴 것으로 보고 제거한다 (이후 브로드캐스트마다 재시도하지 않도록).
+        """
+        connections = self.active_connections.get(workspace_id)
+        if not connections:
+            return
+        # 전송 중 연결/해제로 목록이 바뀔 수 있으므로 대상은 먼저 복사
+        await self._send_all(workspace_id, [(c, text) for c in connections if c is not exclude])
+
+    async def _send_all(self, workspace_id: str, sends: List[Tuple[WebSocket, str]]):
+        """연결별 텍스트 동시 전송 (실패한 연결은 제거)"""
+        if not sends:
             return
-        for connection in self.active_connections[workspace_id]:
-            if connection != exclude:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    # 연결이 끊긴 경우 무시
-                    pass
+        results = await asyncio.gather(
+            *(connection.send_text(text) for connection, text in sends),
+            return_exceptions=True,
+        )
+        for (connection, _), result in zip(sends, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Dropping dead WebSocket in {workspace_id}: {result}")
+                await self.disconnect(connection, workspace_id)
     
+    async def queue_cursor_move(self, cursor_payload: dict, workspace_id: str, exclude: WebSocket = None):
+        """
+        커서 이동 전송 예약
+
+        기본(CURSOR_FLUSH_MS <= 0)은 기존과 같이 cursor_move 프레임을 즉시 전송한다.
+        CURSOR_FLUSH_MS > 0이면 그동안 모아 사용자별 최신 위치만 cursor_move_batch 1개 프레임
+        (및 Redis publish 1회)으로 전송하며, 보낸 연결에는 자신이 보낸 항목을 제외하고 전달한다.
+        """
+        if CURSOR_FLUSH_MS <= 0:
+            await self.broadcast(
+                {"type": _T_CURSOR, "payload": cursor_payload},
+                workspace_id,
+                exclude=exclude,
+                droppable=True,
+            )
+            return
+
+        self._cursor_buffers.setdefault(workspace_id, {})[cursor_payload["user_id"]] = (cursor_payload, exclude)
+        if workspace_id not in self._flush_tasks:
+            self._flush_tasks[workspace_id] = asyncio.create_task(self._flush_cursor_moves(workspace_id))
+
+    async def _flush_cursor_moves(self, workspace_id: str):
+        """대기 중인 커서 이동을 묶어 브로드캐스트"""
+        await asyncio.sleep(CURSOR_FLUSH_MS / 1000)
+        # 브로드캐스트 중 도착한 커서 이동은 다음 flush로 모이도록 먼저 분리
+        self._flush_tasks.pop(workspace_id, None)
+        entries = self._cursor_buffers.pop(workspace_id, None)
+        if not entries:
+            return
+        try:
+            text = _cursor_batch_text([payload for payload, _ in entries.values()])
+            await self._send_all(workspace_id, self._cursor_batch_sends(workspace_id, entries, text))
+            # 다른 인스턴스에는 보낸 연결이 없으므로 전체 묶음을 발행
+            if redis_client:
+                await self._publish(text, workspace_id, droppable=True)
+        except Exception as e:
+            logger.error(f"Cursor batch broadcast failed: {e}")
+
+    def _cursor_batch_sends(
+        self,
+        workspace_id: str,
+        entries: Dict[str, Tuple[dict, Optional[WebSocket]]],
+        text: str,
+    ) -> List[Tuple[WebSocket, str]]:
+        """
+        로컬 연결별 커서 묶음 텍스트
+
+        커서를 보내지 않은 연결은 공통 텍스트를 재사용하고, 보낸 연결에는 자신이 보낸 항목을 뺀 묶음을 보낸다.
+        """
+        connections = self.active_connections.get(workspace_id)
+        if not connections:
+            return []
+        own: Dict[int, Set[str]] = {}
+        for user_id, (_, sender) in entries.items():
+            if sender is not None:
+                own.setdefault(id(sender), set()).add(user_id)
+
+        sends: List[Tuple[WebSocket, str]] = []
+        for connection in list(connections):
+            skip = own.get(id(connection))
+            if skip is None:
+                sends.append((connection, text))
+                continue
+            others = [payload for user_id, (payload, _) in entries.items() if user_id not in skip]
+            if others:
+                sends.append((connection, _cursor_batch_text(others)))
+        return sends
+
+    async def _redis_publisher(self):
+        """
+        Redis 발행 태스크 (백그라운드)
+
+        대기열에 쌓인 메시지를 최대 _PUBLISH_BATCH_MAX개씩 파이프라인 1회(RTT 1회)로 발행한다.
+        대기열이 비어 있으면 첫 메시지를 바로 보내므로 부하가 없을 때 지연이 추가되지 않는다.
+        종료 신호(_PUBLISH_STOP)를 꺼내면 그 앞의 메시지까지 발행하고 끝난다.
+        """
+        queue = self._pub_queue
+        try:
+            while True:
+                item = await queue.get()
+                if item is _PUBLISH_STOP:
+                    break
+                batch = [item]
+                stop = self._drain_publish_queue(batch)
+                await self._publish_batch(batch)
+                if stop:
+                    break
+        except asyncio.CancelledError:
+            logger.info("Redis publisher cancelled")
+
+    def _drain_publish_queue(self, batch: List[Tuple[str, str]]) -> bool:
+        """대기 중인 발행 메시지를 _PUBLISH_BATCH_MAX까지 꺼냄 (종료 신호를 꺼내면 True)"""
+        queue = self._pub_queue
+        while len(batch) < _PUBLISH_BATCH_MAX and not queue.empty():
+            item = queue.get_nowait()
+            if item is _PUBLISH_STOP:
+                return True
+            batch.append(item)
+        return False
+
+    @staticmethod
+    async def _publish_batch(batch: List[Tuple[str, str]]):
+        """파이프라인 1회로 발행 (실패는 로그만 남김)"""
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for channel, text in batch:
+                    pipe.publish(channel, text)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis publish failed ({len(batch)} messages): {e}")
+
+    async def shutdown(self):
+        """
+        백그라운드 태스크 중지 (앱 종료 시)
+
+        Redis 발행은 broadcast에서 기다리지 않으므로, 발행 태스크는 취소하지 않고
+        대기열 끝에 종료 신호를 넣어 남은 메시지를 마저 발행한 뒤 끝나기를 기다린다
+        (파이프라인 실행 도중 취소되어 메시지가 유실되지 않도록).
+        """
+        tasks = [t for t in (self._pubsub_task, *self._flush_tasks.values()) if t]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._pubsub_task = None
+        self._flush_tasks.clear()
+        self._cursor_buffers.clear()
+
+        publisher, self._publisher_task = self._publisher_task, None
+        if publisher is not None and not publisher.done():
+            await self._pub_queue.put(_PUBLISH_STOP)
+            await asyncio.gather(publisher, return_exceptions=True)
+
+        # 발행 태스크가 없었거나 먼저 끝난 경우 남은 메시지를 직접 발행
+        while redis_client and not self._pub_queue.empty():
+            batch: List[Tuple[str, str]] = []
+            self._drain_publish_queue(batch)
+            if batch:
+                await self._publish_batch(batch)
+
     async def _redis_subscriber(self):
-        """Redis pub/sub 구독자 (백그라운드 태스크)"""
-        if not redis_client:
+        """
+        Redis pub/sub 수신자 (백그라운드 태스크)
+
+        listen()은 구독 채널이 하나도 없으면 끝나므로, 다음 구독 시 _subscribe에서 다시 시작한다.
+        """
+        pubsub = self._pubsub
+        if pubsub is None:
             return
         
         try:
-            pubsub = redis_client.pubsub()
-            # 모든 워크스페이스 채널 패턴 구독
-            await pubsub.psubscribe("ws:workspace:*")
-            
             logger.info("Redis pub/sub subscriber started")
             
             async for message in pubsub.listen():
-                if message["type"] == "pmessage":
+                if message["type"] == "message":
                     try:
                         # 채널에서 workspace_id 추출
-                        channel = message["channel"]
-                        workspace_id = channel.split(":")[-1]
-                        data = json.loads(message["data"])
+                        workspace_id = message["channel"][len(_CHANNEL_PREFIX):]
                         
                         # 로컬 클라이언트에 전달 (exclude 없음 - 다른 인스턴스에서 온 메시지)
-                        await self._broadcast_local(data, workspace_id)
+                        # 발행 측에서 직렬화한 JSON 텍스트를 다시 파싱하지 않고 그대로 전달
+                        await self._broadcast_local(message["data"], workspace_id)
                     except Exception as e:
                         logger.error(f"Redis message processing failed: {e}")
                         
@@ -140,10 +485,47 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-def _validate_token(token: Optional[str]) -> Optional[dict]:
+async def _receive_frame(websocket: WebSocket) -> Union[str, bytes]:
+    """
+    클라이언트 프레임 수신 (텍스트/바이너리 모두 허용)
+
+    바이너리 프레임은 디코딩 없이 그대로 JSON 파서에 전달한다.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE), message.get("reason"))
+    text = message.get("text")
+    return text if text is not None else message.get("bytes", b"")
+
+
+class _InvalidMessage(ValueError):
+    """JSON으로는 유효하지만 메시지 형식이 아닌 프레임"""
+
+
+def _decode_message(data: Union[str, bytes]) -> Tuple[object, dict]:
+    """
+    수신 프레임 → (type, payload)
+
+    최상위 값이나 payload가 객체가 아니면 _InvalidMessage (WS_INVALID_JSON으로 응답).
+    형식 확인은 isinstance 2회뿐이며 필드별 검증은 타입별 처리에서 필요한 것만 한다.
+    """
+    message = _loads(data)
+    if not isinstance(message, dict):
+        raise _InvalidMessage("message must be an object")
+    payload = message.get("payload")
+    if payload is None:
+        payload = {}
+    elif not isinstance(payload, dict):
+        raise _InvalidMessage("payload must be an object")
+    return message.get("type"), payload
+
+
+async def _validate_token(token: Optional[str]) -> Optional[dict]:
     """
     JWT 토큰 검증
     
+    검증 결과 캐시는 JWTAuthService.verify_token이 담당한다.
+    
     Returns:
         유효한 경우 페이로드 dict, 그렇지 않으면 None
     """
@@ -151,8 +533,10 @@ def _validate_token(token: Optional[str]) -> Optional[dict]:
         return None
     
     try:
-        payload = jwt_auth_service.verify_token(token)
-        return payload
+        if WS_JWT_OFFLOAD:
+            # 접속이 몰릴 때 비대칭 서명 검증이 이벤트 루프를 막지 않도록 스레드에서 실행
+            return await asyncio.to_thread(jwt_auth_service.verify_token, token)
+        return jwt_auth_service.verify_token(token)
     except Exception as e:
         logger.warning(f"WebSocket token validation failed: {e}")
         return None
@@ -179,17 +563,15 @@ async def websocket_endpoint(websocket: WebSocket, ws_id: str):
     
     메시지 타입:
     - file_change: 파일 변경 알림
-    - cursor_move: 커서 이동 (협업용)
+    - cursor_move: 커서 이동 (협업용, WS_CURSOR_FLUSH_MS > 0이면 서버는 cursor_move_batch로 묶어 전달)
     - ai_stream: AI 응답 스트리밍
     - error: 에러 메시지
     
-    TODO: 스케일링
-    - Redis pub/sub으로 다중 인스턴스 지원
-    - 메시지 큐 연동
+    다중 인스턴스: REDIS_URL 설정 시 ConnectionManager가 워크스페이스 채널로 전파
     """
     # 인증 검증 (query parameter에서 토큰 추출)
     token = websocket.query_params.get("token")
-    payload = _validate_token(token)
+    payload = await _validate_token(token)
     
     if not payload:
         logger.warning(f"WebSocket connection rejected: invalid token for workspace {ws_id}")
@@ -206,56 +588,45 @@ async def websocket_endpoint(websocket: WebSocket, ws_id: str):
     
     logger.info(f"WebSocket connected: user={user_id}, workspace={ws_id}")
     await manager.connect(websocket, ws_id)
+    # 메시지마다 get_event_loop()를 호출하지 않도록 타임스탬프 함수를 1회 바인딩
+    loop_time = asyncio.get_running_loop().time
     
     try:
         # 연결 성공 메시지
-        await manager.send_personal(
-            {
-                "type": WSMessageType.FILE_CHANGE.value,
-                "payload": {
-                    "event": "connected",
-                    "workspace_id": ws_id,
-                    "message": "WebSocket connected (stub)",
-                },
-            },
-            websocket,
-        )
+        await manager.send_connected(websocket, ws_id)
         
         while True:
             # 클라이언트 메시지 수신
-            data = await websocket.receive_text()
+            data = await _receive_frame(websocket)
+            # 텍스트 프레임은 인코딩 없이 문자 수로 비교 (정확한 바이트 상한은 uvicorn --ws-max-size)
+            if len(data) > WS_MAX_FRAME_BYTES:
+                await websocket.send_text(_ERR_TOO_BIG)
+                continue
             
             try:
-                message = json.loads(data)
-                msg_type = message.get("type")
-                payload = message.get("payload", {})
+                msg_type, payload = _decode_message(data)
                 
                 # 메시지 타입별 처리
-                if msg_type == WSMessageType.FILE_CHANGE.value:
+                if msg_type == _T_FILE:
                     # 파일 변경 처리
                     file_path = payload.get("file_path", "")
                     change_type = payload.get("change_type", "modify")  # create, modify, delete
                     content = payload.get("content")
                     
-                    # 경로 검증 (보안)
-                    if ".." in file_path or file_path.startswith("/"):
-                        await manager.send_personal(
-                            {
-                                "type": WSMessageType.ERROR.value,
-                                "payload": {
-                                    "error": "Invalid file path",
-                                    "code": "WS_INVALID_PATH",
-                                },
-                            },
-                            websocket,
-                        )
+                    # 경로 검증 (보안) - 길이를 먼저 제한해 검사 비용 상한을 둠
+                    if (
+                        not isinstance(file_path, str)
+                        or len(file_path) > _MAX_FILE_PATH_LEN
+                        or _BAD_PATH_RE.search(file_path)
+                    ):
+                        await websocket.send_text(_ERR_BAD_PATH)
                         continue
                     
                     # 변경 내용에 사용자 정보 추가
                     enriched_payload = {
                         **payload,
                         "user_id": user_id,
-                        "timestamp": asyncio.get_event_loop().time(),
+                        "timestamp": loop_time(),
                     }
                     
                     # 다른 클라이언트에 브로드캐스트
@@ -267,7 +638,7 @@ async def websocket_endpoint(websocket: WebSocket, ws_id: str):
                     
                     logger.debug(f"File change broadcast: {change_type} {file_path} by {user_id}")
                     
-                elif msg_type == WSMessageType.CURSOR_MOVE.value:
+                elif msg_type == _T_CURSOR:
                     # 커서 이동 처리 (협업)
                     file_path = payload.get("file_path", "")
                     line = payload.get("line", 0)
@@ -281,40 +652,18 @@ async def websocket_endpoint(websocket: WebSocket, ws_id: str):
                         "line": line,
                         "column": column,
                         "selection": selection,
-                        "timestamp": asyncio.get_event_loop().time(),
+                        "timestamp": loop_time(),
                     }
                     
-                    # 다른 클라이언트에 브로드캐스트
-                    await manager.broadcast(
-                        {"type": msg_type, "payload": cursor_payload},
-                        ws_id,
-                        exclude=websocket,
-                    )
+                    # 다른 클라이언트에 전송 (묶음 전송 설정 시 사용자별 최신 위치만)
+                    await manager.queue_cursor_move(cursor_payload, ws_id, exclude=websocket)
                     
                 else:
                     # 알 수 없는 메시지 타입
-                    await manager.send_personal(
-                        {
-                            "type": WSMessageType.ERROR.value,
-                            "payload": {
-                                "error": "Unknown message type",
-                                "code": "WS_UNKNOWN_TYPE",
-                            },
-                        },
-                        websocket,
-                    )
+                    await websocket.send_text(_ERR_UNKNOWN)
                     
-            except json.JSONDecodeError:
-                await manager.send_personal(
-                    {
-                        "type": WSMessageType.ERROR.value,
-                        "payload": {
-                            "error": "Invalid JSON",
-                            "code": "WS_INVALID_JSON",
-                        },
-                    },
-                    websocket,
-                )
+            except (json.JSONDecodeError, _InvalidMessage):
+                await websocket.send_text(_ERR_BAD_JSON)
                 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, ws_id)
+        await manager.disconnect(websocket, ws_id)
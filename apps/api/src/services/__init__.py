@@ -7,6 +7,7 @@ from .workspace_service import WorkspaceService
 from .cache_service import CacheService
 from .placement_service import PlacementService
 from .auth_service import (
+    AesGcmEncryptionService,
     EncryptionService,
     SSHAuthService,
     mTLSAuthService,
@@ -26,6 +27,7 @@ __all__ = [
     "WorkspaceService",
     "CacheService",
     "PlacementService",
+    "AesGcmEncryptionService",
     "EncryptionService",
     "SSHAuthService",
     "mTLSAuthService",
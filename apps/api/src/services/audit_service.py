@@ -6,10 +6,11 @@ AGENTS.md 보안 원칙:
 - 해시 + 메타데이터만 저장
 """
 
+import os
 import hashlib
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Iterable, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.models import AuditLogModel
@@ -17,6 +18,21 @@ from ..db.connection import get_db
 
 logger = logging.getLogger(__name__)
 
+# 감사 로그 해시 알고리즘 (sha256 | blake2b)
+# SHA-NI가 없는 서버(예: ARM)에서는 blake2b(32바이트)가 더 빠르다. 출력 길이(64자)는 동일하지만
+# 기존 해시와 비교할 수 없게 되므로 배포 중에는 바꾸지 않는다.
+AUDIT_HASH = os.getenv("AUDIT_HASH", "sha256").lower()
+
+
+def _hasher_for(name: str) -> Callable[[bytes], "hashlib._Hash"]:
+    """해시 알고리즘 이름 → 해시 객체 생성 함수"""
+    if name == "blake2b":
+        return lambda data: hashlib.blake2b(data, digest_size=32)
+    return hashlib.sha256
+
+
+_new_hasher = _hasher_for(AUDIT_HASH)
+
 
 class AuditService:
     """감사 로그 서비스"""
@@ -24,13 +40,19 @@ class AuditService:
     @staticmethod
     def hash_content(content: str) -> str:
         """
-        콘텐츠를 SHA-256 해시로 변환
+        콘텐츠를 해시로 변환 (기본 SHA-256, AUDIT_HASH=blake2b 설정 시 BLAKE2b)
         
         프롬프트/응답 원문은 저장하지 않고 해시만 저장
         """
         if not content:
             return ""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return _new_hasher(content.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def hash_many(contents: Iterable[Optional[str]]) -> List[str]:
+        """여러 콘텐츠 해시 (빈 값은 빈 문자열)"""
+        new_hasher = _new_hasher
+        return [new_hasher(c.encode("utf-8")).hexdigest() if c else "" for c in contents]
     
     @staticmethod
     async def log(
@@ -46,11 +68,14 @@ class AuditService:
         latency_ms: Optional[float] = None,
         model: Optional[str] = None,
         status: str = "success",
+        return_row: bool = False,
     ) -> Optional[AuditLogModel]:
         """
         감사 로그 저장
         
         프롬프트/응답 원문은 저장하지 않고 해시만 저장합니다.
+        id는 클라이언트 측 기본값(uuid4)이라 커밋 후 바로 사용할 수 있으며,
+        서버 기본값(timestamp)까지 필요할 때만 return_row=True로 재조회합니다.
         
         Args:
             db: 데이터베이스 세션
@@ -65,24 +90,20 @@ class AuditService:
             latency_ms: 응답 시간 (밀리초)
             model: 사용된 모델
             status: 상태 (success, error)
+            return_row: 커밋 후 행을 다시 읽어 서버 기본값을 채울지 여부
         
         Returns:
             저장된 감사 로그 모델
         """
         try:
-            audit_log = AuditLogModel(
-                user_id=user_id,
-                workspace_id=workspace_id,
-                action=action,
-                instruction_hash=AuditService.hash_content(instruction) if instruction else None,
-                response_hash=AuditService.hash_content(response) if response else None,
-                patch_hash=AuditService.hash_content(patch) if patch else None,
-                tokens_used=tokens_used,
+            audit_log = AuditService._build_log(
+                user_id, workspace_id, action, instruction, response, patch, tokens_used
             )
             
             db.add(audit_log)
             await db.commit()
-            await db.refresh(audit_log)
+            if return_row:
+                await db.refresh(audit_log)
             
             logger.info(
                 f"Audit log saved: user={user_id}, action={action}, "
@@ -96,6 +117,30 @@ class AuditService:
             await db.rollback()
             return None
     
+    @staticmethod
+    def _build_log(
+        user_id: str,
+        workspace_id: str,
+        action: str,
+        instruction: Optional[str],
+        response: Optional[str],
+        patch: Optional[str],
+        tokens_used: Optional[int],
+    ) -> AuditLogModel:
+        """감사 로그 모델 생성 (원문 대신 해시)"""
+        instruction_hash, response_hash, patch_hash = (
+            h or None for h in AuditService.hash_many((instruction, response, patch))
+        )
+        return AuditLogModel(
+            user_id=user_id,
+            workspace_id=workspace_id,
+            action=action,
+            instruction_hash=instruction_hash,
+            response_hash=response_hash,
+            patch_hash=patch_hash,
+            tokens_used=tokens_used,
+        )
+    
     @staticmethod
     def log_sync(
         user_id: str,
@@ -5,19 +5,35 @@ SSH 키, mTLS, API 키 기반 인증 관리
 """
 
 import os
+import time
+import asyncio
 import base64
+import binascii
 import hashlib
+import hmac
 import secrets
-from typing import Optional, Tuple
-from datetime import datetime, timedelta
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from datetime import datetime
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
 from cryptography import x509
 import bcrypt
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 import base64 as _b64
 
+from ..utils import json as json_utils
+from ..utils.ttl_cache import TTLCache
+
 # JWT 설정
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", secrets.token_urlsafe(32))
 JWT_REFRESH_SECRET_KEY = os.getenv("JWT_REFRESH_SECRET_KEY", secrets.token_urlsafe(32))
@@ -25,8 +41,25 @@ JWT_ALGORITHM = "HS256"
 JWT_ACCESS_EXPIRATION_MINUTES = 15  # 액세스 토큰: 15분
 JWT_REFRESH_EXPIRATION_DAYS = 7    # 리프레시 토큰: 7일
 
-# Gateway(JWKS/RS256) 설정 (newarchitecture v0.3)
-GATEWAY_JWT_ALGORITHM = "RS256"
+# 서명 검증을 통과한 JWT 페이로드 캐시 (같은 토큰의 반복 검증 시 HMAC/JSON 파싱 생략)
+JWT_DECODE_CACHE_SIZE = int(os.getenv("JWT_DECODE_CACHE_SIZE", "4096"))
+JWT_DECODE_CACHE_TTL = float(os.getenv("JWT_DECODE_CACHE_TTL", "60"))
+
+# bcrypt 비용 계수 (2^cost 라운드). 낮추면 로그인 처리량은 늘지만 오프라인 대입 공격 비용도 같이 줄어든다.
+# 기존 해시는 해시 문자열에 기록된 비용으로 검증되므로 값 변경 후에도 그대로 동작한다.
+BCRYPT_COST = int(os.getenv("BCRYPT_COST", "12"))
+# bcrypt 전용 스레드 수 (bcrypt는 GIL을 풀고 계산하므로 스레드로도 여러 코어 사용)
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", str(os.cpu_count() or 4)))
+
+# 파싱한 mTLS 인증서 정보 캐시 (같은 인증서 반복 검증 시 ASN.1 파싱 생략)
+CERT_INFO_CACHE_SIZE = int(os.getenv("CERT_INFO_CACHE_SIZE", "1024"))
+CERT_INFO_CACHE_TTL = float(os.getenv("CERT_INFO_CACHE_TTL", "3600"))
+
+# Gateway(JWKS) 설정 (newarchitecture v0.3)
+# RS256(기본) 또는 ES256. ES256은 키 생성/서명이 RSA보다 훨씬 빠르다 (python-jose는 EdDSA 미지원)
+GATEWAY_JWT_ALGORITHM = os.getenv("GATEWAY_JWT_ALGORITHM", "RS256").upper()
+if GATEWAY_JWT_ALGORITHM not in ("RS256", "ES256"):
+    raise ValueError(f"Unsupported GATEWAY_JWT_ALGORITHM: {GATEWAY_JWT_ALGORITHM}")
 GATEWAY_TOKEN_TTL_MINUTES = int(os.getenv("GATEWAY_TOKEN_TTL_MINUTES", "720"))  # 12h
 GATEWAY_JWT_KEY_ID = os.getenv("GATEWAY_JWT_KEY_ID", "gateway-key-1")
 GATEWAY_JWT_PRIVATE_KEY_PEM = os.getenv("GATEWAY_JWT_PRIVATE_KEY_PEM")  # PEM string
@@ -34,36 +67,147 @@ GATEWAY_JWT_KEY_DIR = os.getenv("GATEWAY_JWT_KEY_DIR", "/tmp/cursor-poc-keys")
 GATEWAY_JWT_PRIVATE_KEY_FILE = os.getenv("GATEWAY_JWT_PRIVATE_KEY_FILE", os.path.join(GATEWAY_JWT_KEY_DIR, "gateway_jwt_private.pem"))
 
 
-def _b64url_uint(n: int) -> str:
-    b = n.to_bytes((n.bit_length() + 7) // 8, "big")
+_jwt_decode_cache: TTLCache[dict] = TTLCache(maxsize=JWT_DECODE_CACHE_SIZE, ttl=JWT_DECODE_CACHE_TTL)
+# WS_JWT_OFFLOAD 사용 시 스레드에서도 호출되므로 캐시 접근만 잠금
+_jwt_decode_lock = threading.Lock()
+
+
+def _decode_cached(token: str, secret: str) -> dict:
+    """
+    JWT 디코딩(_decode_hs256) 결과 캐시
+    
+    - 키는 (서명 키, 토큰 BLAKE2b 다이제스트) - 원문 토큰을 키로 보관하지 않음
+    - 디코딩 단계만 캐시하고 만료(exp)는 적중 시마다 확인, 지났으면 다시 decode해 JWTError 발생
+    - 검증 실패는 캐시하지 않음
+    - 호출자가 수정해도 캐시가 오염되지 않도록 사본을 반환
+    """
+    key = (secret, hashlib.blake2b(token.encode(), digest_size=16).digest())
+    with _jwt_decode_lock:
+        payload = _jwt_decode_cache.get(key)
+        if payload is not None and payload.get("exp", float("inf")) <= time.time():
+            _jwt_decode_cache.pop(key)
+            payload = None
+    if payload is None:
+        payload = _decode_hs256(token, secret)
+        with _jwt_decode_lock:
+            _jwt_decode_cache.set(key, payload)
+    return dict(payload)
+
+
+# python-jose가 검증하는 등록 클레임 중 자체 발급 토큰에 없는 것 (있으면 jwt.decode로 전체 검증)
+_JOSE_ONLY_CLAIMS = ("aud", "iss", "nbf", "at_hash")
+
+
+@lru_cache(maxsize=8)
+def _hs256_template(secret: str) -> "hmac.HMAC":
+    """키 스케줄(ipad/opad)을 마친 HMAC-SHA256 객체 (호출마다 copy()해서 사용)"""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hs256(token: str, secret: str) -> dict:
+    """
+    자체 발급 HS256 토큰 검증 (jwt.decode와 같은 결과/예외)
+    
+    python-jose는 호출마다 키 객체/HMAC 키 스케줄을 새로 만들므로,
+    미리 준비한 HMAC 객체를 복사해 서명을 확인하고 exp/iat/sub/jti만 직접 검증한다.
+    헤더 alg가 HS256이 아니거나 aud/iss/nbf 등이 있으면 jwt.decode로 넘긴다.
+    """
+    try:
+        signing_input, _, signature = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        if "." in payload_segment:
+            raise JWTError("Invalid number of token segments")
+        header = json_utils.loads(_b64url_decode(header_segment))
+        if not isinstance(header, dict) or header.get("alg") != JWT_ALGORITHM:
+            return jwt.decode(token, secret, algorithms=[JWT_ALGORITHM])
+        mac = _hs256_template(secret).copy()
+        mac.update(signing_input.encode("ascii"))
+        if not hmac.compare_digest(mac.digest(), _b64url_decode(signature)):
+            raise JWTError("Signature verification failed.")
+        claims = json_utils.loads(_b64url_decode(payload_segment))
+    except (ValueError, TypeError, binascii.Error, UnicodeError) as e:
+        raise JWTError(f"Invalid token: {e}")
+    if not isinstance(claims, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+    if any(name in claims for name in _JOSE_ONLY_CLAIMS):
+        return jwt.decode(token, secret, algorithms=[JWT_ALGORITHM])
+    
+    try:
+        if "iat" in claims:
+            int(claims["iat"])
+        if "exp" in claims and int(claims["exp"]) < int(time.time()):
+            raise ExpiredSignatureError("Signature has expired.")
+    except (ValueError, TypeError):
+        raise JWTClaimsError("Invalid iat/exp claim - must be an integer.")
+    if not isinstance(claims.get("sub", ""), str) or not isinstance(claims.get("jti", ""), str):
+        raise JWTClaimsError("Invalid sub/jti claim - must be a string.")
+    return claims
+
+
+def _b64url_uint(n: int, length: Optional[int] = None) -> str:
+    # EC 좌표는 고정 길이(P-256: 32바이트)로 인코딩해야 함
+    b = n.to_bytes(length or (n.bit_length() + 7) // 8, "big")
     return _b64.urlsafe_b64encode(b).rstrip(b"=").decode("ascii")
 
 
 class GatewayJWKSService:
     """
-    Gateway 토큰 발급 및 JWKS 제공 (RS256)
+    Gateway 토큰 발급 및 JWKS 제공 (RS256 / ES256)
     - 금융권 VDE: 외부 IdP 없이 내부 구성도 가능하나, 운영에서는 키를 Secret으로 주입 권장
     """
 
     def __init__(self):
         self._kid = GATEWAY_JWT_KEY_ID
-        self._private_key_pem, self._public_jwk = self._load_or_generate_keys()
+        self._private_key, self._private_key_pem, self._public_jwk = self._load_or_generate_keys()
+        # 헤더는 고정값이므로 base64url 인코딩 결과를 미리 계산
+        self._header_segment = _b64url_encode(
+            json_utils.dumps({"alg": GATEWAY_JWT_ALGORITHM, "kid": self._kid, "typ": "JWT"})
+        )
+        # 키는 프로세스 수명 동안 바뀌지 않으므로 JWKS 응답 본문을 미리 직렬화
+        self._jwks_json = json_utils.dumps({"keys": [self._public_jwk]})
+
+    @staticmethod
+    def _key_matches_algorithm(private_key) -> bool:
+        if GATEWAY_JWT_ALGORITHM == "ES256":
+            return isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(private_key.curve, ec.SECP256R1)
+        return isinstance(private_key, rsa.RSAPrivateKey)
 
-    def _load_or_generate_keys(self) -> tuple[str, dict]:
+    @staticmethod
+    def _generate_private_key():
+        if GATEWAY_JWT_ALGORITHM == "ES256":
+            return ec.generate_private_key(ec.SECP256R1())
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def _load_or_generate_keys(self) -> tuple:
         # 운영: PEM 환경변수 주입 권장
         if GATEWAY_JWT_PRIVATE_KEY_PEM and "BEGIN" in GATEWAY_JWT_PRIVATE_KEY_PEM:
             private_pem = GATEWAY_JWT_PRIVATE_KEY_PEM
             private_key = serialization.load_pem_private_key(private_pem.encode("utf-8"), password=None)
+            if not self._key_matches_algorithm(private_key):
+                raise ValueError(f"GATEWAY_JWT_PRIVATE_KEY_PEM does not match {GATEWAY_JWT_ALGORITHM}")
             public_key = private_key.public_key()
         else:
             # 개발/PoC: 컨테이너 파일로 키를 고정 (프로세스/재시작 간 일관성)
             os.makedirs(GATEWAY_JWT_KEY_DIR, exist_ok=True)
+            private_key = None
             if os.path.exists(GATEWAY_JWT_PRIVATE_KEY_FILE):
                 private_pem = open(GATEWAY_JWT_PRIVATE_KEY_FILE, "r", encoding="utf-8").read()
                 private_key = serialization.load_pem_private_key(private_pem.encode("utf-8"), password=None)
+                # 알고리즘을 바꾼 경우 기존 개발용 키는 새로 생성
+                if not self._key_matches_algorithm(private_key):
+                    private_key = None
+            if private_key is not None:
                 public_key = private_key.public_key()
             else:
-                private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+                private_key = self._generate_private_key()
                 public_key = private_key.public_key()
                 private_pem = private_key.private_bytes(
                     encoding=serialization.Encoding.PEM,
@@ -81,19 +225,32 @@ class GatewayJWKSService:
                     pass
 
         pub_numbers = public_key.public_numbers()
-        jwk = {
-            "kty": "RSA",
-            "use": "sig",
-            "kid": self._kid,
-            "alg": GATEWAY_JWT_ALGORITHM,
-            "n": _b64url_uint(pub_numbers.n),
-            "e": _b64url_uint(pub_numbers.e),
-        }
-        return private_pem, jwk
+        jwk = {"use": "sig", "kid": self._kid, "alg": GATEWAY_JWT_ALGORITHM}
+        if GATEWAY_JWT_ALGORITHM == "ES256":
+            jwk.update(
+                kty="EC",
+                crv="P-256",
+                x=_b64url_uint(pub_numbers.x, 32),
+                y=_b64url_uint(pub_numbers.y, 32),
+            )
+        else:
+            jwk.update(kty="RSA", n=_b64url_uint(pub_numbers.n), e=_b64url_uint(pub_numbers.e))
+        return private_key, private_pem, jwk
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """JWS 서명 (RS256: PKCS#1 v1.5, ES256: r||s 64바이트)"""
+        if GATEWAY_JWT_ALGORITHM == "ES256":
+            r, s = decode_dss_signature(self._private_key.sign(signing_input, ec.ECDSA(hashes.SHA256())))
+            return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+        return self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
 
     def jwks(self) -> dict:
         return {"keys": [self._public_jwk]}
 
+    def jwks_json(self) -> bytes:
+        """직렬화된 JWKS 응답 본문"""
+        return self._jwks_json
+
     def create_gateway_token(
         self,
         user_id: str,
@@ -102,7 +259,8 @@ class GatewayJWKSService:
         workspace_id: str,
         role: str,
     ) -> str:
-        expires_at = datetime.utcnow() + timedelta(minutes=GATEWAY_TOKEN_TTL_MINUTES)
+        # 현재 시각은 한 번만 구하고 epoch 초(int)로 전달 (jose의 datetime 변환 생략)
+        now = int(time.time())
         payload = {
             "sub": user_id,
             # v0.3 기대 클레임 키 (gateway/app/auth_async.py와 정합)
@@ -111,14 +269,65 @@ class GatewayJWKSService:
             "wid": workspace_id,
             "role": role,
             "type": "gateway",
-            "exp": expires_at,
-            "iat": datetime.utcnow(),
+            "exp": now + GATEWAY_TOKEN_TTL_MINUTES * 60,
+            "iat": now,
         }
-        return jwt.encode(payload, self._private_key_pem, algorithm=GATEWAY_JWT_ALGORITHM, headers={"kid": self._kid})
+        # python-jose는 호출마다 PEM 키를 다시 파싱하고 헤더를 직렬화하므로 로드한 키로 직접 서명
+        signing_input = self._header_segment + b"." + _b64url_encode(json_utils.dumps(payload))
+        return (signing_input + b"." + _b64url_encode(self._sign(signing_input))).decode("ascii")
+
+
+class AesGcmEncryptionService:
+    """
+    AES-256-GCM 암호화 서비스
+    
+    Fernet(AES-CBC + HMAC 2단계)과 달리 암호화/인증을 한 번에 처리한다.
+    암호문 형식: 버전(1) || nonce(12) || 암호문+태그
+    - encrypt/decrypt: 위 바이트열을 base64url 문자열로 주고받음
+    - encrypt_bytes/decrypt_bytes: 바이트열 그대로 (UTF-8/base64 변환 없음)
+    """
+    
+    VERSION = 0x01
+    NONCE_SIZE = 12
+    
+    def __init__(self, key: bytes):
+        if len(key) != 32:
+            raise ValueError("AES-GCM key must be 32 bytes")
+        self._aead = AESGCM(key)
+        self._header = bytes([self.VERSION])
+    
+    def encrypt(self, plaintext: str) -> str:
+        """텍스트 암호화"""
+        return base64.urlsafe_b64encode(self.encrypt_bytes(plaintext.encode())).decode()
+    
+    def decrypt(self, ciphertext: str) -> str:
+        """텍스트 복호화 (변조 시 cryptography.exceptions.InvalidTag)"""
+        return self.decrypt_bytes(base64.urlsafe_b64decode(ciphertext)).decode()
+    
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """바이트 암호화"""
+        nonce = os.urandom(self.NONCE_SIZE)
+        return self._header + nonce + self._aead.encrypt(nonce, plaintext, None)
+    
+    def decrypt_bytes(self, ciphertext: bytes) -> bytes:
+        """바이트 복호화"""
+        if len(ciphertext) <= 1 + self.NONCE_SIZE or ciphertext[0] != self.VERSION:
+            raise ValueError("Unsupported ciphertext format")
+        nonce = ciphertext[1:1 + self.NONCE_SIZE]
+        return self._aead.decrypt(nonce, ciphertext[1 + self.NONCE_SIZE:], None)
 
 
 class EncryptionService:
-    """암호화 서비스 (Fernet 기반)"""
+    """
+    암호화 서비스
+    
+    새 암호문은 AES-GCM으로 생성하고, 기존 Fernet 암호문도 계속 복호화한다.
+    두 형식은 base64 디코딩 후 첫 바이트(Fernet 0x80 / AES-GCM 0x01)로 구분한다.
+    AES-GCM 키는 마스터 키에서 HKDF로 파생하므로 추가 설정이 필요 없다.
+    """
+    
+    _FERNET_VERSION = 0x80
+    _AESGCM_HKDF_INFO = b"cursorclone/encryption/aes-256-gcm/v1"
     
     def __init__(self, key: Optional[bytes] = None):
         """
@@ -127,6 +336,7 @@ class EncryptionService:
         Args:
             key: 마스터 암호화 키 (없으면 환경변수에서 로드)
         """
+        key_raw: Optional[bytes] = None
         if key is None:
             key_str = os.getenv("MASTER_ENCRYPTION_KEY")
             if not key_str:
@@ -139,13 +349,15 @@ class EncryptionService:
                 key = Fernet.generate_key()
             else:
                 # 환경변수에서 가져온 키를 bytes로 변환
+                key = key_str.encode() if isinstance(key_str, str) else key_str
+                # Fernet 키 형식(base64url 32바이트) 검증 - 검증용 Fernet 객체를 따로 만들지 않음
                 try:
-                    # 이미 base64 인코딩된 키인지 확인
-                    key = key_str.encode() if isinstance(key_str, str) else key_str
-                    # Fernet 키 형식 검증을 위해 임시로 Fernet 객체 생성 시도
-                    Fernet(key)
-                except ValueError:
+                    key_raw = base64.urlsafe_b64decode(key)
+                except ValueError:  # binascii.Error 포함
+                    key_raw = None
+                if key_raw is None or len(key_raw) != 32:
                     # 유효하지 않은 키인 경우 새로 생성
+                    key_raw = None
                     import warnings
                     warnings.warn(
                         f"Invalid MASTER_ENCRYPTION_KEY format. Generating new key.",
@@ -153,15 +365,47 @@ class EncryptionService:
                     )
                     key = Fernet.generate_key()
         
+        # 기존 Fernet 암호문 복호화용
         self.cipher = Fernet(key)
+        aes_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=self._AESGCM_HKDF_INFO,
+        ).derive(key_raw if key_raw is not None else base64.urlsafe_b64decode(key))
+        self.aead = AesGcmEncryptionService(aes_key)
     
     def encrypt(self, plaintext: str) -> str:
-        """텍스트 암호화"""
-        return self.cipher.encrypt(plaintext.encode()).decode()
+        """텍스트 암호화 (AES-GCM)"""
+        return self.aead.encrypt(plaintext)
     
     def decrypt(self, ciphertext: str) -> str:
-        """텍스트 복호화"""
-        return self.cipher.decrypt(ciphertext.encode()).decode()
+        """텍스트 복호화 (AES-GCM 또는 기존 Fernet 암호문)"""
+        data = base64.urlsafe_b64decode(ciphertext)
+        if data[:1] == bytes([self._FERNET_VERSION]):
+            return self.cipher.decrypt(ciphertext.encode()).decode()
+        return self.aead.decrypt_bytes(data).decode()
+    
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """바이트 암호화 (AES-GCM, base64 없이 원시 바이트 반환)"""
+        return self.aead.encrypt_bytes(plaintext)
+    
+    def decrypt_bytes(self, ciphertext: bytes) -> bytes:
+        """바이트 복호화 (encrypt_bytes 결과 또는 base64 디코딩한 Fernet 토큰)"""
+        if ciphertext[:1] == bytes([self._FERNET_VERSION]):
+            return self.cipher.decrypt(base64.urlsafe_b64encode(ciphertext))
+        return self.aead.decrypt_bytes(ciphertext)
+
+
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bcrypt_executor() -> ThreadPoolExecutor:
+    """bcrypt 전용 스레드 풀 (로그인 폭주가 기본 executor의 다른 to_thread 작업을 막지 않도록 분리)"""
+    global _bcrypt_executor
+    if _bcrypt_executor is None:
+        _bcrypt_executor = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+    return _bcrypt_executor
 
 
 class PasswordService:
@@ -170,12 +414,38 @@ class PasswordService:
     @staticmethod
     def hash_password(password: str) -> str:
         """비밀번호 해싱 (bcrypt)"""
-        return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        return PasswordService.hash_password_bytes(password.encode()).decode()
+    
+    @staticmethod
+    def hash_password_bytes(password: bytes) -> bytes:
+        """비밀번호 해싱 (bytes 입력/출력, 인코딩 변환 없음)"""
+        # gensalt는 매 호출마다 새 16바이트 난수 솔트를 생성 (솔트는 재사용하지 않음)
+        return bcrypt.hashpw(password, bcrypt.gensalt(BCRYPT_COST))
     
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
         """비밀번호 검증"""
-        return bcrypt.checkpw(password.encode(), password_hash.encode())
+        return PasswordService.verify_password_bytes(password.encode(), password_hash.encode())
+    
+    @staticmethod
+    def verify_password_bytes(password: bytes, password_hash: bytes) -> bool:
+        """비밀번호 검증 (bytes 입력)"""
+        return bcrypt.checkpw(password, password_hash)
+    
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """비밀번호 해싱 (bcrypt 스레드 풀에서 실행, 이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        hashed = await loop.run_in_executor(_get_bcrypt_executor(), PasswordService.hash_password_bytes, password.encode())
+        return hashed.decode()
+    
+    @staticmethod
+    async def verify_password_async(password: str, password_hash: str) -> bool:
+        """비밀번호 검증 (bcrypt 스레드 풀에서 실행, 이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_bcrypt_executor(), bcrypt.checkpw, password.encode(), password_hash.encode()
+        )
 
 
 class JWTAuthService:
@@ -197,14 +467,14 @@ class JWTAuthService:
             email: 이메일
             role: 역할 (권한 체크용)
         """
-        expires_at = datetime.utcnow() + timedelta(minutes=JWT_ACCESS_EXPIRATION_MINUTES)
+        now = int(time.time())
         payload = {
             "sub": user_id,
             "email": email,
             "role": role,
             "type": "access",
-            "exp": expires_at,
-            "iat": datetime.utcnow(),
+            "exp": now + JWT_ACCESS_EXPIRATION_MINUTES * 60,
+            "iat": now,
         }
         return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     
@@ -215,15 +485,15 @@ class JWTAuthService:
         
         리프레시 토큰은 액세스 토큰 갱신에만 사용됩니다.
         """
-        expires_at = datetime.utcnow() + timedelta(days=JWT_REFRESH_EXPIRATION_DAYS)
+        now = int(time.time())
         token_id = secrets.token_urlsafe(16)  # 토큰 고유 ID (폐기용)
         payload = {
             "sub": user_id,
             "email": email,
             "type": "refresh",
             "jti": token_id,  # JWT ID (토큰 폐기용)
-            "exp": expires_at,
-            "iat": datetime.utcnow(),
+            "exp": now + JWT_REFRESH_EXPIRATION_DAYS * 86400,
+            "iat": now,
         }
         return jwt.encode(payload, JWT_REFRESH_SECRET_KEY, algorithm=JWT_ALGORITHM)
     
@@ -254,7 +524,7 @@ class JWTAuthService:
     def verify_token(token: str) -> Optional[dict]:
         """JWT 액세스 토큰 검증"""
         try:
-            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+            payload = _decode_cached(token, JWT_SECRET_KEY)
             # 액세스 토큰인지 확인
             if payload.get("type") != "access":
                 # 이전 버전 토큰 (type 없음)도 허용
@@ -268,7 +538,7 @@ class JWTAuthService:
     def verify_refresh_token(token: str) -> Optional[dict]:
         """JWT 리프레시 토큰 검증"""
         try:
-            payload = jwt.decode(token, JWT_REFRESH_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+            payload = _decode_cached(token, JWT_REFRESH_SECRET_KEY)
             # 리프레시 토큰인지 확인
             if payload.get("type") != "refresh":
                 return None
@@ -292,6 +562,10 @@ class JWTAuthService:
     def get_gateway_jwks() -> dict:
         return gateway_jwks_service.jwks()
 
+    @staticmethod
+    def get_gateway_jwks_json() -> bytes:
+        return gateway_jwks_service.jwks_json()
+
     @staticmethod
     def create_gateway_workspace_token(
         user_id: str,
@@ -323,6 +597,14 @@ class SSHAuthService:
         """SSH 비공개키 복호화"""
         return self.encryption.decrypt(encrypted_key)
     
+    def encrypt_private_key_bytes(self, private_key: bytes) -> bytes:
+        """SSH 비공개키 암호화 (bytes)"""
+        return self.encryption.encrypt_bytes(private_key)
+    
+    def decrypt_private_key_bytes(self, encrypted_key: bytes) -> bytes:
+        """SSH 비공개키 복호화 (bytes)"""
+        return self.encryption.decrypt_bytes(encrypted_key)
+    
     def get_key_fingerprint(self, public_key: str) -> str:
         """
         SSH 공개키 지문 생성 (SHA-256)
@@ -334,17 +616,40 @@ class SSHAuthService:
             SHA-256 해시 (hex)
         """
         # SSH 공개키 형식: "ssh-rsa AAAAB3NzaC1yc2E... comment"
-        parts = public_key.strip().split()
+        # split()은 앞뒤 공백을 무시하므로 strip() 불필요, 주석 부분은 나누지 않음
+        parts = public_key.split(maxsplit=2)
         if len(parts) < 2:
             raise ValueError("Invalid SSH public key format")
         
-        # Base64 인코딩된 키 부분 추출
-        key_part = parts[1]
+        # Base64 인코딩된 키 부분 (base64 모듈 래퍼 대신 C 구현 binascii 직접 사용)
         try:
-            key_bytes = base64.b64decode(key_part)
-            return hashlib.sha256(key_bytes).hexdigest()
-        except Exception as e:
+            key_bytes = binascii.a2b_base64(parts[1])
+        except (binascii.Error, ValueError) as e:
             raise ValueError(f"Failed to decode SSH public key: {e}")
+        return hashlib.sha256(key_bytes).hexdigest()
+    
+    @staticmethod
+    def fingerprint_many(public_keys: Iterable[str]) -> List[Optional[str]]:
+        """
+        SSH 공개키 지문 일괄 생성 (디렉토리 가져오기 등 대량 처리용)
+        
+        get_key_fingerprint와 같은 값을 반환하되, 형식이 잘못된 키는 예외 대신 None으로 표시해
+        한 건의 오류로 전체 작업이 중단되지 않도록 한다.
+        """
+        a2b = binascii.a2b_base64
+        sha256 = hashlib.sha256
+        fingerprints: List[Optional[str]] = []
+        append = fingerprints.append
+        for public_key in public_keys:
+            parts = public_key.split(maxsplit=2)
+            if len(parts) < 2:
+                append(None)
+                continue
+            try:
+                append(sha256(a2b(parts[1])).hexdigest())
+            except (binascii.Error, ValueError):
+                append(None)
+        return fingerprints
     
     def generate_ssh_key_pair(self) -> Tuple[str, str]:
         """
@@ -353,29 +658,22 @@ class SSHAuthService:
         Returns:
             (private_key, public_key) 튜플
         """
-        # RSA 키 생성
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-        )
+        # Ed25519 키 생성 (RSA와 달리 소수 탐색이 없어 즉시 생성)
+        private_key = ed25519.Ed25519PrivateKey.generate()
         
-        # 비공개키를 PEM 형식으로 변환
+        # 비공개키를 OpenSSH PEM 형식으로 변환
         private_pem = private_key.private_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PrivateFormat.OpenSSH,
             encryption_algorithm=serialization.NoEncryption(),
         ).decode()
         
-        # 공개키 추출
-        public_key_obj = private_key.public_key()
-        public_ssh = public_key_obj.public_bytes(
+        # 공개키 추출 ("ssh-ed25519 AAAA..." 형식)
+        public_key = private_key.public_key().public_bytes(
             encoding=serialization.Encoding.OpenSSH,
             format=serialization.PublicFormat.OpenSSH,
         ).decode()
         
-        # SSH 형식으로 변환
-        public_key = f"ssh-rsa {base64.b64encode(public_ssh.encode()).decode()}"
-        
         return private_pem, public_key
 
 
@@ -384,6 +682,10 @@ class mTLSAuthService:
     
     def __init__(self, encryption_service: EncryptionService):
         self.encryption = encryption_service
+        # PEM SHA-256 앞 16바이트 → (만료 시각, subject, issuer). 파싱 실패는 캐시하지 않음
+        self._cert_info_cache: TTLCache[Tuple[datetime, str, str]] = TTLCache(
+            maxsize=CERT_INFO_CACHE_SIZE, ttl=CERT_INFO_CACHE_TTL
+        )
     
     def encrypt_certificate(self, cert: str, key: str) -> Tuple[str, str]:
         """인증서 및 키 암호화"""
@@ -397,6 +699,14 @@ class mTLSAuthService:
         key = self.encryption.decrypt(encrypted_key)
         return cert, key
     
+    def encrypt_certificate_bytes(self, cert: bytes, key: bytes) -> Tuple[bytes, bytes]:
+        """인증서 및 키 암호화 (bytes)"""
+        return self.encryption.encrypt_bytes(cert), self.encryption.encrypt_bytes(key)
+    
+    def decrypt_certificate_bytes(self, encrypted_cert: bytes, encrypted_key: bytes) -> Tuple[bytes, bytes]:
+        """인증서 및 키 복호화 (bytes)"""
+        return self.encryption.decrypt_bytes(encrypted_cert), self.encryption.decrypt_bytes(encrypted_key)
+    
     def validate_certificate(self, cert_pem: str) -> dict:
         """
         인증서 유효성 검증
@@ -409,16 +719,18 @@ class mTLSAuthService:
                 "issuer": str,
             }
         """
+        pem_bytes = cert_pem.encode()
+        cache_key = hashlib.sha256(pem_bytes).digest()[:16]
         try:
-            cert = x509.load_pem_x509_certificate(cert_pem.encode())
-            
-            # 만료일 확인
-            expires_at = cert.not_valid_after
-            
-            # 주체 정보
-            subject = cert.subject.rfc4514_string()
-            issuer = cert.issuer.rfc4514_string()
+            info = self._cert_info_cache.get(cache_key)
+            if info is None:
+                cert = x509.load_pem_x509_certificate(pem_bytes)
+                # 만료일, 주체 정보
+                info = (cert.not_valid_after, cert.subject.rfc4514_string(), cert.issuer.rfc4514_string())
+                self._cert_info_cache.set(cache_key, info)
+            expires_at, subject, issuer = info
             
+            # 만료 여부는 캐시 적중 시에도 매번 확인
             return {
                 "valid": datetime.utcnow() < expires_at,
                 "expires_at": expires_at.isoformat(),
@@ -432,6 +744,55 @@ class mTLSAuthService:
             }
 
 
+class RandomPool:
+    """
+    os.urandom 묶음 버퍼
+    
+    대량 발급 시 키마다 getrandom 시스템 콜을 하지 않도록 한 번에 크게 받아 잘라 쓴다.
+    - 한 번 내준 바이트는 다시 쓰지 않음
+    - fork된 자식 프로세스는 부모와 같은 버퍼를 갖게 되므로 fork 직후 버퍼를 버린다
+      (다른 스레드가 잡고 있던 잠금이 자식에 잠긴 채 복사될 수 있어 잠금도 새로 만든다)
+    """
+    
+    def __init__(self, block_size: int = 4096):
+        self._block_size = block_size
+        self._buffer = b""
+        self._offset = 0
+        self._lock = threading.Lock()
+        _random_pools.add(self)
+    
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+    
+    def take(self, n: int) -> bytes:
+        if n > self._block_size:
+            return os.urandom(n)
+        with self._lock:
+            if self._offset + n > len(self._buffer):
+                self._buffer = os.urandom(self._block_size)
+                self._offset = 0
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+        return chunk
+
+
+# fork 후 자식에서 초기화할 풀 (인스턴스마다 fork 훅을 등록하지 않도록 한 곳에서 관리)
+_random_pools: "weakref.WeakSet[RandomPool]" = weakref.WeakSet()
+
+
+def _reset_random_pools() -> None:
+    for pool in list(_random_pools):
+        pool.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_pools)
+
+_api_key_random_pool = RandomPool()
+
+
 class APIKeyAuthService:
     """API 키 인증 서비스"""
     
@@ -445,16 +806,33 @@ class APIKeyAuthService:
             - key: 평문 API 키 (한 번만 표시)
             - key_hash: 저장용 해시
         """
-        # URL-safe 랜덤 키 생성 (32바이트 = 256비트)
-        key = secrets.token_urlsafe(32)
+        # URL-safe 랜덤 키 생성 (32바이트 = 256비트, secrets.token_urlsafe(32)와 같은 형식)
+        key = base64.urlsafe_b64encode(_api_key_random_pool.take(32)).rstrip(b"=").decode()
         key_hash = hashlib.sha256(key.encode()).hexdigest()
         return key, key_hash
     
     @staticmethod
     def verify_api_key(key: str, key_hash: str) -> bool:
-        """API 키 검증"""
-        computed_hash = hashlib.sha256(key.encode()).hexdigest()
-        return secrets.compare_digest(computed_hash, key_hash)
+        """
+        API 키 검증
+        
+        계산한 해시를 hex로 다시 인코딩하지 않고, 저장된 hex 해시를 바이트로 풀어
+        32바이트 다이제스트끼리 상수 시간 비교한다.
+        """
+        try:
+            expected = bytes.fromhex(key_hash)
+        except (TypeError, ValueError):
+            return False
+        return APIKeyAuthService.verify_api_key_digest(key.encode(), expected)
+    
+    @staticmethod
+    def verify_api_key_digest(key: bytes, key_digest: bytes) -> bool:
+        """
+        API 키 검증 (bytes 입력, 32바이트 SHA-256 다이제스트와 비교)
+        
+        해시를 바이너리(bytea 등)로 저장하는 경우 hex 변환 없이 바로 사용한다.
+        """
+        return hmac.compare_digest(hashlib.sha256(key).digest(), key_digest)
     
     @staticmethod
     def rotate_api_key(old_key_hash: Optional[str] = None) -> Tuple[str, str]:
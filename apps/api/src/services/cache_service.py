@@ -6,14 +6,29 @@ Redis 기반 캐싱 레이어
 
 import json
 import os
-from typing import Optional, Any
+from typing import Any, Dict, List, Optional
 import redis.asyncio as redis
 from datetime import timedelta
 
+from ..utils import json as json_utils
+
 # Redis 연결 설정
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "10"))
 
+# 패턴 삭제 시 SCAN 1회당 조회 키 수
+_SCAN_COUNT = 1000
+
+# 역색인 집합(KEYS[1])에 등록된 키와 KEYS 전체를 삭제 (키 공간 탐색 없이 O(집합 크기))
+_DELETE_INDEXED_LUA = """
+local members = redis.call('SMEMBERS', KEYS[1])
+local n = redis.call('UNLINK', unpack(KEYS))
+for i = 1, #members, 1000 do
+    n = n + redis.call('UNLINK', unpack(members, i, math.min(i + 999, #members)))
+end
+return n
+"""
+
 
 class CacheService:
     """Redis 기반 캐시 서비스"""
@@ -21,6 +36,7 @@ class CacheService:
     def __init__(self):
         self._redis: Optional[redis.Redis] = None
         self._pool: Optional[redis.ConnectionPool] = None
+        self._del_indexed_script = None
     
     async def connect(self):
         """Redis 연결 초기화"""
@@ -28,15 +44,19 @@ class CacheService:
             self._pool = redis.ConnectionPool.from_url(
                 REDIS_URL,
                 max_connections=REDIS_POOL_SIZE,
-                decode_responses=True,
+                # JSON 값은 bytes 그대로 파싱하므로 응답 디코딩을 하지 않음
+                decode_responses=False,
             )
             self._redis = redis.Redis(connection_pool=self._pool)
+            # EVALSHA로 실행 (스크립트 캐시에 없으면 redis-py가 EVAL로 재시도)
+            self._del_indexed_script = self._redis.register_script(_DELETE_INDEXED_LUA)
     
     async def disconnect(self):
         """Redis 연결 종료"""
         if self._redis:
             await self._redis.close()
             self._redis = None
+            self._del_indexed_script = None
         if self._pool:
             await self._pool.disconnect()
             self._pool = None
@@ -46,14 +66,43 @@ class CacheService:
         if not self._redis:
             await self.connect()
         
-        value = await self._redis.get(key)
+        return self._decode(await self._redis.get(key))
+    
+    @staticmethod
+    def _decode(value: Optional[bytes]) -> Optional[Any]:
         if value is None:
             return None
-        
         try:
-            return json.loads(value)
+            return json_utils.loads(value)
         except json.JSONDecodeError:
-            return value
+            # JSON이 아닌 값은 기존과 같이 문자열로 반환
+            return value.decode()
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키를 MGET 한 번으로 조회 (keys와 같은 순서, 없으면 None)"""
+        if not keys:
+            return []
+        if not self._redis:
+            await self.connect()
+        
+        return [self._decode(value) for value in await self._redis.mget(keys)]
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None):
+        """여러 키를 파이프라인 한 번으로 저장"""
+        if not items:
+            return
+        if not self._redis:
+            await self.connect()
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                if isinstance(value, (dict, list)):
+                    value = json_utils.dumps(value)
+                if ttl:
+                    pipe.setex(key, ttl, value)
+                else:
+                    pipe.set(key, value)
+            await pipe.execute()
     
     async def set(
         self,
@@ -66,7 +115,7 @@ class CacheService:
             await self.connect()
         
         if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+            value = json_utils.dumps(value)
         
         if ttl:
             await self._redis.setex(key, ttl, value)
@@ -81,13 +130,49 @@ class CacheService:
         await self._redis.delete(key)
     
     async def delete_pattern(self, pattern: str):
-        """패턴에 맞는 키 삭제"""
+        """
+        패턴에 맞는 키 삭제
+        
+        KEYS나 서버 측 스크립트 안의 SCAN 루프는 키 공간 전체를 훑는 동안
+        Redis를 막으므로, 클라이언트에서 SCAN으로 나눠 조회하고 배치마다 UNLINK한다.
+        """
+        if not self._redis:
+            await self.connect()
+        
+        batch: List[bytes] = []
+        async for key in self._redis.scan_iter(match=pattern, count=_SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= _SCAN_COUNT:
+                await self._redis.unlink(*batch)
+                batch = []
+        if batch:
+            await self._redis.unlink(*batch)
+    
+    async def set_indexed(self, index_key: str, key: str, value: Any, ttl: int):
+        """
+        캐시 저장 + 역색인 집합에 키 등록 (왕복 1회)
+        
+        delete_indexed로 관련 키를 패턴 탐색 없이 한 번에 삭제할 수 있다.
+        색인 집합도 같은 TTL로 갱신해 값이 모두 만료되면 함께 사라진다.
+        """
+        if not self._redis:
+            await self.connect()
+        
+        if isinstance(value, (dict, list)):
+            value = json_utils.dumps(value)
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, value)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+    
+    async def delete_indexed(self, index_key: str, *keys: str):
+        """역색인 집합에 등록된 키, keys, 색인 집합 자체를 삭제 (왕복 1회)"""
         if not self._redis:
             await self.connect()
         
-        keys = await self._redis.keys(pattern)
-        if keys:
-            await self._redis.delete(*keys)
+        await self._del_indexed_script(keys=[index_key, *keys])
     
     # 워크스페이스 관련 캐시 헬퍼 메서드
     
@@ -99,6 +184,18 @@ class CacheService:
         """워크스페이스 목록 캐시 저장 (5분 TTL)"""
         await self.set(f"workspace:list:{user_id}", workspaces, ttl=ttl)
     
+    async def get_workspace_lists(self, user_ids: List[str]) -> Dict[str, Optional[list]]:
+        """여러 사용자의 워크스페이스 목록 캐시 일괄 조회 (왕복 1회)"""
+        values = await self.get_many([f"workspace:list:{user_id}" for user_id in user_ids])
+        return dict(zip(user_ids, values))
+    
+    async def set_workspace_lists(self, workspaces_by_user: Dict[str, list], ttl: int = 300):
+        """여러 사용자의 워크스페이스 목록 캐시 일괄 저장 (5분 TTL, 왕복 1회)"""
+        await self.set_many(
+            {f"workspace:list:{user_id}": workspaces for user_id, workspaces in workspaces_by_user.items()},
+            ttl=ttl,
+        )
+    
     async def invalidate_workspace_list(self, user_id: str):
         """워크스페이스 목록 캐시 무효화"""
         await self.delete(f"workspace:list:{user_id}")
@@ -109,13 +206,14 @@ class CacheService:
     
     async def set_file_tree(self, workspace_id: str, tree: dict, ttl: int = 60):
         """파일 트리 캐시 저장 (1분 TTL)"""
-        await self.set(f"workspace:tree:{workspace_id}", tree, ttl=ttl)
+        await self.set_indexed(
+            f"workspace:tree:index:{workspace_id}", f"workspace:tree:{workspace_id}", tree, ttl=ttl
+        )
     
     async def invalidate_file_tree(self, workspace_id: str):
         """파일 트리 캐시 무효화"""
-        await self.delete(f"workspace:tree:{workspace_id}")
-        # 패턴으로 관련 캐시도 삭제
-        await self.delete_pattern(f"workspace:tree:{workspace_id}:*")
+        # 색인에 등록된 관련 캐시와 트리 키를 함께 삭제 (색인 도입 전에 저장된 트리 키 포함)
+        await self.delete_indexed(f"workspace:tree:index:{workspace_id}", f"workspace:tree:{workspace_id}")
 
 
 # 전역 인스턴스
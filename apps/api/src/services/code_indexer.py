@@ -9,8 +9,12 @@
 import os
 import logging
 import asyncio
+import multiprocessing
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Deque, Dict, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import hashlib
@@ -23,6 +27,7 @@ from .embedding_service import (
     get_code_chunker,
 )
 from .vector_store import VectorStoreService, get_vector_store
+from ..utils.chunk_worker import chunk_worker, init_chunk_worker, read_and_chunk
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,101 @@ MAX_FILE_SIZE = 1024 * 1024  # 1MB
 # 배치 크기
 EMBEDDING_BATCH_SIZE = 32
 
+# 파일 스캔 스레드 수 (최상위 하위 디렉토리 단위로 병렬 탐색)
+INDEX_SCAN_WORKERS = int(os.getenv("INDEX_SCAN_WORKERS", "8"))
+
+# 전체 인덱싱 시 동시에 읽기/청킹할 파일 수
+INDEX_READ_CONCURRENCY = int(os.getenv("INDEX_READ_CONCURRENCY", "32"))
+
+# 청킹 프로세스 수 (CPU 작업이므로 GIL을 피해 프로세스로 분산, 0이면 스레드에서 청킹)
+# API 워커마다 풀이 생기므로 기본은 CPU 수와 4 중 작은 값
+INDEX_CHUNK_PROCESSES = int(os.getenv("INDEX_CHUNK_PROCESSES", str(min(4, os.cpu_count() or 1))))
+
+# 업서트와 겹쳐서 미리 실행할 임베딩 배치 수 (임베딩/벡터 저장 파이프라인 깊이)
+INDEX_EMBED_PIPELINE_DEPTH = int(os.getenv("INDEX_EMBED_PIPELINE_DEPTH", "2"))
+
+# 동시에 실행할 워크스페이스 인덱싱 작업 수 (API 이벤트 루프/임베딩 자원 보호)
+INDEXING_MAX_CONCURRENCY = int(os.getenv("INDEXING_MAX_CONCURRENCY", "2"))
+
+
+# ============================================================
+# 파일 스캔
+# ============================================================
+
+def _scan_directory(
+    dir_path: str,
+    files: List[Tuple[str, os.stat_result]],
+    subdirs: Optional[List[str]] = None,
+) -> None:
+    """
+    os.scandir 기반 DFS로 인덱싱 대상 파일과 stat 결과 수집
+    
+    - 무시 디렉토리는 내려가지 않고 건너뜀 (파일마다 상위 경로를 다시 검사하지 않음)
+    - 심볼릭 링크는 따라가지 않음 (워크스페이스 밖 파일 인덱싱 방지)
+    - subdirs가 주어지면 하위 디렉토리는 탐색하지 않고 목록만 담는다 (병렬 분배용)
+    """
+    stack = [dir_path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in IGNORE_DIRECTORIES:
+                                (subdirs if subdirs is not None else stack).append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            name = entry.name
+                            if name in IGNORE_FILES or os.path.splitext(name)[1].lower() not in INDEXABLE_EXTENSIONS:
+                                continue
+                            stat = entry.stat(follow_symlinks=False)
+                            if stat.st_size <= MAX_FILE_SIZE:
+                                files.append((entry.path, stat))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _scan_subtree(dir_path: str) -> List[Tuple[str, os.stat_result]]:
+    files: List[Tuple[str, os.stat_result]] = []
+    _scan_directory(dir_path, files)
+    return files
+
+
+def _chunk_payloads(chunks: List[CodeChunk], **scope: Any) -> List[Dict[str, Any]]:
+    """청크별 벡터 저장 payload (청크 필드 + 공통 스코프 필드)"""
+    return [
+        {
+            "content": chunk.content,
+            "file_path": chunk.file_path,
+            "start_line": chunk.start_line,
+            "end_line": chunk.end_line,
+            "language": chunk.language,
+            "workspace_id": chunk.workspace_id,
+            "metadata": chunk.metadata,
+            **scope,
+        }
+        for chunk in chunks
+    ]
+
+
+def _file_sha256(path: Path) -> str:
+    """파일 SHA-256 (전체를 bytes로 올리지 않고 버퍼 단위로 스트리밍)"""
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _hash_files(paths: List[Path]) -> List[Optional[str]]:
+    """파일별 SHA-256 (읽기 실패 시 None) - 스레드에서 한 번에 실행"""
+    hashes: List[Optional[str]] = []
+    for path in paths:
+        try:
+            hashes.append(_file_sha256(path))
+        except OSError as e:
+            logger.warning(f"Failed to check file {path}: {e}")
+            hashes.append(None)
+    return hashes
+
 
 # ============================================================
 # 데이터 클래스
@@ -73,7 +173,7 @@ class IndexingProgress:
     indexed_files: int = 0
     total_chunks: int = 0
     indexed_chunks: int = 0
-    status: str = "pending"  # pending, running, completed, failed
+    status: str = "pending"  # pending, queued, running, completed, failed
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
@@ -108,60 +208,122 @@ class CodeIndexerService:
         self._embedding_service: Optional[EmbeddingService] = None
         self._vector_store: Optional[VectorStoreService] = None
         self._progress: Dict[str, IndexingProgress] = {}
+        # 워크스페이스별 실행 중인 인덱싱 작업
+        self._jobs: Dict[str, asyncio.Task] = {}
+        # 실행 중인 작업이 끝난 뒤 이어서 실행할 강제 재인덱싱 요청 (workspace_id → 작업 인자)
+        self._pending_force: Dict[str, Tuple[str, Optional[str], str]] = {}
+        self._job_semaphore = asyncio.Semaphore(max(1, INDEXING_MAX_CONCURRENCY))
+        # 청킹 프로세스 풀 (initialize에서 생성, 없으면 스레드에서 청킹)
+        self._chunk_pool: Optional[ProcessPoolExecutor] = None
     
     async def initialize(self):
         """서비스 초기화"""
         self._chunker = get_code_chunker()
         self._embedding_service = await get_embedding_service()
         self._vector_store = await get_vector_store()
+        if INDEX_CHUNK_PROCESSES > 0 and self._chunk_pool is None:
+            # 이벤트 루프/스레드 풀이 떠 있는 프로세스를 fork하지 않도록 spawn 사용 (워커는 첫 작업 시 시작)
+            self._chunk_pool = ProcessPoolExecutor(
+                max_workers=INDEX_CHUNK_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_chunk_worker,
+            )
         logger.info("Code indexer initialized")
     
-    def _should_index_file(self, file_path: Path) -> bool:
-        """파일 인덱싱 여부 확인"""
-        # 확장자 확인
-        if file_path.suffix.lower() not in INDEXABLE_EXTENSIONS:
-            return False
+    async def _scan_files(self, workspace_path: str) -> List[Tuple[Path, os.stat_result]]:
+        """
+        워크스페이스 파일 스캔 (경로, stat)
         
-        # 파일명 확인
-        if file_path.name in IGNORE_FILES:
-            return False
+        디렉토리 탐색/stat은 I/O 대기 위주이므로 이벤트 루프 밖 스레드에서 실행하고,
+        최상위 하위 디렉토리들은 INDEX_SCAN_WORKERS개 스레드로 동시에 탐색한다.
+        """
+        if not os.path.isdir(workspace_path):
+            logger.warning(f"Workspace path not found: {workspace_path}")
+            return []
         
-        # 파일 크기 확인
-        try:
-            if file_path.stat().st_size > MAX_FILE_SIZE:
-                return False
-        except OSError:
-            return False
+        loop = asyncio.get_running_loop()
+        root_files: List[Tuple[str, os.stat_result]] = []
+        subdirs: List[str] = []
+        with ThreadPoolExecutor(max_workers=max(1, INDEX_SCAN_WORKERS), thread_name_prefix="index-scan") as pool:
+            await loop.run_in_executor(pool, _scan_directory, workspace_path, root_files, subdirs)
+            subtrees = await asyncio.gather(*(loop.run_in_executor(pool, _scan_subtree, d) for d in subdirs))
         
-        return True
-    
-    def _should_skip_directory(self, dir_path: Path) -> bool:
-        """디렉토리 스킵 여부 확인"""
-        return dir_path.name in IGNORE_DIRECTORIES
+        return [(Path(path), stat) for part in (root_files, *subtrees) for path, stat in part]
     
     async def scan_workspace(self, workspace_path: str) -> List[Path]:
         """워크스페이스 파일 스캔"""
-        root = Path(workspace_path)
-        if not root.exists():
-            logger.warning(f"Workspace path not found: {workspace_path}")
-            return []
-        
-        files = []
-        for path in root.rglob("*"):
-            if path.is_file():
-                # 무시할 디렉토리 확인
-                skip = False
-                for parent in path.parents:
-                    if self._should_skip_directory(parent):
-                        skip = True
-                        break
-                
-                if not skip and self._should_index_file(path):
-                    files.append(path)
-        
+        files = [path for path, _ in await self._scan_files(workspace_path)]
         logger.info(f"Scanned {len(files)} indexable files in {workspace_path}")
         return files
     
+    async def _chunk_file_off_loop(self, file_path: Path, workspace_path: str, workspace_id: str) -> List[CodeChunk]:
+        """파일 읽기 + 청킹 (프로세스 풀, 풀이 없거나 손상되면 스레드)"""
+        if self._chunk_pool is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._chunk_pool, chunk_worker, str(file_path), workspace_path, workspace_id
+                )
+            except BrokenProcessPool:
+                logger.warning("Chunk process pool is broken, falling back to threads")
+                self._chunk_pool = None
+        return await asyncio.to_thread(read_and_chunk, self._chunker, file_path, workspace_path, workspace_id)
+
+    def shutdown(self) -> None:
+        """청킹 프로세스 풀 종료 (앱 종료 시)"""
+        if self._chunk_pool is not None:
+            self._chunk_pool.shutdown(wait=False, cancel_futures=True)
+            self._chunk_pool = None
+
+    async def _embed_and_upsert(
+        self,
+        chunks: List[CodeChunk],
+        tenant_id: Optional[str],
+        project_id: Optional[str],
+        progress: IndexingProgress,
+    ) -> int:
+        """
+        배치 임베딩 + 벡터 저장 파이프라인
+
+        임베딩 태스크는 소비자(이 루프)에서만 만들고 실행 중인 임베딩을 INDEX_EMBED_PIPELINE_DEPTH개로 제한한다.
+        배치 N의 임베딩 결과를 받으면 다음 배치 임베딩을 시작한 뒤 배치 N을 업서트하므로 두 작업이 겹친다.
+        """
+        depth = max(1, INDEX_EMBED_PIPELINE_DEPTH)
+        batches = (chunks[i:i + EMBEDDING_BATCH_SIZE] for i in range(0, len(chunks), EMBEDDING_BATCH_SIZE))
+        # (배치, 임베딩 태스크) - 배치 순서대로 업서트
+        in_flight: Deque[Tuple[List[CodeChunk], asyncio.Task]] = deque()
+
+        def _fill() -> None:
+            while len(in_flight) < depth:
+                batch = next(batches, None)
+                if batch is None:
+                    return
+                in_flight.append((batch, asyncio.create_task(self._embedding_service.embed_chunks(batch))))
+
+        total = 0
+        try:
+            _fill()
+            while in_flight:
+                batch, embed_task = in_flight.popleft()
+                embedding_results = await embed_task
+                _fill()
+
+                chunk_ids = [r.chunk_id for r in embedding_results]
+                embeddings = [r.embedding for r in embedding_results]
+                payloads = _chunk_payloads(batch, project_id=project_id, tenant_id=tenant_id)
+                await self._vector_store.upsert_embeddings(
+                    chunk_ids=chunk_ids,
+                    embeddings=embeddings,
+                    payloads=payloads,
+                )
+
+                progress.indexed_chunks += len(batch)
+                total += len(batch)
+        finally:
+            # 실패/취소 시 실행 중인 임베딩 태스크 정리
+            for _, embed_task in in_flight:
+                embed_task.cancel()
+        return total
+
     async def index_workspace(
         self,
         workspace_id: str,
@@ -202,67 +364,29 @@ class CodeIndexerService:
                     success=True,
                 )
             
-            # 파일별 청킹 및 인덱싱
-            total_chunks = 0
+            # 파일별 읽기/청킹 (프로세스 풀에서 동시 실행, 동시 파일 수는 INDEX_READ_CONCURRENCY로 제한)
             all_chunks = []
-            
-            for file_path in files:
-                try:
-                    # 파일 읽기
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    
-                    # 상대 경로 계산
-                    relative_path = str(file_path.relative_to(workspace_path))
-                    
-                    # 청킹
-                    chunks = self._chunker.chunk_file(
-                        content=content,
-                        file_path=relative_path,
-                        workspace_id=workspace_id,
-                    )
-                    
-                    all_chunks.extend(chunks)
-                    progress.indexed_files += 1
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process file {file_path}: {e}")
+            read_semaphore = asyncio.Semaphore(max(1, INDEX_READ_CONCURRENCY))
+
+            async def _process(file_path: Path) -> Optional[List[CodeChunk]]:
+                async with read_semaphore:
+                    try:
+                        return await self._chunk_file_off_loop(file_path, workspace_path, workspace_id)
+                    except Exception as e:
+                        logger.warning(f"Failed to process file {file_path}: {e}")
+                        return None
+
+            # gather는 입력 순서대로 결과를 돌려주므로 청크 순서는 기존과 동일
+            for chunks in await asyncio.gather(*(_process(p) for p in files)):
+                if chunks is None:
                     continue
+                all_chunks.extend(chunks)
+                progress.indexed_files += 1
             
             progress.total_chunks = len(all_chunks)
             
             # 배치 임베딩 및 저장
-            for i in range(0, len(all_chunks), EMBEDDING_BATCH_SIZE):
-                batch = all_chunks[i:i + EMBEDDING_BATCH_SIZE]
-                
-                # 임베딩 생성
-                embedding_results = await self._embedding_service.embed_chunks(batch)
-                
-                # 벡터 저장소에 저장
-                chunk_ids = [r.chunk_id for r in embedding_results]
-                embeddings = [r.embedding for r in embedding_results]
-                payloads = [
-                    {
-                        "content": chunk.content,
-                        "file_path": chunk.file_path,
-                        "start_line": chunk.start_line,
-                        "end_line": chunk.end_line,
-                        "language": chunk.language,
-                        "workspace_id": chunk.workspace_id,
-                        "project_id": project_id,
-                        "tenant_id": tenant_id,
-                        "metadata": chunk.metadata,
-                    }
-                    for chunk in batch
-                ]
-                
-                await self._vector_store.upsert_embeddings(
-                    chunk_ids=chunk_ids,
-                    embeddings=embeddings,
-                    payloads=payloads,
-                )
-                
-                progress.indexed_chunks += len(batch)
-                total_chunks += len(batch)
+            total_chunks = await self._embed_and_upsert(all_chunks, tenant_id, project_id, progress)
             
             # 완료
             end_time = datetime.now(timezone.utc)
@@ -331,8 +455,9 @@ class CodeIndexerService:
                 await db.execute(delete(WorkspaceFileIndexModel).where(WorkspaceFileIndexModel.workspace_id == workspace_id))
                 await db.commit()
 
-            files = await self.scan_workspace(workspace_path)
-            progress.total_files = len(files)
+            # 스캔 시 얻은 stat을 그대로 사용 (파일마다 stat을 다시 호출하지 않음)
+            scanned = await self._scan_files(workspace_path)
+            progress.total_files = len(scanned)
 
             # 기존 메타 로드
             existing_rows = await db.execute(
@@ -342,44 +467,45 @@ class CodeIndexerService:
 
             current_paths: Set[str] = set()
             changed_files: List[str] = []
+            # mtime/size가 달라 내용 비교가 필요한 기존 파일: (상대 경로, 경로, stat, 기존 메타)
+            candidates: List[Tuple[str, Path, os.stat_result, Any]] = []
 
-            for file_path in files:
-                try:
-                    relative_path = str(file_path.relative_to(workspace_path))
-                    current_paths.add(relative_path)
-
-                    stat = file_path.stat()
-                    mtime_ns = getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1e9))
-                    size_bytes = stat.st_size
-
-                    # 빠른 판단: mtime/size가 동일하면 skip
-                    prev = existing.get(relative_path)
-                    if prev and prev.mtime_ns == mtime_ns and prev.size_bytes == size_bytes:
-                        continue
-
-                    # 강한 판단: sha256 비교
-                    content = file_path.read_bytes()
-                    sha = hashlib.sha256(content).hexdigest()
-
-                    if prev and prev.sha256 == sha:
-                        # 내용은 같고 mtime만 바뀐 경우 메타만 갱신
-                        prev.mtime_ns = mtime_ns
-                        prev.size_bytes = size_bytes
-                        continue
+            for file_path, stat in scanned:
+                relative_path = str(file_path.relative_to(workspace_path))
+                current_paths.add(relative_path)
 
+                prev = existing.get(relative_path)
+                if prev is None:
+                    # 새 파일은 항상 인덱싱 (해시는 index_file_with_scope에서 계산)
                     changed_files.append(relative_path)
-                except Exception as e:
-                    logger.warning(f"Failed to check file {file_path}: {e}")
                     continue
+                # 빠른 판단: mtime/size가 동일하면 skip
+                if prev.mtime_ns == stat.st_mtime_ns and prev.size_bytes == stat.st_size:
+                    continue
+                candidates.append((relative_path, file_path, stat, prev))
+
+            # 강한 판단: sha256 비교 (스레드에서 한 번에 해싱)
+            hashes: List[Optional[str]] = []
+            if candidates:
+                hashes = await asyncio.to_thread(_hash_files, [c[1] for c in candidates])
+            for (relative_path, _, stat, prev), sha in zip(candidates, hashes):
+                if sha is None:
+                    continue
+                if prev.sha256 == sha:
+                    # 내용은 같고 mtime만 바뀐 경우 메타만 갱신
+                    prev.mtime_ns = stat.st_mtime_ns
+                    prev.size_bytes = stat.st_size
+                    continue
+                changed_files.append(relative_path)
 
-            # 삭제된 파일 처리
-            removed_paths = set(existing.keys()) - current_paths
-            for p in removed_paths:
-                await self._vector_store.delete_by_file(workspace_id, p)
+            # 삭제된 파일 처리 (벡터 저장소/메타 테이블 모두 한 번의 요청으로 삭제)
+            removed_paths = sorted(existing.keys() - current_paths)
+            if removed_paths:
+                await self._vector_store.delete_by_files(workspace_id, removed_paths)
                 await db.execute(
                     delete(WorkspaceFileIndexModel).where(
                         WorkspaceFileIndexModel.workspace_id == workspace_id,
-                        WorkspaceFileIndexModel.file_path == p,
+                        WorkspaceFileIndexModel.file_path.in_(removed_paths),
                     )
                 )
 
@@ -457,18 +583,7 @@ class CodeIndexerService:
             
             chunk_ids = [r.chunk_id for r in embedding_results]
             embeddings = [r.embedding for r in embedding_results]
-            payloads = [
-                {
-                    "content": chunk.content,
-                    "file_path": chunk.file_path,
-                    "start_line": chunk.start_line,
-                    "end_line": chunk.end_line,
-                    "language": chunk.language,
-                    "workspace_id": chunk.workspace_id,
-                    "metadata": chunk.metadata,
-                }
-                for chunk in chunks
-            ]
+            payloads = _chunk_payloads(chunks)
             
             await self._vector_store.upsert_embeddings(
                 chunk_ids=chunk_ids,
@@ -506,6 +621,8 @@ class CodeIndexerService:
             # 기존 파일 임베딩 삭제
             await self._vector_store.delete_by_file(workspace_id, file_path)
 
+            # 읽기 전에 stat: 읽는 도중 파일이 바뀌면 다음 스캔에서 mtime 불일치로 다시 해싱됨
+            stat = full_path.stat()
             content_bytes = full_path.read_bytes()
             sha = hashlib.sha256(content_bytes).hexdigest()
             content = content_bytes.decode("utf-8", errors="ignore")
@@ -519,24 +636,10 @@ class CodeIndexerService:
                 embedding_results = await self._embedding_service.embed_chunks(chunks)
                 chunk_ids = [r.chunk_id for r in embedding_results]
                 embeddings = [r.embedding for r in embedding_results]
-                payloads = [
-                    {
-                        "content": chunk.content,
-                        "file_path": chunk.file_path,
-                        "start_line": chunk.start_line,
-                        "end_line": chunk.end_line,
-                        "language": chunk.language,
-                        "workspace_id": chunk.workspace_id,
-                        "project_id": project_id,
-                        "tenant_id": tenant_id,
-                        "metadata": chunk.metadata,
-                    }
-                    for chunk in chunks
-                ]
+                payloads = _chunk_payloads(chunks, project_id=project_id, tenant_id=tenant_id)
                 await self._vector_store.upsert_embeddings(chunk_ids=chunk_ids, embeddings=embeddings, payloads=payloads)
 
-            stat = full_path.stat()
-            mtime_ns = getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1e9))
+            mtime_ns = stat.st_mtime_ns
             size_bytes = stat.st_size
 
             row = await db.execute(
@@ -571,6 +674,77 @@ class CodeIndexerService:
             await db.rollback()
             return False
     
+    def start_incremental_indexing(
+        self,
+        workspace_id: str,
+        workspace_path: str,
+        tenant_id: Optional[str],
+        project_id: str,
+        force_reindex: bool = False,
+    ) -> bool:
+        """
+        증분 인덱싱 작업 시작 (요청 수명과 분리된 태스크)
+
+        - 요청 DB 세션 대신 작업 전용 세션을 사용한다.
+        - 동시 실행 작업 수는 INDEXING_MAX_CONCURRENCY로 제한한다.
+        - 세마포어를 기다리는 동안에도 상태 조회가 가능하도록 queued 진행 상태를 먼저 등록한다.
+        - 같은 워크스페이스 작업이 이미 실행 중이면:
+          - force_reindex=True: 현재 작업이 끝난 뒤 강제 재인덱싱을 실행하도록 예약하고 True 반환
+          - 그 외: 새로 시작하지 않고 False 반환 (호출 측은 현재 진행 상태를 응답)
+        """
+        job = self._jobs.get(workspace_id)
+        if job is not None and not job.done():
+            if not force_reindex:
+                return False
+            self._pending_force[workspace_id] = (workspace_path, tenant_id, project_id)
+            return True
+
+        self._progress[workspace_id] = IndexingProgress(workspace_id=workspace_id, status="queued")
+        task = asyncio.create_task(
+            self._run_indexing_job(workspace_id, workspace_path, tenant_id, project_id, force_reindex)
+        )
+        self._jobs[workspace_id] = task
+
+        def _on_done(t: asyncio.Task) -> None:
+            if self._jobs.get(workspace_id) is t:
+                del self._jobs[workspace_id]
+            pending = self._pending_force.pop(workspace_id, None)
+            if pending is not None:
+                self.start_incremental_indexing(workspace_id, *pending, force_reindex=True)
+
+        task.add_done_callback(_on_done)
+        return True
+
+    async def _run_indexing_job(
+        self,
+        workspace_id: str,
+        workspace_path: str,
+        tenant_id: Optional[str],
+        project_id: str,
+        force_reindex: bool,
+    ) -> None:
+        from ..db.connection import AsyncSessionLocal
+
+        async with self._job_semaphore:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.index_workspace_incremental(
+                        workspace_id=workspace_id,
+                        workspace_path=workspace_path,
+                        db=db,
+                        tenant_id=tenant_id,
+                        project_id=project_id,
+                        force_reindex=force_reindex,
+                    )
+            except Exception as e:
+                logger.error(f"Indexing job failed for {workspace_id}: {e}")
+                progress = self._progress.get(workspace_id)
+                if progress is not None and progress.status == "queued":
+                    # 인덱싱 시작 전(세션 생성 등)에 실패하면 queued 상태로 남지 않도록 정리
+                    progress.status = "failed"
+                    progress.error = str(e)
+                    progress.completed_at = datetime.now(timezone.utc)
+
     def get_progress(self, workspace_id: str) -> Optional[IndexingProgress]:
         """인덱싱 진행 상태 조회"""
         return self._progress.get(workspace_id)
@@ -13,6 +13,7 @@ Cursor의 핵심 기능 중 하나인 Context Builder를 구현합니다.
 """
 
 import os
+import heapq
 import logging
 from typing import List, Optional, Dict, Any, Literal, Tuple
 from dataclasses import dataclass, field
@@ -552,23 +553,16 @@ class ContextBuilderService:
         # 파일별로 그룹화하고 최고 점수 사용
         file_scores: Dict[str, float] = {}
         for result in results:
-            if result.file_path not in file_scores:
+            prev = file_scores.get(result.file_path)
+            if prev is None or result.score > prev:
                 file_scores[result.file_path] = result.score
-            else:
-                file_scores[result.file_path] = max(
-                    file_scores[result.file_path], result.score
-                )
         
-        # 점수 순 정렬
-        sorted_files = sorted(
-            file_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+        # 상위 limit개만 선택 (전체 정렬 대신 O(N log k))
+        top_files = heapq.nlargest(limit, file_scores.items(), key=lambda x: x[1])
         
         return [
             {"file_path": fp, "relevance_score": score}
-            for fp, score in sorted_files
+            for fp, score in top_files
         ]
 
 
@@ -0,0 +1,280 @@
+"""
+Git 저장소 클론 작업 서비스
+
+대형 저장소 클론은 프록시/로드밸런서 타임아웃을 넘기기 쉬우므로
+POST /api/workspaces/clone은 작업만 등록하고 즉시 응답하며, 클론은 요청 수명과 분리된 태스크로 실행한다.
+진행 상태는 GET /api/workspaces/clone/status/{workspace_id}로 조회한다.
+
+- 작업 상태: pending → cloning → ready | failed
+- 같은 사용자의 같은 저장소/브랜치 클론이 진행 중이면 기존 작업을 재사용
+- 단일 이벤트 루프에서 확인/등록 사이에 await가 없으므로 락을 사용하지 않는다.
+"""
+
+import os
+import re
+import time
+import shutil
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+# git clone 타임아웃 (초)
+GIT_CLONE_TIMEOUT = int(os.getenv("GIT_CLONE_TIMEOUT", "300"))
+
+# 종료된 작업 상태 보관 시간 (초)
+GIT_CLONE_JOB_RETENTION = int(os.getenv("GIT_CLONE_JOB_RETENTION", "3600"))
+
+# 실패 시 응답에 포함할 stderr 최대 길이
+_STDERR_TAIL_BYTES = 500
+# stderr 읽기 단위 / 보관할 최근 청크 수
+_STDERR_READ_SIZE = 4096
+_STDERR_TAIL_CHUNKS = 8
+
+_ACTIVE_STATUSES = frozenset({"pending", "cloning"})
+
+# 기본 클론 옵션: HEAD 작업 트리만 필요하므로 히스토리/태그/미사용 blob을 받지 않음
+_SHALLOW_CLONE_ARGS = ["--depth=1", "--single-branch", "--filter=blob:none", "--no-tags"]
+
+# 인증 정보가 없을 때 자격 증명 프롬프트로 타임아웃까지 멈추지 않도록 비활성화
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+# ============================================================
+# 데이터 클래스
+# ============================================================
+
+@dataclass
+class CloneJob:
+    """클론 작업 상태"""
+    workspace_id: str
+    owner_id: str
+    repository_url: str
+    branch: Optional[str] = None
+    status: str = "pending"  # pending, cloning, ready, failed
+    error: Optional[str] = None
+    # git stderr의 마지막 진행 줄 (예: "Receiving objects: 42% (420/1000)")
+    progress: Optional[str] = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    completed_at: Optional[datetime] = None
+    # 보관 기간 계산용 (monotonic)
+    _finished_monotonic: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def active(self) -> bool:
+        return self.status in _ACTIVE_STATUSES
+
+
+def _last_progress_line(chunk: bytes) -> Optional[str]:
+    """stderr 청크에서 마지막 진행 줄 추출 (git 진행률은 \r로 같은 줄을 갱신)"""
+    lines = [line for line in re.split(rb"[\r\n]", chunk) if line.strip()]
+    return lines[-1].decode(errors="replace").strip() if lines else None
+
+
+async def run_git_clone(
+    clone_cmd: List[str],
+    on_progress: Optional[Callable[[str], None]] = None,
+) -> Tuple[int, bytes]:
+    """
+    git clone 실행 (returncode, stderr 끝부분)
+
+    subprocess.run은 클론이 끝날 때까지 이벤트 루프 전체를 막으므로 비동기 서브프로세스로 실행한다.
+    - stdout은 사용하지 않으므로 DEVNULL
+    - stderr는 버퍼 전체를 모으지 않고 조금씩 읽어 최근 청크만 보관 (대형 저장소의 진행 로그 대비)
+    - on_progress에는 stderr의 마지막 진행 줄(예: "Receiving objects: 42% ...")을 전달
+    타임아웃/취소 시 프로세스를 종료하고 예외를 그대로 전달한다.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *clone_cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        env=_GIT_ENV,
+    )
+    tail: Deque[bytes] = deque(maxlen=_STDERR_TAIL_CHUNKS)
+
+    async def _drain_stderr() -> None:
+        while True:
+            chunk = await proc.stderr.read(_STDERR_READ_SIZE)
+            if not chunk:
+                break
+            tail.append(chunk)
+            if on_progress is not None:
+                line = _last_progress_line(chunk)
+                if line:
+                    on_progress(line)
+
+    try:
+        await asyncio.wait_for(asyncio.gather(_drain_stderr(), proc.wait()), timeout=GIT_CLONE_TIMEOUT)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, b"".join(tail)
+
+
+# ============================================================
+# 클론 작업 서비스
+# ============================================================
+
+class GitCloneService:
+    """백그라운드 git clone 작업 관리"""
+
+    def __init__(self):
+        self._jobs: Dict[str, CloneJob] = {}
+        # (owner_id, repository_url, branch, full_history) → 진행 중인 workspace_id
+        self._active_by_source: Dict[Tuple[str, str, Optional[str], bool], str] = {}
+        # 실행 중인 태스크 참조 보관 (GC로 태스크가 사라지지 않도록)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def get_job(self, workspace_id: str) -> Optional[CloneJob]:
+        """클론 작업 상태 조회"""
+        return self._jobs.get(workspace_id)
+
+    def find_active_job(
+        self,
+        owner_id: str,
+        repository_url: str,
+        branch: Optional[str],
+        full_history: bool = False,
+    ) -> Optional[CloneJob]:
+        """
+        같은 사용자의 같은 저장소/브랜치 클론이 진행 중이면 해당 작업 반환
+
+        얕은 클론과 전체 히스토리 클론은 결과가 다르므로 서로 재사용하지 않는다.
+        """
+        workspace_id = self._active_by_source.get((owner_id, repository_url, branch, full_history))
+        return self._jobs.get(workspace_id) if workspace_id else None
+
+    def start_clone(
+        self,
+        workspace_id: str,
+        owner_id: str,
+        repository_url: str,
+        branch: Optional[str],
+        workspace_root: Path,
+        on_success: Callable[[], Awaitable[None]],
+        full_history: bool = False,
+    ) -> CloneJob:
+        """
+        클론 작업 등록 및 시작
+
+        기본은 얕은/부분 클론(depth=1, blob:none)이며 full_history=True이면 전체 히스토리를 받는다.
+        on_success는 클론 완료 후 호출되며(DB 메타데이터 저장 등), 예외 발생 시 작업은 failed가 된다.
+        """
+        self._prune_finished()
+
+        job = CloneJob(
+            workspace_id=workspace_id,
+            owner_id=owner_id,
+            repository_url=repository_url,
+            branch=branch,
+        )
+        self._jobs[workspace_id] = job
+        source_key = (owner_id, repository_url, branch, full_history)
+        self._active_by_source[source_key] = workspace_id
+
+        # stderr가 TTY가 아니어도 진행률을 출력하도록 --progress 지정
+        clone_cmd = ["git", "clone", "--progress"]
+        if not full_history:
+            clone_cmd.extend(_SHALLOW_CLONE_ARGS)
+        if branch:
+            clone_cmd.extend(["-b", branch])
+        clone_cmd.extend([repository_url, str(workspace_root)])
+
+        task = asyncio.create_task(self._run_clone(job, clone_cmd, workspace_root, on_success))
+        self._tasks.add(task)
+
+        def _on_done(t: asyncio.Task) -> None:
+            self._tasks.discard(t)
+            if self._active_by_source.get(source_key) == workspace_id:
+                del self._active_by_source[source_key]
+
+        task.add_done_callback(_on_done)
+        return job
+
+    async def _run_clone(
+        self,
+        job: CloneJob,
+        clone_cmd: List[str],
+        workspace_root: Path,
+        on_success: Callable[[], Awaitable[None]],
+    ) -> None:
+        job.status = "cloning"
+        try:
+            returncode, stderr = await run_git_clone(clone_cmd, on_progress=lambda line: setattr(job, "progress", line))
+            if returncode != 0:
+                tail = stderr[-_STDERR_TAIL_BYTES:].decode(errors="replace").strip() if stderr else ""
+                self._fail(job, tail or "Unknown error")
+            else:
+                await on_success()
+                job.status = "ready"
+                logger.info(f"Repository cloned: {job.workspace_id} from {job.repository_url}")
+        except asyncio.TimeoutError:
+            self._fail(job, "Clone operation timed out")
+        except asyncio.CancelledError:
+            self._fail(job, "Clone cancelled")
+            await self._cleanup(workspace_root)
+            raise
+        except Exception as e:
+            logger.error(f"Clone job failed for {job.workspace_id}: {e}")
+            self._fail(job, str(e))
+        finally:
+            job.completed_at = datetime.now(timezone.utc)
+            job._finished_monotonic = time.monotonic()
+
+        if job.status == "failed":
+            await self._cleanup(workspace_root)
+
+    @staticmethod
+    def _fail(job: CloneJob, error: str) -> None:
+        job.status = "failed"
+        job.error = error
+        logger.warning(f"Clone failed: {job.workspace_id}, {error}")
+
+    @staticmethod
+    async def _cleanup(workspace_root: Path) -> None:
+        """실패한 클론 디렉토리 정리 (대형 트리 삭제가 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        await asyncio.to_thread(shutil.rmtree, workspace_root, ignore_errors=True)
+
+    def _prune_finished(self) -> None:
+        """보관 기간이 지난 종료 작업 제거"""
+        cutoff = time.monotonic() - GIT_CLONE_JOB_RETENTION
+        expired = [
+            ws_id for ws_id, job in self._jobs.items()
+            if job._finished_monotonic is not None and job._finished_monotonic < cutoff
+        ]
+        for ws_id in expired:
+            del self._jobs[ws_id]
+
+    async def shutdown(self) -> None:
+        """실행 중인 클론 작업 취소 (앱 종료 시)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ============================================================
+# 싱글톤 인스턴스
+# ============================================================
+
+_git_clone_service: Optional[GitCloneService] = None
+
+
+def get_git_clone_service() -> GitCloneService:
+    """클론 작업 서비스 싱글톤 가져오기"""
+    global _git_clone_service
+    if _git_clone_service is None:
+        _git_clone_service = GitCloneService()
+    return _git_clone_service
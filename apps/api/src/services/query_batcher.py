@@ -0,0 +1,140 @@
+"""
+RAG 검색 마이크로 배처
+동시에 들어온 검색 요청을 짧은 시간 창(기본 8ms) 동안 모아
+임베딩 1회(embed_batch) + 벡터 검색 1회(search_batch)로 처리한다.
+
+- 요청별 workspace/tenant/project 필터는 Qdrant 배치 요청 항목마다 그대로 유지된다.
+- 창이 차기 전에 최대 배치 크기에 도달하면 즉시 실행한다.
+- RAG_BATCH_MAX_WAIT_MS=0 으로 설정하면 배칭 없이 요청별로 바로 실행한다.
+
+참조:
+- Qdrant Batch search: https://qdrant.tech/documentation/concepts/search/#batch-search-api
+"""
+
+import os
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from .embedding_service import get_embedding_service
+from .vector_store import SearchResult, get_vector_store
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+RAG_BATCH_MAX_SIZE = int(os.getenv("RAG_BATCH_MAX_SIZE", "32"))
+RAG_BATCH_MAX_WAIT_MS = float(os.getenv("RAG_BATCH_MAX_WAIT_MS", "8"))
+
+
+@dataclass
+class _PendingQuery:
+    """배치 대기 중인 검색 요청"""
+    query: str
+    search_kwargs: Dict[str, Any]
+    future: asyncio.Future
+
+
+# ============================================================
+# 배처
+# ============================================================
+
+class QueryBatcher:
+    """검색 요청 마이크로 배처"""
+
+    def __init__(
+        self,
+        max_batch_size: int = RAG_BATCH_MAX_SIZE,
+        max_wait_ms: float = RAG_BATCH_MAX_WAIT_MS,
+        embedding_service_getter: Callable[[], Awaitable[Any]] = get_embedding_service,
+        vector_store_getter: Callable[[], Awaitable[Any]] = get_vector_store,
+    ):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self._get_embedding_service = embedding_service_getter
+        self._get_vector_store = vector_store_getter
+        self._pending: List[_PendingQuery] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 실행 중인 배치 태스크 참조 유지 (GC 방지)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def search(self, query: str, **search_kwargs) -> List[SearchResult]:
+        """
+        쿼리 임베딩 + 벡터 검색 (다른 동시 요청과 묶여 실행될 수 있음)
+
+        search_kwargs는 VectorStoreService.search의 인자(workspace_id, tenant_id, ...)와 같다.
+        """
+        if self.max_wait_ms == 0 or self.max_batch_size == 1:
+            embedding_service = await self._get_embedding_service()
+            vector_store = await self._get_vector_store()
+            query_embedding = await embedding_service.embed_text(query)
+            return await vector_store.search(query_embedding=query_embedding, **search_kwargs)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_PendingQuery(query=query, search_kwargs=search_kwargs, future=future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """대기 중인 요청을 하나의 배치로 실행"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[_PendingQuery]) -> None:
+        try:
+            embedding_service = await self._get_embedding_service()
+            vector_store = await self._get_vector_store()
+
+            # 같은 쿼리 문자열은 한 번만 임베딩
+            unique_queries = list(dict.fromkeys(p.query for p in batch))
+            embeddings = await embedding_service.embed_batch(unique_queries)
+            embedding_by_query = dict(zip(unique_queries, embeddings))
+
+            results = await vector_store.search_batch([
+                {**p.search_kwargs, "query_embedding": embedding_by_query[p.query]}
+                for p in batch
+            ])
+
+            for pending, result in zip(batch, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+            logger.debug(f"RAG batch executed: size={len(batch)}, unique_queries={len(unique_queries)}")
+        except Exception as e:
+            logger.error(f"RAG batch search failed: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+
+
+# ============================================================
+# 싱글톤 인스턴스
+# ============================================================
+
+_query_batcher: Optional[QueryBatcher] = None
+
+
+def get_query_batcher() -> QueryBatcher:
+    """검색 배처 싱글톤 가져오기"""
+    global _query_batcher
+    if _query_batcher is None:
+        _query_batcher = QueryBatcher()
+    return _query_batcher
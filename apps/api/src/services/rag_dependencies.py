@@ -0,0 +1,113 @@
+"""
+RAG 서비스 FastAPI 의존성
+
+startup 이벤트에서 초기화해 app.state에 보관한 서비스 인스턴스를 라우터에 주입한다.
+핸들러는 요청마다 get_*() 싱글톤 getter를 await 하지 않고 Depends로 인스턴스를 받는다.
+
+사전 초기화가 실패한 경우(예: Qdrant 미기동)에만 첫 요청에서 getter로 지연 초기화하고
+결과를 app.state에 보관해 이후 요청은 바로 재사용한다.
+
+인덱싱 상태 응답 변환(IDE 폴링 경로)도 두 RAG 라우터(/rag, /v1/rag)가 함께 사용한다.
+"""
+
+import functools
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+
+from fastapi import Request
+from pydantic import BaseModel
+
+from .code_indexer import CodeIndexerService, IndexingProgress, get_code_indexer
+from .context_builder import ContextBuilderService, get_context_builder
+from .embedding_service import EmbeddingService, get_embedding_service
+from .vector_store import VectorStoreService, get_vector_store
+
+from ..utils.ttl_cache import TTLCache
+
+T = TypeVar("T")
+R = TypeVar("R", bound=BaseModel)
+
+
+async def _from_app_state(request: Request, name: str, getter: Callable[[], Awaitable[T]]) -> T:
+    """app.state에 보관된 서비스 반환 (없으면 지연 초기화 후 보관)"""
+    service = getattr(request.app.state, name, None)
+    if service is None:
+        service = await getter()
+        setattr(request.app.state, name, service)
+    return service
+
+
+async def get_code_indexer_dep(request: Request) -> CodeIndexerService:
+    """코드 인덱서 의존성"""
+    return await _from_app_state(request, "code_indexer", get_code_indexer)
+
+
+async def get_context_builder_dep(request: Request) -> ContextBuilderService:
+    """컨텍스트 빌더 의존성"""
+    return await _from_app_state(request, "context_builder", get_context_builder)
+
+
+async def get_embedding_service_dep(request: Request) -> EmbeddingService:
+    """임베딩 서비스 의존성"""
+    return await _from_app_state(request, "embedding_service", get_embedding_service)
+
+
+async def get_vector_store_dep(request: Request) -> VectorStoreService:
+    """벡터 저장소 의존성"""
+    return await _from_app_state(request, "vector_store", get_vector_store)
+
+
+# ============================================================
+# 인덱싱 상태 응답 (IDE 폴링 경로)
+# ============================================================
+
+# 완료/실패한 progress는 더 이상 바뀌지 않으므로 만들어 둔 응답을 재사용
+# - 재인덱싱 시 새 progress 객체가 생기므로 같은 객체일 때만 적중
+# - 라우터마다 응답 모델이 다르므로 (모델, workspace_id)를 키로 사용
+_TERMINAL_STATUSES = frozenset({"completed", "failed"})
+_terminal_status_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+
+@functools.lru_cache(maxsize=4096)
+def _idle_status_response(response_cls: Type[R], workspace_id: str) -> R:
+    """진행 중인 인덱싱 없음 - 완료된 것으로 간주 (워크스페이스별 캐시)"""
+    return response_cls(
+        workspace_id=workspace_id,
+        status="completed",
+        total_files=0,
+        indexed_files=0,
+        total_chunks=0,
+        indexed_chunks=0,
+        progress_percent=100.0,
+    )
+
+
+def indexing_status_response(
+    response_cls: Type[R],
+    workspace_id: str,
+    progress: Optional[IndexingProgress],
+) -> R:
+    """progress → 응답 모델 변환 (종료 상태는 캐시)"""
+    if progress is None:
+        return _idle_status_response(response_cls, workspace_id)
+
+    key = (response_cls, workspace_id)
+    terminal = progress.status in _TERMINAL_STATUSES
+    if terminal:
+        cached = _terminal_status_cache.get(key)
+        if cached is not None and cached[0] is progress:
+            return cached[1]
+
+    # progress 값은 인덱서가 채운 신뢰 데이터이므로 검증 생략
+    response = response_cls.model_construct(
+        workspace_id=progress.workspace_id,
+        status=progress.status,
+        total_files=progress.total_files,
+        indexed_files=progress.indexed_files,
+        total_chunks=progress.total_chunks,
+        indexed_chunks=progress.indexed_chunks,
+        progress_percent=progress.progress_percent,
+        error=progress.error,
+    )
+    if terminal:
+        _terminal_status_cache.set(key, (progress, response))
+    return response
@@ -127,18 +127,24 @@ ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
 }
 
 
+# 역할 문자열 → 권한 (요청마다 Role(role) Enum 변환/예외 처리 없이 dict 조회 1회)
+_PERMISSIONS_BY_ROLE: dict[str, Set[Permission]] = {
+    role.value: permissions for role, permissions in ROLE_PERMISSIONS.items()
+}
+_ADMIN_ROLE = Role.ADMIN.value
+
+
 class RBACService:
     """RBAC 서비스 클래스"""
     
     @staticmethod
     def get_role_permissions(role: str) -> Set[Permission]:
         """역할의 권한 목록 반환"""
-        try:
-            role_enum = Role(role)
-            return ROLE_PERMISSIONS.get(role_enum, set())
-        except ValueError:
+        permissions = _PERMISSIONS_BY_ROLE.get(role)
+        if permissions is None:
             logger.warning(f"Unknown role: {role}")
             return set()
+        return permissions
     
     @staticmethod
     def has_permission(user_role: str, required_permission: Permission) -> bool:
@@ -160,8 +166,8 @@ class RBACService:
     
     @staticmethod
     def is_admin(user_role: str) -> bool:
-        """관리자 역할인지 확인"""
-        return user_role == Role.ADMIN.value
+        """관리자 역할인지 확인 (문자열 비교 1회 - 별도 캐시 불필요)"""
+        return user_role == _ADMIN_ROLE
 
 
 rbac_service = RBACService()
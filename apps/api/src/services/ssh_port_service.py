@@ -0,0 +1,107 @@
+"""
+워크스페이스 SSH 포트 할당 서비스
+
+해시로 포트를 계산하면 워크스페이스가 늘수록 포트 충돌이 조용히 발생하므로
+workspace_ssh_ports 테이블에 할당 결과를 저장하고 충돌은 할당 시 1회만 해결한다.
+
+- 우선 후보는 워크스페이스 ID의 CRC32 해시 포트 (기존 접속 정보와 동일하게 유지)
+- 이미 사용 중이면 범위 내 다음 빈 포트를 할당
+- 동시 할당 경합은 port UNIQUE 제약 위반 시 재시도로 해결
+- 할당된 포트는 워크스페이스 삭제 전까지 바뀌지 않으므로 프로세스 내 LRU 캐시에 보관
+- 워크스페이스 삭제 시 release_workspace_ssh_port로 할당 행과 캐시를 함께 해제
+"""
+
+import os
+import zlib
+import logging
+from itertools import chain
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.models import WorkspaceSSHPortModel
+from ..utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 설정
+# ============================================================
+
+SSH_PORT_BASE = int(os.getenv("SSH_PORT_BASE", "22000"))
+SSH_PORT_RANGE = int(os.getenv("SSH_PORT_RANGE", "1000"))  # 22000 ~ 22999
+
+# 포트 캐시 크기/TTL(초)
+SSH_PORT_CACHE_SIZE = int(os.getenv("SSH_PORT_CACHE_SIZE", "10000"))
+SSH_PORT_CACHE_TTL = float(os.getenv("SSH_PORT_CACHE_TTL", "3600"))
+
+# 동시 할당 경합 시 재시도 횟수
+_ALLOCATE_MAX_ATTEMPTS = 3
+
+_SSH_PORT_BY_WS_STMT = select(WorkspaceSSHPortModel.port).where(
+    WorkspaceSSHPortModel.workspace_id == bindparam("workspace_id")
+)
+_USED_SSH_PORTS_STMT = select(WorkspaceSSHPortModel.port)
+
+
+class SSHPortExhaustedError(Exception):
+    """할당 가능한 SSH 포트 없음"""
+
+
+# workspace_id → port (삭제 전까지 불변)
+_port_cache: TTLCache[int] = TTLCache(maxsize=SSH_PORT_CACHE_SIZE, ttl=SSH_PORT_CACHE_TTL)
+
+
+def preferred_ssh_port(workspace_id: str) -> int:
+    """워크스페이스 ID 해시 기반 우선 포트"""
+    # 내장 hash()는 프로세스마다 시드가 달라 워커 간 값이 달라지므로 CRC32 사용
+    return SSH_PORT_BASE + (zlib.crc32(workspace_id.encode()) % SSH_PORT_RANGE)
+
+
+async def get_workspace_ssh_port(db: AsyncSession, workspace_id: str) -> int:
+    """
+    워크스페이스 SSH 포트 조회 (없으면 할당)
+
+    워크스페이스 존재/소유 여부는 호출 측(라우터)에서 먼저 확인한다.
+    """
+    port = _port_cache.get(workspace_id)
+    if port is not None:
+        return port
+
+    for _ in range(_ALLOCATE_MAX_ATTEMPTS):
+        result = await db.execute(_SSH_PORT_BY_WS_STMT, {"workspace_id": workspace_id})
+        port = result.scalar_one_or_none()
+        if port is not None:
+            break
+
+        used = set((await db.execute(_USED_SSH_PORTS_STMT)).scalars())
+        preferred = preferred_ssh_port(workspace_id)
+        end = SSH_PORT_BASE + SSH_PORT_RANGE
+        port = next(
+            (p for p in chain(range(preferred, end), range(SSH_PORT_BASE, preferred)) if p not in used),
+            None,
+        )
+        if port is None:
+            raise SSHPortExhaustedError(f"No free SSH port in {SSH_PORT_BASE}-{end - 1}")
+
+        db.add(WorkspaceSSHPortModel(workspace_id=workspace_id, port=port))
+        try:
+            await db.commit()
+            logger.info(f"SSH port allocated: {workspace_id} -> {port}")
+            break
+        except IntegrityError:
+            # 다른 요청이 같은 포트 또는 같은 워크스페이스를 먼저 할당함 → 다시 조회
+            await db.rollback()
+            port = None
+    else:
+        raise SSHPortExhaustedError(f"Failed to allocate SSH port for {workspace_id}")
+
+    _port_cache.set(workspace_id, port)
+    return port
+
+
+async def release_workspace_ssh_port(db: AsyncSession, workspace_id: str) -> None:
+    """워크스페이스 SSH 포트 해제 (할당 행 삭제 + 캐시 제거, 커밋은 호출 측에서)"""
+    _port_cache.pop(workspace_id)
+    await db.execute(delete(WorkspaceSSHPortModel).where(WorkspaceSSHPortModel.workspace_id == workspace_id))
@@ -8,11 +8,15 @@ Qdrant를 사용한 코드 임베딩 저장 및 검색
 """
 
 import os
+import array
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import asyncio
 
+from ..utils.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +32,20 @@ QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
 CODE_COLLECTION_NAME = "code_embeddings"
 DEFAULT_VECTOR_SIZE = 768
 
+# 검색 결과 캐시 (동일 쿼리 임베딩 + 동일 필터 반복 검색 시 Qdrant 호출 생략)
+# - 인덱싱/삭제 시 해당 워크스페이스 항목은 즉시 무효화
+# - 다른 API 워커에서 발생한 인덱싱은 TTL로만 반영되므로 TTL을 짧게 유지
+# - RAG_SEARCH_CACHE_SIZE=0 또는 RAG_SEARCH_CACHE_TTL=0 이면 비활성화
+RAG_SEARCH_CACHE_SIZE = int(os.getenv("RAG_SEARCH_CACHE_SIZE", "2000"))
+RAG_SEARCH_CACHE_TTL = float(os.getenv("RAG_SEARCH_CACHE_TTL", "60"))
+
+# 벡터 양자화 (신규 컬렉션 생성 시 적용)
+# - int8: 벡터당 4배 작은 int8 사본을 RAM에 두고 후보를 스코어링한 뒤 원본 FP32로 재채점(rescore)
+# - none: 양자화 비활성화
+# 참고: https://qdrant.tech/documentation/guides/quantization/
+QDRANT_QUANTIZATION = os.getenv("QDRANT_QUANTIZATION", "int8").lower()
+QDRANT_QUANTIZATION_OVERSAMPLING = float(os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0"))
+
 
 # ============================================================
 # 데이터 클래스
@@ -57,6 +75,10 @@ class VectorStoreService:
     def __init__(self):
         self._client = None
         self._initialized = False
+        self._search_cache: TTLCache[List[SearchResult]] = TTLCache(
+            maxsize=RAG_SEARCH_CACHE_SIZE,
+            ttl=RAG_SEARCH_CACHE_TTL,
+        )
     
     async def initialize(self, vector_size: int = DEFAULT_VECTOR_SIZE):
         """Qdrant 클라이언트 초기화 및 컬렉션 생성"""
@@ -87,6 +109,7 @@ class VectorStoreService:
                     optimizers_config=models.OptimizersConfigDiff(
                         indexing_threshold=20000,
                     ),
+                    quantization_config=self._quantization_config(),
                 )
                 logger.info(f"Created Qdrant collection: {CODE_COLLECTION_NAME}")
             
@@ -134,7 +157,11 @@ class VectorStoreService:
         embeddings: List[List[float]],
         payloads: List[Dict[str, Any]]
     ) -> bool:
-        """임베딩 업서트"""
+        """
+        임베딩 업서트
+
+        payload는 복사하지 않고 original_chunk_id만 추가해 그대로 저장한다 (호출자는 재사용하지 않아야 함).
+        """
         if not self._initialized:
             await self.initialize()
         
@@ -147,11 +174,12 @@ class VectorStoreService:
                 # chunk_id를 UUID로 변환 (Qdrant는 UUID 또는 정수만 허용)
                 # hex string을 UUID 형식으로 변환
                 uuid_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, chunk_id))
+                payload["original_chunk_id"] = chunk_id
                 
                 points.append(models.PointStruct(
                     id=uuid_id,
                     vector=embedding,
-                    payload={**payload, "original_chunk_id": chunk_id},
+                    payload=payload,
                 ))
             
             # 배치 업서트
@@ -159,6 +187,8 @@ class VectorStoreService:
                 collection_name=CODE_COLLECTION_NAME,
                 points=points,
             )
+            for ws_id in {p.get("workspace_id") for p in payloads}:
+                self.invalidate_search_cache(ws_id)
             
             logger.info(f"Upserted {len(points)} embeddings")
             return True
@@ -167,6 +197,127 @@ class VectorStoreService:
             logger.error(f"Failed to upsert embeddings: {e}")
             return False
     
+    def _build_search_filter(
+        self,
+        workspace_id: str,
+        tenant_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        file_filter: Optional[str] = None,
+        language_filter: Optional[str] = None,
+    ):
+        """검색 필터 구성 (워크스페이스 + 스코프 + 선택 필터)"""
+        from qdrant_client.http import models
+        
+        # 필터 조건 구성
+        must_conditions = [
+            models.FieldCondition(
+                key="workspace_id",
+                match=models.MatchValue(value=workspace_id),
+            )
+        ]
+
+        # 스코프 강제(가능하면 좁게)
+        if tenant_id:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="tenant_id",
+                    match=models.MatchValue(value=tenant_id),
+                )
+            )
+        if project_id:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="project_id",
+                    match=models.MatchValue(value=project_id),
+                )
+            )
+        
+        if file_filter:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="file_path",
+                    match=models.MatchText(text=file_filter),
+                )
+            )
+        
+        if language_filter:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="language",
+                    match=models.MatchValue(value=language_filter),
+                )
+            )
+        
+        return models.Filter(must=must_conditions)
+    
+    @staticmethod
+    def _quantization_config():
+        """컬렉션 양자화 설정 (QDRANT_QUANTIZATION=int8일 때만)"""
+        if QDRANT_QUANTIZATION != "int8":
+            return None
+        from qdrant_client.http import models
+        
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            ),
+        )
+    
+    @staticmethod
+    def _search_params():
+        """검색 파라미터 (양자화 후보 oversampling + 원본 벡터 rescore)"""
+        if QDRANT_QUANTIZATION != "int8":
+            return None
+        from qdrant_client.http import models
+        
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=QDRANT_QUANTIZATION_OVERSAMPLING,
+            ),
+        )
+    
+    @staticmethod
+    def _search_cache_key(
+        query_embedding: List[float],
+        workspace_id: str,
+        tenant_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 10,
+        score_threshold: float = 0.5,
+        file_filter: Optional[str] = None,
+        language_filter: Optional[str] = None,
+    ) -> Tuple:
+        """검색 캐시 키 (workspace_id가 첫 요소 → 워크스페이스 단위 무효화에 사용)"""
+        # 임베딩은 float32 바이트의 짧은 digest로 축약 (키 메모리 절약)
+        vector_digest = hashlib.blake2b(array.array("f", query_embedding).tobytes(), digest_size=16).digest()
+        return (workspace_id, tenant_id, project_id, vector_digest, limit, score_threshold, file_filter, language_filter)
+    
+    def invalidate_search_cache(self, workspace_id: str) -> None:
+        """워크스페이스의 검색 캐시 무효화"""
+        self._search_cache.invalidate_where(lambda key: key[0] == workspace_id)
+    
+    @staticmethod
+    def _to_search_results(points) -> List[SearchResult]:
+        """Qdrant ScoredPoint 목록 → SearchResult 목록"""
+        search_results = []
+        for result in points:
+            payload = result.payload or {}
+            search_results.append(SearchResult(
+                chunk_id=str(result.id),
+                score=result.score,
+                content=payload.get("content", ""),
+                file_path=payload.get("file_path", ""),
+                start_line=payload.get("start_line", 0),
+                end_line=payload.get("end_line", 0),
+                language=payload.get("language", ""),
+                workspace_id=payload.get("workspace_id", ""),
+                metadata=payload.get("metadata", {}),
+            ))
+        return search_results
+    
     async def search(
         self,
         query_embedding: List[float],
@@ -179,84 +330,115 @@ class VectorStoreService:
         language_filter: Optional[str] = None,
     ) -> List[SearchResult]:
         """유사도 검색"""
+        cache_key = self._search_cache_key(
+            query_embedding, workspace_id, tenant_id, project_id,
+            limit, score_threshold, file_filter, language_filter,
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         if not self._initialized:
             await self.initialize()
         
         try:
-            from qdrant_client.http import models
-            
-            # 필터 조건 구성
-            must_conditions = [
-                models.FieldCondition(
-                    key="workspace_id",
-                    match=models.MatchValue(value=workspace_id),
-                )
-            ]
-
-            # 스코프 강제(가능하면 좁게)
-            if tenant_id:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="tenant_id",
-                        match=models.MatchValue(value=tenant_id),
-                    )
-                )
-            if project_id:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="project_id",
-                        match=models.MatchValue(value=project_id),
-                    )
-                )
-            
-            if file_filter:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="file_path",
-                        match=models.MatchText(text=file_filter),
-                    )
-                )
-            
-            if language_filter:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="language",
-                        match=models.MatchValue(value=language_filter),
-                    )
-                )
+            query_filter = self._build_search_filter(
+                workspace_id=workspace_id,
+                tenant_id=tenant_id,
+                project_id=project_id,
+                file_filter=file_filter,
+                language_filter=language_filter,
+            )
             
             # 검색 실행 (qdrant-client 1.7+에서는 query_points 사용)
             results = self._client.query_points(
                 collection_name=CODE_COLLECTION_NAME,
                 query=query_embedding,
-                query_filter=models.Filter(must=must_conditions),
+                query_filter=query_filter,
+                search_params=self._search_params(),
                 limit=limit,
                 score_threshold=score_threshold,
             ).points
             
             # 결과 변환
-            search_results = []
-            for result in results:
-                payload = result.payload or {}
-                search_results.append(SearchResult(
-                    chunk_id=str(result.id),
-                    score=result.score,
-                    content=payload.get("content", ""),
-                    file_path=payload.get("file_path", ""),
-                    start_line=payload.get("start_line", 0),
-                    end_line=payload.get("end_line", 0),
-                    language=payload.get("language", ""),
-                    workspace_id=payload.get("workspace_id", ""),
-                    metadata=payload.get("metadata", {}),
-                ))
+            search_results = self._to_search_results(results)
+            self._search_cache.set(cache_key, search_results)
             
             logger.info(f"Search returned {len(search_results)} results")
-            return search_results
+            return list(search_results)
             
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
     
+    async def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[SearchResult]]:
+        """
+        여러 유사도 검색을 한 번의 RPC로 실행 (query_batch_points)
+        
+        각 항목은 search()의 키워드 인자(dict)이며, 필터는 항목별로 그대로 적용된다.
+        결과는 입력 순서대로 반환한다.
+        """
+        if not queries:
+            return []
+        
+        # 캐시 적중 항목은 RPC에서 제외
+        cache_keys = [
+            self._search_cache_key(
+                q["query_embedding"],
+                q["workspace_id"],
+                q.get("tenant_id"),
+                q.get("project_id"),
+                q.get("limit", 10),
+                q.get("score_threshold", 0.5),
+                q.get("file_filter"),
+                q.get("language_filter"),
+            )
+            for q in queries
+        ]
+        batch_results: List[Optional[List[SearchResult]]] = [self._search_cache.get(k) for k in cache_keys]
+        misses = [i for i, r in enumerate(batch_results) if r is None]
+        if not misses:
+            return [list(r) for r in batch_results]
+        
+        if not self._initialized:
+            await self.initialize()
+        
+        try:
+            from qdrant_client.http import models
+            
+            requests = [
+                models.QueryRequest(
+                    query=queries[i]["query_embedding"],
+                    filter=self._build_search_filter(
+                        workspace_id=queries[i]["workspace_id"],
+                        tenant_id=queries[i].get("tenant_id"),
+                        project_id=queries[i].get("project_id"),
+                        file_filter=queries[i].get("file_filter"),
+                        language_filter=queries[i].get("language_filter"),
+                    ),
+                    params=self._search_params(),
+                    limit=queries[i].get("limit", 10),
+                    score_threshold=queries[i].get("score_threshold", 0.5),
+                    with_payload=True,
+                )
+                for i in misses
+            ]
+            responses = self._client.query_batch_points(
+                collection_name=CODE_COLLECTION_NAME,
+                requests=requests,
+            )
+            
+            for i, response in zip(misses, responses):
+                batch_results[i] = self._to_search_results(response.points)
+                self._search_cache.set(cache_keys[i], batch_results[i])
+            
+            logger.info(f"Batch search: {len(requests)} queries sent, {len(queries) - len(requests)} cache hits")
+            return [list(r) for r in batch_results]
+            
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            return [list(r) if r is not None else [] for r in batch_results]
+    
     async def delete_by_workspace(self, workspace_id: str) -> bool:
         """워크스페이스의 모든 임베딩 삭제"""
         if not self._initialized:
@@ -279,6 +461,7 @@ class VectorStoreService:
                 ),
             )
             
+            self.invalidate_search_cache(workspace_id)
             logger.info(f"Deleted embeddings for workspace: {workspace_id}")
             return True
             
@@ -312,6 +495,7 @@ class VectorStoreService:
                 ),
             )
             
+            self.invalidate_search_cache(workspace_id)
             logger.info(f"Deleted embeddings for file: {file_path}")
             return True
             
@@ -319,6 +503,42 @@ class VectorStoreService:
             logger.error(f"Failed to delete file embeddings: {e}")
             return False
     
+    async def delete_by_files(self, workspace_id: str, file_paths: List[str]) -> bool:
+        """여러 파일의 임베딩을 한 번의 요청으로 삭제 (file_path MatchAny)"""
+        if not file_paths:
+            return True
+        if not self._initialized:
+            await self.initialize()
+        
+        try:
+            from qdrant_client.http import models
+            
+            self._client.delete(
+                collection_name=CODE_COLLECTION_NAME,
+                points_selector=models.FilterSelector(
+                    filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="workspace_id",
+                                match=models.MatchValue(value=workspace_id),
+                            ),
+                            models.FieldCondition(
+                                key="file_path",
+                                match=models.MatchAny(any=list(file_paths)),
+                            ),
+                        ]
+                    )
+                ),
+            )
+            
+            self.invalidate_search_cache(workspace_id)
+            logger.info(f"Deleted embeddings for {len(file_paths)} files in {workspace_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to delete file embeddings: {e}")
+            return False
+    
     async def get_collection_stats(self) -> Dict[str, Any]:
         """컬렉션 통계"""
         if not self._initialized:
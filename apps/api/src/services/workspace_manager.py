@@ -9,9 +9,10 @@ Docker SDK를 사용한 컨테이너 라이프사이클 관리
 
 import os
 import time
+import socket
 import asyncio
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import docker
 from docker.errors import (
@@ -23,6 +24,7 @@ from docker.errors import (
 )
 from docker.models.containers import Container
 from docker.types import Mount, Resources, LogConfig
+from docker.utils.socket import consume_socket_output, demux_adaptor, frames_iter
 
 from ..models.container import (
     ContainerStatus,
@@ -516,6 +518,83 @@ class WorkspaceManager:
                 code="COMMAND_FAILED"
             )
     
+    async def execute_with_stdin(
+        self,
+        workspace_id: str,
+        argv: List[str],
+        input_data: bytes,
+        timeout: int = 60
+    ) -> ExecuteCommandResponse:
+        """
+        컨테이너 내에서 argv를 셸 없이 실행하고 input_data를 stdin으로 전달
+
+        사용자 입력(비밀번호 등)을 명령 문자열에 넣지 않아야 할 때 사용한다.
+        (sh -c 파싱/추가 프로세스 없이 exec 1회)
+        """
+        if self.client is None:
+            # Mock 모드
+            return ExecuteCommandResponse(
+                exit_code=0,
+                stdout=f"Mock execution: {' '.join(argv)}",
+                stderr="",
+                duration_ms=10,
+            )
+        
+        container = await self.get_container(workspace_id)
+        if container is None:
+            raise WorkspaceManagerError(
+                "Container does not exist",
+                code="CONTAINER_NOT_FOUND"
+            )
+        
+        container.reload()
+        if container.status != "running":
+            raise WorkspaceManagerError(
+                "Container is not running",
+                code="CONTAINER_NOT_RUNNING"
+            )
+        
+        api = self.client.api
+        
+        def _run() -> Tuple[int, bytes, bytes]:
+            exec_id = api.exec_create(container.id, cmd=argv, stdin=True, stdout=True, stderr=True)["Id"]
+            sock = api.exec_start(exec_id, socket=True)
+            raw = getattr(sock, "_sock", sock)
+            try:
+                raw.sendall(input_data)
+                raw.shutdown(socket.SHUT_WR)  # stdin EOF
+                frames = (demux_adaptor(*frame) for frame in frames_iter(raw, tty=False))
+                stdout, stderr = consume_socket_output(frames, demux=True)
+            finally:
+                sock.close()
+            return api.exec_inspect(exec_id)["ExitCode"], stdout or b"", stderr or b""
+        
+        try:
+            start_time = time.time()
+            loop = asyncio.get_event_loop()
+            exit_code, stdout, stderr = await asyncio.wait_for(
+                loop.run_in_executor(None, _run),
+                timeout=timeout
+            )
+            return ExecuteCommandResponse(
+                exit_code=exit_code or 0,
+                stdout=stdout.decode("utf-8", errors="replace"),
+                stderr=stderr.decode("utf-8", errors="replace"),
+                duration_ms=int((time.time() - start_time) * 1000),
+            )
+            
+        except asyncio.TimeoutError:
+            raise WorkspaceManagerError(
+                f"Command execution timed out after {timeout} seconds",
+                code="COMMAND_TIMEOUT"
+            )
+        except APIError as e:
+            logger.error(f"Failed to execute command: {e}")
+            raise WorkspaceManagerError(
+                f"Failed to execute command: {str(e)}",
+                code="COMMAND_FAILED"
+            )
+    
     async def get_logs(
         self,
         workspace_id: str,
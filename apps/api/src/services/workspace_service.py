@@ -3,7 +3,8 @@
 비즈니스 로직 분리 및 데이터베이스 연동
 """
 
-from typing import List, Optional
+import os
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, and_
 from sqlalchemy.orm import selectinload
@@ -16,7 +17,24 @@ from ..db.models import (
     OrganizationModel,
     WorkspaceResourceModel,
 )
+from fastapi import Depends
+
+from ..db.connection import get_db
 from ..services.cache_service import cache_service
+from ..services.ssh_port_service import release_workspace_ssh_port
+from ..utils.ttl_cache import TTLCache
+
+
+# 워크스페이스 → (org_id, project_id) 스코프 캐시 (프로세스 내)
+# RAG 엔드포인트의 스코프 검사가 요청마다 DB를 조회하지 않도록 한다.
+# tenant/project 소속은 워크스페이스 생성 후 바뀌지 않으므로 삭제 시에만 무효화한다.
+WORKSPACE_SCOPE_CACHE_SIZE = int(os.getenv("WORKSPACE_SCOPE_CACHE_SIZE", "10000"))
+WORKSPACE_SCOPE_CACHE_TTL = float(os.getenv("WORKSPACE_SCOPE_CACHE_TTL", "60"))
+
+workspace_scope_cache: TTLCache[Tuple[Optional[str], Optional[str]]] = TTLCache(
+    maxsize=WORKSPACE_SCOPE_CACHE_SIZE,
+    ttl=WORKSPACE_SCOPE_CACHE_TTL,
+)
 
 
 class WorkspaceService:
@@ -160,8 +178,10 @@ class WorkspaceService:
             return
 
         await self.update_workspace_status(workspace_id, "deleted")
+        await release_workspace_ssh_port(self.db, workspace_id)
 
         # 캐시 무효화
+        workspace_scope_cache.pop(workspace_id)
         await cache_service.invalidate_workspace_list(workspace.owner_id)
         await cache_service.invalidate_file_tree(workspace_id)
 
@@ -188,6 +208,8 @@ class WorkspaceService:
             )
         )
 
+        await release_workspace_ssh_port(self.db, workspace_id)
+
         # 워크스페이스 삭제
         await self.db.execute(
             delete(WorkspaceModel).where(
@@ -198,7 +220,13 @@ class WorkspaceService:
         await self.db.flush()
 
         # 캐시 무효화
+        workspace_scope_cache.pop(workspace_id)
         await cache_service.invalidate_workspace_list(owner_id)
         await cache_service.invalidate_file_tree(workspace_id)
 
         return True
+
+
+def get_workspace_service(db: AsyncSession = Depends(get_db)) -> WorkspaceService:
+    """WorkspaceService 의존성 (요청 DB 세션 사용)"""
+    return WorkspaceService(db)
@@ -0,0 +1,41 @@
+"""
+청킹 워커
+코드 인덱서의 청킹 프로세스 풀에서 실행되는 함수
+
+spawn된 프로세스가 이 모듈만 import하도록 청커 외의 서비스(DB/임베딩 등)에 의존하지 않는다.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+
+from .code_chunker import CodeChunk, CodeChunker
+
+
+def read_and_chunk(
+    chunker: CodeChunker,
+    file_path: Path,
+    workspace_path: str,
+    workspace_id: str,
+) -> List[CodeChunk]:
+    """파일 읽기 + 청킹"""
+    content = file_path.read_text(encoding="utf-8", errors="ignore")
+    return chunker.chunk_file(
+        content=content,
+        file_path=str(file_path.relative_to(workspace_path)),
+        workspace_id=workspace_id,
+    )
+
+
+# 청킹 프로세스별 청커 (init_chunk_worker에서 생성)
+_worker_chunker: Optional[CodeChunker] = None
+
+
+def init_chunk_worker() -> None:
+    """청킹 프로세스 초기화 (ProcessPoolExecutor initializer)"""
+    global _worker_chunker
+    _worker_chunker = CodeChunker()
+
+
+def chunk_worker(file_path: str, workspace_path: str, workspace_id: str) -> List[CodeChunk]:
+    """청킹 프로세스에서 실행 (파일 내용 대신 경로만 전달받아 직접 읽음)"""
+    return read_and_chunk(_worker_chunker, Path(file_path), workspace_path, workspace_id)
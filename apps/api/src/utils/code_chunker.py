@@ -0,0 +1,167 @@
+"""
+코드 청커
+코드 파일을 임베딩 단위 청크로 분할
+
+임베딩/DB 등 다른 서비스에 의존하지 않으므로 청킹 프로세스에서도 가볍게 import할 수 있다.
+"""
+
+import os
+import hashlib
+from typing import List, Dict, Any
+from dataclasses import dataclass
+
+
+# ============================================================
+# 데이터 클래스
+# ============================================================
+
+@dataclass
+class CodeChunk:
+    """코드 청크 데이터"""
+    chunk_id: str
+    content: str
+    file_path: str
+    start_line: int
+    end_line: int
+    language: str
+    workspace_id: str
+    metadata: Dict[str, Any] = None
+    
+    def __post_init__(self):
+        if self.metadata is None:
+            self.metadata = {}
+
+
+# ============================================================
+# 코드 청커 (Code Chunker)
+# ============================================================
+
+class CodeChunker:
+    """코드를 의미 있는 청크로 분할"""
+    
+    # 언어별 확장자 매핑
+    LANGUAGE_EXTENSIONS = {
+        ".py": "python",
+        ".js": "javascript",
+        ".ts": "typescript",
+        ".tsx": "typescript",
+        ".jsx": "javascript",
+        ".java": "java",
+        ".go": "go",
+        ".rs": "rust",
+        ".cpp": "cpp",
+        ".c": "c",
+        ".h": "c",
+        ".hpp": "cpp",
+        ".cs": "csharp",
+        ".rb": "ruby",
+        ".php": "php",
+        ".swift": "swift",
+        ".kt": "kotlin",
+        ".scala": "scala",
+        ".md": "markdown",
+        ".json": "json",
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".toml": "toml",
+        ".sql": "sql",
+        ".sh": "shell",
+        ".bash": "shell",
+    }
+    
+    def __init__(
+        self,
+        max_chunk_size: int = 1500,
+        min_chunk_size: int = 100,
+        overlap: int = 100
+    ):
+        self.max_chunk_size = max_chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.overlap = overlap
+    
+    def detect_language(self, file_path: str) -> str:
+        """파일 확장자로 언어 감지"""
+        ext = os.path.splitext(file_path)[1].lower()
+        return self.LANGUAGE_EXTENSIONS.get(ext, "unknown")
+    
+    def chunk_file(
+        self,
+        content: str,
+        file_path: str,
+        workspace_id: str
+    ) -> List[CodeChunk]:
+        """파일을 청크로 분할"""
+        language = self.detect_language(file_path)
+        lines = content.split("\n")
+        chunks = []
+        
+        current_chunk_lines = []
+        current_start_line = 1
+        current_size = 0
+        
+        for i, line in enumerate(lines, start=1):
+            line_size = len(line) + 1  # +1 for newline
+            
+            # 청크 크기 초과 시 새 청크 시작
+            if current_size + line_size > self.max_chunk_size and current_chunk_lines:
+                chunk_content = "\n".join(current_chunk_lines)
+                
+                if len(chunk_content) >= self.min_chunk_size:
+                    chunk_id = self._generate_chunk_id(
+                        workspace_id, file_path, current_start_line
+                    )
+                    chunks.append(CodeChunk(
+                        chunk_id=chunk_id,
+                        content=chunk_content,
+                        file_path=file_path,
+                        start_line=current_start_line,
+                        end_line=i - 1,
+                        language=language,
+                        workspace_id=workspace_id,
+                        metadata={
+                            "char_count": len(chunk_content),
+                            "line_count": len(current_chunk_lines),
+                        }
+                    ))
+                
+                # 오버랩 처리
+                overlap_lines = int(self.overlap / (current_size / len(current_chunk_lines)))
+                current_chunk_lines = current_chunk_lines[-overlap_lines:] if overlap_lines > 0 else []
+                current_start_line = max(1, i - len(current_chunk_lines))
+                current_size = sum(len(l) + 1 for l in current_chunk_lines)
+            
+            current_chunk_lines.append(line)
+            current_size += line_size
+        
+        # 마지막 청크 처리
+        if current_chunk_lines:
+            chunk_content = "\n".join(current_chunk_lines)
+            if len(chunk_content) >= self.min_chunk_size:
+                chunk_id = self._generate_chunk_id(
+                    workspace_id, file_path, current_start_line
+                )
+                chunks.append(CodeChunk(
+                    chunk_id=chunk_id,
+                    content=chunk_content,
+                    file_path=file_path,
+                    start_line=current_start_line,
+                    end_line=len(lines),
+                    language=language,
+                    workspace_id=workspace_id,
+                    metadata={
+                        "char_count": len(chunk_content),
+                        "line_count": len(current_chunk_lines),
+                    }
+                ))
+        
+        return chunks
+    
+    def _generate_chunk_id(
+        self,
+        workspace_id: str,
+        file_path: str,
+        start_line: int
+    ) -> str:
+        """청크 ID 생성"""
+        content = f"{workspace_id}:{file_path}:{start_line}"
+        return hashlib.md5(content.encode()).hexdigest()[:16]
@@ -326,9 +326,10 @@ def create_workspace_directory(workspace_id: str, workspace_root: Path) -> None:
         workspace_root: 워크스페이스 루트 경로
         
     Raises:
+        FileExistsError: 같은 경로가 이미 있음 (다른 워크스페이스의 디렉토리를 재사용하지 않음)
         OSError: 디렉토리 생성 실패
     """
-    workspace_root.mkdir(parents=True, exist_ok=True)
+    workspace_root.mkdir(parents=True, exist_ok=False)
     
     # 기본 권한 설정 (700: 소유자만 접근)
     os.chmod(workspace_root, 0o700)
@@ -338,10 +339,13 @@ def workspace_exists(workspace_root: Path) -> bool:
     """
     워크스페이스 존재 여부 확인
     
+    디렉토리 여부까지 확인하지 않고 항목이 있는지만 lstat 1회로 확인한다.
+    심볼릭 링크는 따라가지 않으므로 깨진 링크도 "존재"로 본다 (생성 시 409 판정과 동일한 의미).
+    
     Args:
         workspace_root: 워크스페이스 루트 경로
         
     Returns:
-        존재 여부
+        존재 여부 (디렉토리가 아닐 수 있음)
     """
-    return workspace_root.exists() and workspace_root.is_dir()
+    return os.path.lexists(os.fspath(workspace_root))
@@ -0,0 +1,51 @@
+"""
+HTTP 조건부 요청(ETag / If-None-Match) 유틸
+
+폴링성 조회 API에서 변경이 없으면 304 Not Modified로 본문 직렬화/전송을 생략한다.
+
+참고:
+- RFC 9110 §8.8.3 ETag, §13.1.2 If-None-Match: https://www.rfc-editor.org/rfc/rfc9110
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+# 사용자별 응답이므로 공유 캐시 저장 금지 + 매 요청 재검증
+CACHE_CONTROL_REVALIDATE = "private, no-cache"
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    응답 버전을 나타내는 값들로 weak ETag 생성
+
+    바이트 단위 동일성이 아닌 "의미상 동일" 표시이므로 weak(W/) 태그를 사용한다.
+    """
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인 (weak 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 응답 (본문 없음)"""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL_REVALIDATE},
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """200 응답에 ETag/Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL_REVALIDATE
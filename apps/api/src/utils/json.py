@@ -0,0 +1,37 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작한다.
+- 출력은 공백 없는 UTF-8 (Starlette send_json과 같은 형식)
+- int 등 str이 아닌 dict 키도 표준 json처럼 허용
+- 파싱 오류는 두 구현 모두 json.JSONDecodeError(의 하위 클래스)로 발생
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def dumps(value: Any) -> bytes:
+        """값을 JSON bytes로 직렬화"""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """JSON bytes/str 파싱"""
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover
+    def dumps(value: Any) -> bytes:
+        """값을 JSON bytes로 직렬화"""
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """JSON bytes/str 파싱"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def dumps_str(value: Any) -> str:
+    """값을 JSON 문자열로 직렬화 (WebSocket 텍스트 프레임 등)"""
+    return dumps(value).decode()
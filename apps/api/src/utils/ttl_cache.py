@@ -0,0 +1,66 @@
+"""
+프로세스 내 TTL + LRU 캐시
+
+외부 의존성(cachetools 등) 없이 짧은 수명의 조회 결과를 메모리에 보관한다.
+- 항목 수가 maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 저장 후 ttl초가 지나면 만료
+- 단일 이벤트 루프(asyncio)에서 사용하는 것을 전제로 하며 락을 사용하지 않는다.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """TTL + LRU 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """값 조회 (만료 시 제거 후 default)"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """값 저장"""
+        if not self.enabled:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """값 제거"""
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> int:
+        """조건에 맞는 키를 모두 제거하고 제거한 개수 반환"""
+        keys = [k for k in self._data if predicate(k)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -46,6 +46,7 @@ class TestAuditService:
 
         mock_db_session.add.assert_called_once()
         mock_db_session.commit.assert_called_once()
+        mock_db_session.refresh.assert_not_called()
 
         audit_log = mock_db_session.add.call_args[0][0]
         assert audit_log.instruction_hash == hashlib.sha256(instruction.encode()).hexdigest()
@@ -53,6 +54,17 @@ class TestAuditService:
         assert audit_log.patch_hash == hashlib.sha256(patch_content.encode()).hexdigest()
         assert audit_log.tokens_used == 123
 
+    @pytest.mark.asyncio
+    async def test_log_return_row_refreshes(self, mock_db_session):
+        audit_log = await AuditService.log(
+            db=mock_db_session,
+            user_id="test-user",
+            workspace_id="test-ws",
+            action="chat",
+            return_row=True,
+        )
+        mock_db_session.refresh.assert_awaited_once_with(audit_log)
+
     @pytest.mark.asyncio
     async def test_log_handles_db_error(self, mock_db_session):
         mock_db_session.commit.side_effect = Exception("DB connection failed")
@@ -88,3 +100,18 @@ class TestAuditServiceHashing:
         hash2 = hashlib.sha256(text2.encode()).hexdigest()
         
         assert hash1 != hash2
+
+    def test_hash_many_matches_hash_content(self):
+        """일괄 해시는 개별 해시와 동일, 빈 값은 빈 문자열"""
+        texts = ["a", "", None, "한글"]
+        assert AuditService.hash_many(texts) == [AuditService.hash_content(t) for t in texts]
+        assert AuditService.hash_many(texts)[0] == hashlib.sha256(b"a").hexdigest()
+
+    def test_blake2b_option(self):
+        """AUDIT_HASH=blake2b: 32바이트 BLAKE2b (64자리)"""
+        from src.services.audit_service import _hasher_for
+
+        digest = _hasher_for("blake2b")(b"abc").hexdigest()
+        assert digest == hashlib.blake2b(b"abc", digest_size=32).hexdigest()
+        assert len(digest) == 64
+        assert _hasher_for("sha256")(b"abc").hexdigest() == hashlib.sha256(b"abc").hexdigest()
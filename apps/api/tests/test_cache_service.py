@@ -0,0 +1,184 @@
+"""
+Redis 캐시 서비스 테스트
+
+Redis 없이 fake 클라이언트로 명령 호출 방식을 검증한다.
+"""
+
+import pytest
+
+from src.services import cache_service as cache_module
+from src.services.cache_service import CacheService
+
+
+class _FakeScript:
+    def __init__(self, calls, name):
+        self._calls = calls
+        self._name = name
+
+    async def __call__(self, keys=None, args=None):
+        self._calls.append((self._name, list(keys or []), list(args or [])))
+        return 0
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = redis.calls
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: self._commands.append((name, *args))
+
+    async def execute(self):
+        self._calls.append(("pipeline", self._commands))
+        for name, *args in self._commands:
+            if name == "set":
+                self._redis.store[args[0]] = self._redis._encode(args[1])
+            elif name == "setex":
+                self._redis.store[args[0]] = self._redis._encode(args[2])
+        return [True] * len(self._commands)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.calls = []
+        self.store = {}
+
+    def register_script(self, script):
+        return _FakeScript(self.calls, "delete_indexed")
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.calls.append(("mget", list(keys)))
+        return [self.store.get(key) for key in keys]
+
+    @staticmethod
+    def _encode(value):
+        # decode_responses=False인 redis-py처럼 bytes로 저장
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    async def set(self, key, value):
+        self.store[key] = self._encode(value)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = self._encode(value)
+
+    async def delete(self, *keys):
+        self.calls.append(("delete", list(keys)))
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+    async def scan_iter(self, match=None, count=None):
+        self.calls.append(("scan", match, count))
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key.encode()
+
+    async def unlink(self, *keys):
+        self.calls.append(("unlink", list(keys)))
+        for key in keys:
+            self.store.pop(key.decode(), None)
+
+
+@pytest.fixture
+def cache():
+    service = CacheService()
+    service._redis = _FakeRedis()
+    service._del_indexed_script = service._redis.register_script(cache_module._DELETE_INDEXED_LUA)
+    return service
+
+
+class TestGetSet:
+    """값 직렬화"""
+
+    @pytest.mark.asyncio
+    async def test_json_roundtrip(self, cache):
+        tree = {"name": "root", "children": [{"name": "파일.py", "size": 1}]}
+        await cache.set("workspace:tree:ws1", tree, ttl=60)
+
+        assert isinstance(cache._redis.store["workspace:tree:ws1"], bytes)
+        assert await cache.get("workspace:tree:ws1") == tree
+
+    @pytest.mark.asyncio
+    async def test_plain_values(self, cache):
+        await cache.set("plain", "not json")
+        await cache.set("number", 42)
+
+        assert await cache.get("plain") == "not json"
+        assert await cache.get("number") == 42
+        assert await cache.get("missing") is None
+
+
+class TestBatch:
+    """다중 키 조회/저장"""
+
+    @pytest.mark.asyncio
+    async def test_workspace_lists_roundtrip(self, cache):
+        await cache.set_workspace_lists({"u1": [{"id": "ws1"}], "u2": []}, ttl=120)
+        (kind, commands), = cache._redis.calls
+        assert kind == "pipeline"
+        assert [c[:3] for c in commands] == [
+            ("setex", "workspace:list:u1", 120),
+            ("setex", "workspace:list:u2", 120),
+        ]
+
+        cache._redis.calls.clear()
+        result = await cache.get_workspace_lists(["u1", "u2", "u3"])
+        assert result == {"u1": [{"id": "ws1"}], "u2": [], "u3": None}
+        assert cache._redis.calls == [("mget", ["workspace:list:u1", "workspace:list:u2", "workspace:list:u3"])]
+
+    @pytest.mark.asyncio
+    async def test_empty_batches_skip_redis(self, cache):
+        assert await cache.get_many([]) == []
+        await cache.set_many({})
+        assert cache._redis.calls == []
+
+
+class TestInvalidation:
+    """캐시 무효화"""
+
+    @pytest.mark.asyncio
+    async def test_file_tree_registered_in_index(self, cache):
+        await cache.set_file_tree("ws1", {"name": "root"}, ttl=30)
+
+        (kind, commands), = cache._redis.calls
+        assert kind == "pipeline"
+        assert commands[0][:3] == ("setex", "workspace:tree:ws1", 30)
+        assert commands[1:] == [
+            ("sadd", "workspace:tree:index:ws1", "workspace:tree:ws1"),
+            ("expire", "workspace:tree:index:ws1", 30),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_file_tree_uses_index(self, cache):
+        await cache.invalidate_file_tree("ws1")
+
+        assert cache._redis.calls == [
+            ("delete_indexed", ["workspace:tree:index:ws1", "workspace:tree:ws1"], []),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delete_pattern_scans_and_unlinks_in_batches(self, cache, monkeypatch):
+        monkeypatch.setattr(cache_module, "_SCAN_COUNT", 2)
+        for i in range(3):
+            cache._redis.store[f"workspace:list:u{i}"] = b"[]"
+        cache._redis.store["other"] = b"1"
+
+        await cache.delete_pattern("workspace:list:*")
+
+        assert cache._redis.calls[0] == ("scan", "workspace:list:*", 2)
+        assert [len(c[1]) for c in cache._redis.calls[1:]] == [2, 1]
+        assert list(cache._redis.store) == ["other"]
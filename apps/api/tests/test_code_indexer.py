@@ -0,0 +1,514 @@
+"""
+코드 인덱서 테스트
+
+Qdrant/임베딩 모델/DB 없이 동작하도록 인덱싱 본체와 세션 팩토리를 스텁 처리한다.
+"""
+
+import asyncio
+
+import pytest
+
+import src.db.connection as db_connection
+from src.services.code_indexer import CodeIndexerService
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestIndexingJobs:
+    """요청과 분리된 인덱싱 작업"""
+
+    @pytest.mark.asyncio
+    async def test_one_job_per_workspace_with_own_session(self, monkeypatch):
+        monkeypatch.setattr(db_connection, "AsyncSessionLocal", _FakeSession)
+        indexer = CodeIndexerService()
+        release = asyncio.Event()
+        calls = []
+
+        async def _fake_index(**kwargs):
+            calls.append(kwargs)
+            await release.wait()
+
+        monkeypatch.setattr(indexer, "index_workspace_incremental", _fake_index)
+
+        assert indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1") is True
+        assert indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1") is False
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+        assert isinstance(calls[0]["db"], _FakeSession)
+        assert calls[0]["project_id"] == "prj1"
+
+        release.set()
+        await asyncio.gather(*indexer._jobs.values())
+        assert indexer._jobs == {}
+        assert indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1") is True
+        await asyncio.gather(*indexer._jobs.values())
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(db_connection, "AsyncSessionLocal", _FakeSession)
+        indexer = CodeIndexerService()
+        indexer._job_semaphore = asyncio.Semaphore(1)
+        running = []
+        peak = []
+        release = asyncio.Event()
+
+        async def _fake_index(**kwargs):
+            running.append(kwargs["workspace_id"])
+            peak.append(len(running))
+            await release.wait()
+            running.remove(kwargs["workspace_id"])
+
+        monkeypatch.setattr(indexer, "index_workspace_incremental", _fake_index)
+
+        for ws in ("ws1", "ws2", "ws3"):
+            indexer.start_incremental_indexing(ws, f"/workspaces/{ws}", "org1", "prj1")
+        await asyncio.sleep(0.01)
+        assert len(running) == 1
+
+        release.set()
+        await asyncio.gather(*indexer._jobs.values())
+        assert max(peak) == 1 and len(peak) == 3
+
+
+    @pytest.mark.asyncio
+    async def test_waiting_job_reports_queued(self, monkeypatch):
+        monkeypatch.setattr(db_connection, "AsyncSessionLocal", _FakeSession)
+        indexer = CodeIndexerService()
+        indexer._job_semaphore = asyncio.Semaphore(1)
+        release = asyncio.Event()
+
+        async def _fake_index(**kwargs):
+            indexer._progress[kwargs["workspace_id"]].status = "running"
+            await release.wait()
+
+        monkeypatch.setattr(indexer, "index_workspace_incremental", _fake_index)
+
+        indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1")
+        indexer.start_incremental_indexing("ws2", "/workspaces/ws2", "org1", "prj1")
+        await asyncio.sleep(0.01)
+        assert indexer.get_progress("ws1").status == "running"
+        assert indexer.get_progress("ws2").status == "queued"
+
+        release.set()
+        await asyncio.gather(*indexer._jobs.values())
+
+    @pytest.mark.asyncio
+    async def test_force_request_while_running_is_queued(self, monkeypatch):
+        monkeypatch.setattr(db_connection, "AsyncSessionLocal", _FakeSession)
+        indexer = CodeIndexerService()
+        release = asyncio.Event()
+        calls = []
+
+        async def _fake_index(**kwargs):
+            calls.append(kwargs["force_reindex"])
+            await release.wait()
+
+        monkeypatch.setattr(indexer, "index_workspace_incremental", _fake_index)
+
+        assert indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1") is True
+        assert indexer.start_incremental_indexing("ws1", "/workspaces/ws1", "org1", "prj1", force_reindex=True) is True
+        await asyncio.sleep(0)
+        assert calls == [False]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert calls == [False, True]
+        await asyncio.gather(*indexer._jobs.values())
+        assert indexer._pending_force == {}
+
+
+class TestScanWorkspace:
+    """워크스페이스 파일 스캔"""
+
+    @pytest.mark.asyncio
+    async def test_filters_and_skips_ignored_directories(self, tmp_path, monkeypatch):
+        import src.services.code_indexer as indexer_module
+
+        monkeypatch.setattr(indexer_module, "MAX_FILE_SIZE", 100)
+        (tmp_path / "main.py").write_text("print(1)")
+        (tmp_path / "README.MD").write_text("# doc")
+        (tmp_path / "image.png").write_bytes(b"\x89PNG")
+        (tmp_path / "package-lock.json").write_text("{}")
+        (tmp_path / "big.py").write_text("x" * 101)
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.ts").write_text("export {}")
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("x")
+        (tmp_path / "src" / "__pycache__").mkdir()
+        (tmp_path / "src" / "__pycache__" / "mod.py").write_text("x")
+        outside = tmp_path.parent / f"{tmp_path.name}_outside"
+        outside.mkdir()
+        (outside / "secret.py").write_text("x")
+        (tmp_path / "linked").symlink_to(outside, target_is_directory=True)
+
+        files = await CodeIndexerService().scan_workspace(str(tmp_path))
+
+        rel = sorted(str(p.relative_to(tmp_path)) for p in files)
+        assert rel == ["README.MD", "main.py", "src/pkg/mod.ts"]
+
+    @pytest.mark.asyncio
+    async def test_missing_workspace_returns_empty(self, tmp_path):
+        assert await CodeIndexerService().scan_workspace(str(tmp_path / "missing")) == []
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self._rows = rows
+        self.executed = []
+
+    async def execute(self, stmt):
+        self.executed.append(stmt)
+        return _FakeResult(self._rows)
+
+    async def commit(self):
+        pass
+
+
+class _FakeVectorStore:
+    def __init__(self):
+        self.deleted = []
+
+    async def delete_by_files(self, workspace_id, file_paths):
+        self.deleted.append(list(file_paths))
+
+
+class TestIncrementalChangeDetection:
+    """증분 인덱싱 변경 감지"""
+
+    @pytest.mark.asyncio
+    async def test_detects_changed_new_and_removed_files(self, tmp_path, monkeypatch):
+        import hashlib
+        from types import SimpleNamespace
+
+        (tmp_path / "same.py").write_text("a = 1")
+        (tmp_path / "touched.py").write_text("b = 2")
+        (tmp_path / "edited.py").write_text("c = 3")
+        (tmp_path / "new.py").write_text("d = 4")
+
+        def _row(name, sha=None, **overrides):
+            st = (tmp_path / name).stat()
+            values = {
+                "file_path": name,
+                "sha256": sha or hashlib.sha256((tmp_path / name).read_bytes()).hexdigest(),
+                "mtime_ns": st.st_mtime_ns,
+                "size_bytes": st.st_size,
+            }
+            values.update(overrides)
+            return SimpleNamespace(**values)
+
+        touched = _row("touched.py", mtime_ns=1)
+        rows = [
+            _row("same.py"),
+            touched,
+            _row("edited.py", sha="0" * 64, mtime_ns=1),
+            SimpleNamespace(file_path="gone.py", sha256="0" * 64, mtime_ns=1, size_bytes=1),
+        ]
+
+        indexer = CodeIndexerService()
+        indexer._vector_store = _FakeVectorStore()
+        indexed = []
+
+        async def _fake_index_file(**kwargs):
+            indexed.append(kwargs["file_path"])
+            return True
+
+        monkeypatch.setattr(indexer, "index_file_with_scope", _fake_index_file)
+        db = _FakeDB(rows)
+        result = await indexer.index_workspace_incremental(
+            workspace_id="ws1",
+            workspace_path=str(tmp_path),
+            db=db,
+            tenant_id=None,
+            project_id="prj1",
+        )
+
+        assert result.success
+        assert sorted(indexed) == ["edited.py", "new.py"]
+        assert indexer._vector_store.deleted == [["gone.py"]]
+        deletes = [str(stmt) for stmt in db.executed if str(stmt).startswith("DELETE")]
+        assert len(deletes) == 1 and "file_path IN" in deletes[0]
+        # 내용이 같으면 메타만 갱신
+        assert touched.mtime_ns == (tmp_path / "touched.py").stat().st_mtime_ns
+
+    def test_file_sha256_matches_in_memory_hash(self, tmp_path):
+        import hashlib
+        from src.services.code_indexer import _file_sha256, _hash_files
+
+        path = tmp_path / "big.bin"
+        data = bytes(range(256)) * 5000
+        path.write_bytes(data)
+
+        assert _file_sha256(path) == hashlib.sha256(data).hexdigest()
+        assert _hash_files([path, tmp_path / "missing"]) == [hashlib.sha256(data).hexdigest(), None]
+
+    @pytest.mark.asyncio
+    async def test_only_known_files_with_new_mtime_are_hashed(self, tmp_path, monkeypatch):
+        import hashlib
+        from types import SimpleNamespace
+        import src.services.code_indexer as indexer_module
+
+        (tmp_path / "new.py").write_text("a = 1")
+        (tmp_path / "touched.py").write_text("b = 2")
+        sha = hashlib.sha256(b"b = 2").hexdigest()
+        row = SimpleNamespace(file_path="touched.py", sha256=sha, mtime_ns=1, size_bytes=5)
+        hashed = []
+        real_hash_files = indexer_module._hash_files
+
+        def _counting_hash_files(paths):
+            hashed.extend(p.name for p in paths)
+            return real_hash_files(paths)
+
+        monkeypatch.setattr(indexer_module, "_hash_files", _counting_hash_files)
+        indexer = CodeIndexerService()
+        indexer._vector_store = _FakeVectorStore()
+        indexed = []
+
+        async def _fake_index_file(**kwargs):
+            indexed.append(kwargs["file_path"])
+            return True
+
+        monkeypatch.setattr(indexer, "index_file_with_scope", _fake_index_file)
+        await indexer.index_workspace_incremental(
+            workspace_id="ws1", workspace_path=str(tmp_path), db=_FakeDB([row]),
+            tenant_id=None, project_id="prj1",
+        )
+
+        # 새 파일은 해싱 없이 바로 인덱싱, 기존 파일은 해시가 같아 메타만 갱신
+        assert hashed == ["touched.py"]
+        assert indexed == ["new.py"]
+        assert row.mtime_ns == (tmp_path / "touched.py").stat().st_mtime_ns
+
+
+class _FakeChunker:
+    def chunk_file(self, content, file_path, workspace_id):
+        from types import SimpleNamespace
+
+        if "boom" in content:
+            raise ValueError("chunk failed")
+        return [
+            SimpleNamespace(
+                chunk_id=f"{file_path}:{i}", content=line, file_path=file_path, start_line=i, end_line=i,
+                language="python", workspace_id=workspace_id, metadata={},
+            )
+            for i, line in enumerate(content.splitlines())
+        ]
+
+
+class _FakeEmbeddingService:
+    def __init__(self):
+        self.batches = []
+
+    async def embed_chunks(self, chunks):
+        from types import SimpleNamespace
+
+        self.batches.append([c.chunk_id for c in chunks])
+        return [SimpleNamespace(chunk_id=c.chunk_id, embedding=[0.0]) for c in chunks]
+
+
+class _FakeUpsertStore:
+    def __init__(self):
+        self.upserts = []
+
+    async def upsert_embeddings(self, chunk_ids, embeddings, payloads):
+        self.upserts.append((chunk_ids, payloads))
+
+
+class TestIndexWorkspace:
+    """워크스페이스 전체 인덱싱"""
+
+    def _indexer(self):
+        indexer = CodeIndexerService()
+        indexer._chunker = _FakeChunker()
+        indexer._embedding_service = _FakeEmbeddingService()
+        indexer._vector_store = _FakeUpsertStore()
+        return indexer
+
+    @pytest.mark.asyncio
+    async def test_files_read_concurrently_in_order(self, tmp_path, monkeypatch):
+        import src.services.code_indexer as indexer_module
+
+        monkeypatch.setattr(indexer_module, "INDEX_READ_CONCURRENCY", 2)
+        monkeypatch.setattr(indexer_module, "EMBEDDING_BATCH_SIZE", 2)
+        (tmp_path / "a.py").write_text("a1\na2\na3")
+        (tmp_path / "b.py").write_text("boom")
+        (tmp_path / "c.py").write_text("c1")
+        indexer = self._indexer()
+
+        result = await indexer.index_workspace("ws1", str(tmp_path), tenant_id="org1", project_id="prj1")
+
+        assert result.success and result.files_processed == 2 and result.chunks_created == 4
+        assert indexer._embedding_service.batches == [["a.py:0", "a.py:1"], ["a.py:2", "c.py:0"]]
+        ids = [cid for chunk_ids, _ in indexer._vector_store.upserts for cid in chunk_ids]
+        assert ids == ["a.py:0", "a.py:1", "a.py:2", "c.py:0"]
+        payload = indexer._vector_store.upserts[0][1][0]
+        assert payload["project_id"] == "prj1" and payload["tenant_id"] == "org1"
+
+    @pytest.mark.asyncio
+    async def test_next_batch_embeds_while_previous_upserts(self, monkeypatch):
+        import src.services.code_indexer as indexer_module
+        from src.services.code_indexer import IndexingProgress
+
+        monkeypatch.setattr(indexer_module, "EMBEDDING_BATCH_SIZE", 1)
+        indexer = self._indexer()
+        events = []
+        embed_impl = indexer._embedding_service.embed_chunks
+
+        async def _embed(chunks):
+            events.append(f"embed {chunks[0].chunk_id}")
+            return await embed_impl(chunks)
+
+        async def _upsert(chunk_ids, embeddings, payloads):
+            events.append(f"upsert start {chunk_ids[0]}")
+            await asyncio.sleep(0.01)
+            events.append(f"upsert end {chunk_ids[0]}")
+
+        indexer._embedding_service.embed_chunks = _embed
+        indexer._vector_store.upsert_embeddings = _upsert
+        chunks = _FakeChunker().chunk_file("x\ny\nz", "a.py", "ws1")
+        progress = IndexingProgress(workspace_id="ws1", status="running")
+
+        assert await indexer._embed_and_upsert(chunks, None, "prj1", progress) == 3
+        assert events.index("embed a.py:1") < events.index("upsert end a.py:0")
+        assert [e for e in events if e.startswith("upsert start")] == [
+            "upsert start a.py:0", "upsert start a.py:1", "upsert start a.py:2",
+        ]
+        assert progress.indexed_chunks == 3
+
+    @pytest.mark.asyncio
+    async def test_embeddings_in_flight_bounded_by_depth(self, monkeypatch):
+        import src.services.code_indexer as indexer_module
+        from src.services.code_indexer import IndexingProgress
+
+        monkeypatch.setattr(indexer_module, "EMBEDDING_BATCH_SIZE", 1)
+        monkeypatch.setattr(indexer_module, "INDEX_EMBED_PIPELINE_DEPTH", 2)
+        indexer = self._indexer()
+        running = [0]
+        peak = [0]
+        embed_impl = indexer._embedding_service.embed_chunks
+
+        async def _embed(chunks):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.001)
+            running[0] -= 1
+            return await embed_impl(chunks)
+
+        async def _upsert(chunk_ids, embeddings, payloads):
+            await asyncio.sleep(0.005)
+
+        indexer._embedding_service.embed_chunks = _embed
+        indexer._vector_store.upsert_embeddings = _upsert
+        chunks = _FakeChunker().chunk_file("\n".join("abcdef"), "a.py", "ws1")
+
+        assert await indexer._embed_and_upsert(chunks, None, "prj1", IndexingProgress(workspace_id="ws1")) == 6
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_failure_stops_pipeline(self, monkeypatch):
+        import src.services.code_indexer as indexer_module
+        from src.services.code_indexer import IndexingProgress
+
+        monkeypatch.setattr(indexer_module, "EMBEDDING_BATCH_SIZE", 1)
+        indexer = self._indexer()
+
+        async def _upsert(chunk_ids, embeddings, payloads):
+            raise RuntimeError("qdrant down")
+
+        indexer._vector_store.upsert_embeddings = _upsert
+        chunks = _FakeChunker().chunk_file("\n".join("abcdef"), "a.py", "ws1")
+
+        with pytest.raises(RuntimeError):
+            await indexer._embed_and_upsert(chunks, None, "prj1", IndexingProgress(workspace_id="ws1", status="running"))
+        await asyncio.sleep(0)
+        assert len(indexer._embedding_service.batches) < len(chunks)
+
+
+class TestChunkPayloads:
+    """벡터 저장 payload 구성"""
+
+    def test_scope_fields_added_to_every_payload(self):
+        from src.services.code_indexer import _chunk_payloads
+
+        chunks = _FakeChunker().chunk_file("x\ny", "a.py", "ws1")
+
+        payloads = _chunk_payloads(chunks, project_id="prj1", tenant_id=None)
+        assert payloads[1] == {
+            "content": "y", "file_path": "a.py", "start_line": 1, "end_line": 1, "language": "python",
+            "workspace_id": "ws1", "metadata": {}, "project_id": "prj1", "tenant_id": None,
+        }
+        assert "project_id" not in _chunk_payloads(chunks)[0]
+
+
+class TestChunkProcessPool:
+    """청킹 프로세스 풀"""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_in_thread_chunking(self, tmp_path):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from src.services.embedding_service import get_code_chunker
+        from src.utils.chunk_worker import init_chunk_worker, read_and_chunk
+
+        (tmp_path / "a.py").write_text("\n".join(f"def f{i}():\n    return {i}\n" for i in range(50)))
+        indexer = CodeIndexerService()
+        indexer._chunker = get_code_chunker()
+        indexer._chunk_pool = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_chunk_worker,
+        )
+        try:
+            pooled = await indexer._chunk_file_off_loop(tmp_path / "a.py", str(tmp_path), "ws1")
+        finally:
+            indexer.shutdown()
+
+        expected = read_and_chunk(indexer._chunker, tmp_path / "a.py", str(tmp_path), "ws1")
+        assert pooled and pooled == expected
+        assert indexer._chunk_pool is None
+
+    def test_worker_module_does_not_import_services(self):
+        """spawn된 청킹 프로세스는 서비스 패키지(DB/임베딩 등)를 import하지 않음"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = "import sys, src.utils.chunk_worker; print(sorted(m for m in sys.modules if m.startswith('src.services') or m in ('httpx', 'sqlalchemy')))"
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "[]"
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_to_threads(self, tmp_path):
+        from concurrent.futures.process import BrokenProcessPool
+
+        class _BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        (tmp_path / "a.py").write_text("x = 1")
+        indexer = CodeIndexerService()
+        indexer._chunker = _FakeChunker()
+        indexer._chunk_pool = _BrokenPool()
+
+        chunks = await indexer._chunk_file_off_loop(tmp_path / "a.py", str(tmp_path), "ws1")
+        assert [c.chunk_id for c in chunks] == ["a.py:0"]
+        assert indexer._chunk_pool is None
@@ -124,3 +124,30 @@ async def test_pack_respects_budget_and_truncates(monkeypatch):
     assert res.total_chars <= 800
     assert len(res.contexts) >= 1
     assert any("truncated" in c.content for c in res.contexts)
+
+
+@pytest.mark.asyncio
+async def test_related_files_groups_by_file_and_keeps_top_scores():
+    svc = ContextBuilderService()
+    svc._embedding_service = AsyncMock()
+    svc._embedding_service.embed_text.return_value = [0.0] * 8
+    svc._vector_store = AsyncMock()
+    svc._vector_store.search.return_value = [
+        SearchResult(
+            chunk_id=f"c{i}",
+            score=score,
+            content="x",
+            file_path=path,
+            start_line=1,
+            end_line=1,
+            language="python",
+            workspace_id="ws1",
+        )
+        for i, (path, score) in enumerate([("a.py", 0.5), ("b.py", 0.7), ("a.py", 0.9), ("c.py", 0.4)])
+    ]
+
+    files = await svc.get_related_files(query="q", workspace_id="ws1", limit=2)
+    assert files == [
+        {"file_path": "a.py", "relevance_score": 0.9},
+        {"file_path": "b.py", "relevance_score": 0.7},
+    ]
@@ -67,3 +67,27 @@ async def test_offline_strict_raises_when_model_path_missing(monkeypatch, tmp_pa
     with pytest.raises(RuntimeError, match="EMBEDDING_MODEL_PATH not found"):
         await svc.initialize()
 
+
+
+@pytest.mark.asyncio
+async def test_mock_embeddings_are_normalized_and_leave_global_random_untouched(monkeypatch):
+    import math
+    import random
+
+    monkeypatch.setenv("USE_LOCAL_EMBEDDING", "false")
+    monkeypatch.setenv("VLLM_EMBEDDING_URL", "")
+    monkeypatch.setenv("EMBEDDING_STRICT", "false")
+    monkeypatch.setenv("EMBEDDING_LOCAL_FILES_ONLY", "false")
+    monkeypatch.setenv("EMBEDDING_DIMENSION", "16")
+
+    from src.services.embedding_service import EmbeddingService
+
+    svc = EmbeddingService()
+    random.seed(1234)
+    expected_next = random.random()
+    random.seed(1234)
+
+    first, second = await svc.embed_batch(["def foo(): pass", "def foo(): pass"])
+    assert random.random() == expected_next
+    assert first == second and len(first) == 16
+    assert math.isclose(math.fsum(x * x for x in first), 1.0)
@@ -137,6 +137,10 @@ class TestWorkspaceManagement:
         
         assert workspace_root.exists()
         assert workspace_root.is_dir()
+        
+        # 이미 있는 디렉토리는 재사용하지 않음
+        with pytest.raises(FileExistsError):
+            create_workspace_directory("test", workspace_root)
     
     def test_workspace_exists(self, tmp_path):
         """워크스페이스 존재 여부"""
@@ -145,3 +149,10 @@ class TestWorkspaceManagement:
         
         assert workspace_exists(workspace_root)
         assert not workspace_exists(tmp_path / "nonexistent")
+
+    def test_workspace_exists_does_not_follow_symlinks(self, tmp_path):
+        """깨진 심볼릭 링크도 항목이 있으면 존재로 판단"""
+        link = tmp_path / "dangling"
+        link.symlink_to(tmp_path / "missing-target")
+
+        assert workspace_exists(link)
@@ -46,3 +46,64 @@ def test_gateway_token_has_required_claims():
     assert claims["wid"] == "ws_test"
     assert claims["role"] == "developer"
 
+
+
+def test_es256_gateway_keys(tmp_path, monkeypatch):
+    """
+    GATEWAY_JWT_ALGORITHM=ES256이면 P-256 키/EC JWK를 사용하고,
+    JWKS의 공개키로 토큰 서명이 검증되어야 한다.
+    """
+    from jose import jwt as jose_jwt
+    import src.services.auth_service as auth_module
+
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_ALGORITHM", "ES256")
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_PRIVATE_KEY_PEM", None)
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_KEY_DIR", str(tmp_path))
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_PRIVATE_KEY_FILE", str(tmp_path / "gateway.pem"))
+
+    # 기존 RSA 개발용 키 파일이 있어도 알고리즘에 맞게 재생성
+    auth_module.GatewayJWKSService()
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_ALGORITHM", "RS256")
+    assert auth_module.GatewayJWKSService().jwks()["keys"][0]["kty"] == "RSA"
+    monkeypatch.setattr(auth_module, "GATEWAY_JWT_ALGORITHM", "ES256")
+
+    service = auth_module.GatewayJWKSService()
+    key = service.jwks()["keys"][0]
+    assert key["kty"] == "EC" and key["crv"] == "P-256" and key["alg"] == "ES256"
+    assert "n" not in key
+
+    token = service.create_gateway_token("u_es", "org", "prj", "ws", "developer")
+    assert jose_jwt.get_unverified_header(token)["alg"] == "ES256"
+    claims = jose_jwt.decode(token, key, algorithms=["ES256"])
+    assert claims["sub"] == "u_es"
+
+
+def test_jwks_endpoint_serves_prebuilt_body():
+    """
+    /api/auth/jwks는 미리 직렬화한 JWKS 본문을 반환한다.
+    """
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.services.auth_service import jwt_auth_service
+
+    r = TestClient(app).get("/api/auth/jwks")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.content == jwt_auth_service.get_gateway_jwks_json()
+    assert r.json() == jwt_auth_service.get_gateway_jwks()
+
+
+def test_gateway_token_verifies_with_jwks():
+    """
+    직접 서명한 Gateway 토큰은 python-jose로 JWKS 공개키 검증을 통과해야 한다.
+    """
+    from jose import jwt as jose_jwt
+    from src.services.auth_service import gateway_jwks_service, GATEWAY_JWT_ALGORITHM
+
+    token = gateway_jwks_service.create_gateway_token("u_sig", "org", "prj", "ws", "developer")
+    header = jose_jwt.get_unverified_header(token)
+    assert header == {"alg": GATEWAY_JWT_ALGORITHM, "kid": gateway_jwks_service.jwks()["keys"][0]["kid"], "typ": "JWT"}
+
+    key = gateway_jwks_service.jwks()["keys"][0]
+    claims = jose_jwt.decode(token, key, algorithms=[GATEWAY_JWT_ALGORITHM])
+    assert claims["sub"] == "u_sig" and claims["type"] == "gateway"
@@ -0,0 +1,137 @@
+"""
+백그라운드 git clone 작업 서비스 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from src.services import git_clone_service
+from src.services.git_clone_service import GitCloneService
+
+
+async def _noop():
+    return None
+
+
+async def _wait_done(service: GitCloneService):
+    await asyncio.gather(*list(service._tasks), return_exceptions=True)
+
+
+class TestRunGitClone:
+    """비동기 git clone 실행"""
+
+    async def test_returns_exit_code_and_stderr(self):
+        returncode, stderr = await git_clone_service.run_git_clone(["sh", "-c", "echo fatal >&2; exit 128"])
+        assert returncode == 128
+        assert stderr.strip() == b"fatal"
+
+    async def test_streams_progress_and_keeps_bounded_tail(self, monkeypatch):
+        monkeypatch.setattr(git_clone_service, "_STDERR_READ_SIZE", 64)
+        monkeypatch.setattr(git_clone_service, "_STDERR_TAIL_CHUNKS", 2)
+        script = (
+            "i=0; while [ $i -lt 50 ]; do printf 'Receiving objects: %d%%\\r' $i >&2; i=$((i+1)); done; "
+            "echo 'fatal: early EOF' >&2; exit 128"
+        )
+        progress = []
+
+        returncode, stderr = await git_clone_service.run_git_clone(["sh", "-c", script], on_progress=progress.append)
+        assert returncode == 128
+        assert len(stderr) <= 128
+        assert stderr.rstrip().endswith(b"fatal: early EOF")
+        assert any(line.startswith("Receiving objects:") for line in progress)
+
+    async def test_timeout_kills_process(self, monkeypatch):
+        monkeypatch.setattr(git_clone_service, "GIT_CLONE_TIMEOUT", 0.2)
+        with pytest.raises(asyncio.TimeoutError):
+            await git_clone_service.run_git_clone(["sleep", "5"])
+
+
+class TestCloneJobs:
+    """클론 작업 상태 관리"""
+
+    async def test_successful_clone_runs_callback_and_becomes_ready(self, tmp_path, monkeypatch):
+        commands = []
+
+        async def _fake_clone(cmd, on_progress=None):
+            commands.append(cmd)
+            return 0, b""
+
+        saved = []
+
+        async def _on_success():
+            saved.append(True)
+
+        monkeypatch.setattr(git_clone_service, "run_git_clone", _fake_clone)
+        service = GitCloneService()
+        job = service.start_clone("ws_a", "u1", "https://github.com/o/r", "dev", tmp_path / "ws_a", _on_success)
+        assert job.status == "pending"
+        assert service.find_active_job("u1", "https://github.com/o/r", "dev") is job
+        # 다른 사용자/브랜치/히스토리 옵션은 별도 작업
+        assert service.find_active_job("u2", "https://github.com/o/r", "dev") is None
+        assert service.find_active_job("u1", "https://github.com/o/r", "dev", full_history=True) is None
+
+        await _wait_done(service)
+        assert job.status == "ready" and job.completed_at is not None
+        assert saved == [True]
+        assert commands == [["git", "clone", "--progress", *git_clone_service._SHALLOW_CLONE_ARGS, "-b", "dev", "https://github.com/o/r", str(tmp_path / "ws_a")]]
+        assert service.find_active_job("u1", "https://github.com/o/r", "dev") is None
+        assert service.get_job("ws_a") is job
+
+    async def test_failed_clone_keeps_stderr_tail_and_removes_directory(self, tmp_path, monkeypatch):
+        async def _fake_clone(cmd, on_progress=None):
+            return 128, b"x" * 1000 + b"fatal: repository not found\n"
+
+        monkeypatch.setattr(git_clone_service, "run_git_clone", _fake_clone)
+        root = tmp_path / "ws_b"
+        root.mkdir()
+        service = GitCloneService()
+        job = service.start_clone("ws_b", "u1", "https://github.com/o/r", None, root, _noop)
+        await _wait_done(service)
+
+        assert job.status == "failed"
+        assert job.error.endswith("fatal: repository not found")
+        assert len(job.error) <= 500
+        assert not root.exists()
+
+    async def test_shutdown_cancels_running_clones(self, tmp_path, monkeypatch):
+        async def _slow_clone(cmd, on_progress=None):
+            await asyncio.sleep(10)
+            return 0, b""
+
+        monkeypatch.setattr(git_clone_service, "run_git_clone", _slow_clone)
+        service = GitCloneService()
+        job = service.start_clone("ws_c", "u1", "https://github.com/o/r", None, tmp_path / "ws_c", _noop)
+        await asyncio.sleep(0)
+        await service.shutdown()
+
+        assert job.status == "failed" and job.error == "Clone cancelled"
+        assert not service._tasks
+
+    async def test_finished_jobs_are_pruned_after_retention(self, tmp_path, monkeypatch):
+        async def _fake_clone(cmd, on_progress=None):
+            return 0, b""
+
+        monkeypatch.setattr(git_clone_service, "run_git_clone", _fake_clone)
+        monkeypatch.setattr(git_clone_service, "GIT_CLONE_JOB_RETENTION", -1)
+        service = GitCloneService()
+        service.start_clone("ws_old", "u1", "https://github.com/o/old", None, tmp_path / "ws_old", _noop)
+        await _wait_done(service)
+
+        service.start_clone("ws_new", "u1", "https://github.com/o/new", None, tmp_path / "ws_new", _noop)
+        assert service.get_job("ws_old") is None
+        await _wait_done(service)
+
+    async def test_full_history_skips_shallow_options(self, tmp_path, monkeypatch):
+        commands = []
+
+        async def _fake_clone(cmd, on_progress=None):
+            commands.append(cmd)
+            return 0, b""
+
+        monkeypatch.setattr(git_clone_service, "run_git_clone", _fake_clone)
+        service = GitCloneService()
+        service.start_clone("ws_f", "u1", "https://github.com/o/r", None, tmp_path / "ws_f", _noop, full_history=True)
+        await _wait_done(service)
+        assert commands == [["git", "clone", "--progress", "https://github.com/o/r", str(tmp_path / "ws_f")]]
+        assert git_clone_service._GIT_ENV["GIT_TERMINAL_PROMPT"] == "0"
@@ -0,0 +1,28 @@
+"""
+JSON 직렬화 유틸리티 테스트
+"""
+
+import json
+
+import pytest
+
+from src.utils.json import dumps, dumps_str, loads
+
+
+class TestJsonUtils:
+    """orjson/표준 json 공통 동작"""
+
+    def test_compact_utf8_output(self):
+        data = {"name": "파일.py", "items": [1, 2]}
+
+        assert dumps(data) == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+        assert dumps_str(data) == dumps(data).decode()
+        assert loads(dumps(data)) == data
+        assert loads(dumps_str(data)) == data
+
+    def test_non_str_keys_allowed(self):
+        assert loads(dumps({1: "a"})) == {"1": "a"}
+
+    def test_decode_error_is_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{not json")
@@ -0,0 +1,148 @@
+"""
+/api/projects 라우터 테스트
+
+Postgres 없이 동작하도록 임시 SQLite(aiosqlite) DB에 organizations/users/projects/workspaces 테이블만 생성해
+get_db 의존성을 교체한다.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.main import app
+from src.db.connection import Base, get_db
+from src.db.models import OrganizationModel, ProjectModel, UserModel, WorkspaceModel
+from src.services.rbac_service import get_current_user
+
+
+client = TestClient(app)
+
+
+def _user(user_id: str = "test-user") -> UserModel:
+    return UserModel(
+        user_id=user_id,
+        org_id="org_default",
+        email=f"{user_id}@example.com",
+        name="Test User",
+        role="admin",
+    )
+
+
+@pytest.fixture
+def projects_db(tmp_path):
+    # TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 연결 풀을 쓰지 않는다.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'projects.db'}", poolclass=NullPool)
+
+    async def _create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[OrganizationModel.__table__, UserModel.__table__, ProjectModel.__table__, WorkspaceModel.__table__],
+            )
+
+    asyncio.run(_create_tables())
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def _fake_get_db():
+        async with session_factory() as session:
+            yield session
+            await session.commit()
+
+    async def _fake_get_current_user():
+        return _user()
+
+    saved = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = _fake_get_db
+    app.dependency_overrides[get_current_user] = _fake_get_current_user
+    yield session_factory
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+
+def _add_project(session_factory, project_id: str, owner_id: str = "test-user"):
+    async def _add():
+        async with session_factory() as session:
+            session.add(ProjectModel(project_id=project_id, name=project_id, owner_id=owner_id, org_id="org_default"))
+            await session.commit()
+
+    asyncio.run(_add())
+
+
+def test_create_and_get_project(projects_db):
+    r = client.post("/api/projects", json={"name": "My Project"})
+    assert r.status_code == 201
+    project_id = r.json()["projectId"]
+    assert project_id.startswith("prj_my-project_")
+
+    r = client.get(f"/api/projects/{project_id}")
+    assert r.status_code == 200
+    assert r.json()["name"] == "My Project"
+    assert r.json()["ownerId"] == "test-user"
+
+
+def test_get_update_delete_reject_other_owner(projects_db):
+    _add_project(projects_db, "prj_other", owner_id="someone-else")
+
+    assert client.get("/api/projects/prj_other").status_code == 404
+    assert client.patch("/api/projects/prj_other", json={"name": "x"}).status_code == 404
+    assert client.delete("/api/projects/prj_other").status_code == 404
+
+
+def test_update_and_delete_project(projects_db):
+    _add_project(projects_db, "prj_mine")
+
+    r = client.patch("/api/projects/prj_mine", json={"name": "renamed"})
+    assert r.status_code == 200
+    assert r.json()["name"] == "renamed"
+
+    assert client.delete("/api/projects/prj_mine").status_code == 204
+    assert client.get("/api/projects/prj_mine").status_code == 404
+
+
+def test_list_projects_only_returns_own_projects(projects_db):
+    _add_project(projects_db, "prj_a")
+    _add_project(projects_db, "prj_b")
+    _add_project(projects_db, "prj_other", owner_id="someone-else")
+
+    r = client.get("/api/projects")
+    assert r.status_code == 200
+    data = r.json()
+    assert sorted(p["projectId"] for p in data) == ["prj_a", "prj_b"]
+    assert set(data[0]) == {"projectId", "name", "description", "ownerId", "orgId"}
+    assert data[0]["ownerId"] == "test-user"
+    assert data[0]["orgId"] == "org_default"
+
+
+def test_new_project_id_slug_and_suffix():
+    from src.routers.projects import _new_project_id
+
+    pid = _new_project_id("  My Cool/Project!  ")
+    prefix, _, suffix = pid.rpartition("_")
+    assert prefix == "prj_my-coolproject"
+    assert len(suffix) == 6 and all(c in "0123456789abcdef" for c in suffix)
+
+    assert _new_project_id("한글 프로젝트").startswith("prj_한글-프로젝트_")
+    assert _new_project_id("!!!").startswith("prj_project_")
+    assert len(_new_project_id("a" * 200)) == len("prj_") + 50 + 1 + 6
+
+
+def test_list_projects_etag_not_modified(projects_db):
+    _add_project(projects_db, "prj_a")
+
+    r = client.get("/api/projects")
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+
+    r = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+    # 생성/수정 후에는 ETag가 바뀌어 200으로 다시 내려와야 한다
+    _add_project(projects_db, "prj_b")
+    r = client.get("/api/projects", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert len(r.json()) == 2
+    assert r.headers["etag"] != etag
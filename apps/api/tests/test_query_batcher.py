@@ -0,0 +1,111 @@
+"""
+RAG 검색 마이크로 배처 테스트
+
+실제 임베딩 모델/Qdrant 없이 fake 서비스로 배칭 동작만 검증한다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.query_batcher import QueryBatcher
+
+
+class _FakeEmbeddingService:
+    def __init__(self):
+        self.batches = []
+
+    async def embed_text(self, text):
+        self.batches.append([text])
+        return [float(len(text))]
+
+    async def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class _FakeVectorStore:
+    def __init__(self, fail: bool = False):
+        self.batch_calls = []
+        self.single_calls = []
+        self.fail = fail
+
+    async def search(self, query_embedding, **kwargs):
+        self.single_calls.append(kwargs)
+        return [(kwargs["workspace_id"], query_embedding)]
+
+    async def search_batch(self, queries):
+        if self.fail:
+            raise RuntimeError("qdrant down")
+        self.batch_calls.append(queries)
+        return [[(q["workspace_id"], q["query_embedding"])] for q in queries]
+
+
+def _make_batcher(embedding, vector_store, **kwargs):
+    async def _emb():
+        return embedding
+
+    async def _vs():
+        return vector_store
+
+    return QueryBatcher(embedding_service_getter=_emb, vector_store_getter=_vs, **kwargs)
+
+
+class TestQueryBatcher:
+    """동시 검색 요청 배칭"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_embedding_and_search_call(self):
+        embedding, vector_store = _FakeEmbeddingService(), _FakeVectorStore()
+        batcher = _make_batcher(embedding, vector_store, max_batch_size=32, max_wait_ms=5)
+
+        results = await asyncio.gather(*[
+            batcher.search(query=q, workspace_id=f"ws{i}", tenant_id="org1")
+            for i, q in enumerate(["a", "bb", "a", "ccc"])
+        ])
+
+        # 같은 쿼리("a")는 한 번만 임베딩
+        assert embedding.batches == [["a", "bb", "ccc"]]
+        assert len(vector_store.batch_calls) == 1
+        assert [q["workspace_id"] for q in vector_store.batch_calls[0]] == ["ws0", "ws1", "ws2", "ws3"]
+        assert all(q["tenant_id"] == "org1" for q in vector_store.batch_calls[0])
+        # 결과는 요청별로 분배
+        assert results == [[("ws0", [1.0])], [("ws1", [2.0])], [("ws2", [1.0])], [("ws3", [3.0])]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self):
+        embedding, vector_store = _FakeEmbeddingService(), _FakeVectorStore()
+        # 대기 시간이 길어도 배치가 차면 즉시 실행되어야 한다
+        batcher = _make_batcher(embedding, vector_store, max_batch_size=2, max_wait_ms=60_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.search(query="x", workspace_id="ws1"),
+                batcher.search(query="y", workspace_id="ws2"),
+            ),
+            timeout=1,
+        )
+        assert len(results) == 2
+        assert len(vector_store.batch_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_wait_disables_batching(self):
+        embedding, vector_store = _FakeEmbeddingService(), _FakeVectorStore()
+        batcher = _make_batcher(embedding, vector_store, max_wait_ms=0)
+
+        result = await batcher.search(query="abc", workspace_id="ws1", limit=3)
+        assert result == [("ws1", [3.0])]
+        assert vector_store.single_calls == [{"workspace_id": "ws1", "limit": 3}]
+        assert vector_store.batch_calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_every_caller(self):
+        embedding, vector_store = _FakeEmbeddingService(), _FakeVectorStore(fail=True)
+        batcher = _make_batcher(embedding, vector_store, max_wait_ms=1)
+
+        results = await asyncio.gather(
+            batcher.search(query="x", workspace_id="ws1"),
+            batcher.search(query="y", workspace_id="ws2"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,220 @@
+"""
+/api/rag 라우터 테스트
+
+DB/Qdrant/임베딩 모델 없이 동작하도록 의존성과 서비스 getter를 스텁 처리한다.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.db.connection import get_db
+from src.db.models import UserModel, WorkspaceModel
+from src.services.rbac_service import get_current_user
+from src.services.vector_store import SearchResult
+from src.services import rag_dependencies
+from src.services.rag_dependencies import get_embedding_service_dep, get_vector_store_dep
+
+
+client = TestClient(app)
+
+
+def _workspace() -> WorkspaceModel:
+    return WorkspaceModel(
+        workspace_id="ws_rag",
+        project_id="prj_rag",
+        name="RAG Workspace",
+        owner_id="test-user",
+        org_id="org_default",
+        root_path="/workspaces/ws_rag",
+        status="running",
+    )
+
+
+class _FakeResult:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class _FakeDB:
+    async def execute(self, stmt, *args, **kwargs):
+        # select(WorkspaceModel.<column>) 형태면 해당 컬럼 값만 반환
+        ws = _workspace()
+        name = stmt.column_descriptions[0]["name"]
+        return _FakeResult(getattr(ws, name) if hasattr(WorkspaceModel, name) else ws)
+
+
+class _FakeEmbeddingService:
+    async def embed_text(self, text):
+        return [0.1, 0.2, 0.3]
+
+
+class _FakeVectorStore:
+    def __init__(self):
+        self.calls = []
+        self.stats = {"vectors_count": 3, "points_count": 3, "status": "green", "config": {"vector_size": 3}}
+
+    async def get_collection_stats(self):
+        return dict(self.stats)
+
+    async def search(self, **kwargs):
+        self.calls.append(kwargs)
+        return [
+            SearchResult(
+                chunk_id=f"chunk-{i}",
+                score=0.9 - i * 0.1,
+                content=f"def f{i}(): pass",
+                file_path=f"src/f{i}.py",
+                start_line=1,
+                end_line=1,
+                language="python",
+                workspace_id="ws_rag",
+            )
+            for i in range(3)
+        ]
+
+
+@pytest.fixture
+def rag_overrides():
+    async def _fake_get_current_user():
+        return UserModel(
+            user_id="test-user",
+            org_id="org_default",
+            email="test@example.com",
+            name="Test User",
+            role="developer",
+        )
+
+    async def _fake_get_db():
+        yield _FakeDB()
+
+    vector_store = _FakeVectorStore()
+    embedding_service = _FakeEmbeddingService()
+
+    saved = dict(app.dependency_overrides)
+    app.dependency_overrides[get_current_user] = _fake_get_current_user
+    app.dependency_overrides[get_db] = _fake_get_db
+    app.dependency_overrides[get_vector_store_dep] = lambda: vector_store
+    app.dependency_overrides[get_embedding_service_dep] = lambda: embedding_service
+    yield vector_store
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+
+def test_search_code_returns_results(rag_overrides):
+    r = client.post("/rag/search", json={"query": "f", "workspace_id": "ws_rag", "limit": 3})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["total_results"] == 3
+    assert [item["chunk_id"] for item in data["results"]] == ["chunk-0", "chunk-1", "chunk-2"]
+    assert data["results"][0]["relevance_score"] == pytest.approx(0.9)
+    assert data["results"][0]["language"] == "python"
+
+    call = rag_overrides.calls[0]
+    assert call["tenant_id"] == "org_default"
+    assert call["project_id"] == "prj_rag"
+
+
+@pytest.mark.asyncio
+async def test_service_dependency_uses_app_state_and_caches_fallback(monkeypatch):
+    from types import SimpleNamespace
+
+    calls = []
+
+    async def _getter():
+        calls.append(1)
+        return "lazy-store"
+
+    monkeypatch.setattr(rag_dependencies, "get_vector_store", _getter)
+
+    # startup에서 보관한 인스턴스가 있으면 getter를 호출하지 않음
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(vector_store="preloaded")))
+    assert await get_vector_store_dep(request) == "preloaded"
+    assert calls == []
+
+    # 사전 초기화 실패 시 한 번만 지연 초기화하고 app.state에 보관
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+    assert await get_vector_store_dep(request) == "lazy-store"
+    assert await get_vector_store_dep(request) == "lazy-store"
+    assert calls == [1]
+
+
+def test_stats_etag_not_modified(rag_overrides):
+    r = client.get("/rag/stats")
+    assert r.status_code == 200
+    assert r.json()["points_count"] == 3
+    etag = r.headers["etag"]
+
+    r = client.get("/rag/stats", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+
+    rag_overrides.stats["points_count"] = 10
+    r = client.get("/rag/stats", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["points_count"] == 10
+
+
+def test_indexing_status_reuses_terminal_response():
+    from src.routers import rag as rag_router
+    from src.routers import rag_v1 as rag_v1_router
+    from src.services.code_indexer import IndexingProgress
+    from src.services.rag_dependencies import indexing_status_response
+
+    Response = rag_router.IndexingStatusResponse
+    idle = indexing_status_response(Response, "ws_idle", None)
+    assert isinstance(idle, Response)
+    assert idle.status == "completed" and idle.progress_percent == 100.0
+    assert indexing_status_response(Response, "ws_idle", None) is idle
+
+    progress = IndexingProgress(workspace_id="ws_poll", total_files=4, indexed_files=1, status="running")
+    running = indexing_status_response(Response, "ws_poll", progress)
+    assert running.status == "running" and running.indexed_files == 1
+
+    progress.indexed_files = 4
+    progress.status = "completed"
+    done = indexing_status_response(Response, "ws_poll", progress)
+    assert done.indexed_files == 4 and done.status == "completed"
+    assert indexing_status_response(Response, "ws_poll", progress) is done
+
+    # 라우터별 응답 모델은 따로 캐시
+    v1_done = indexing_status_response(rag_v1_router.IndexingStatusResponse, "ws_poll", progress)
+    assert isinstance(v1_done, rag_v1_router.IndexingStatusResponse)
+    assert indexing_status_response(Response, "ws_poll", progress) is done
+
+    # 재인덱싱으로 새 progress 객체가 생기면 캐시를 쓰지 않음
+    fresh = IndexingProgress(workspace_id="ws_poll", status="completed")
+    assert indexing_status_response(Response, "ws_poll", fresh) is not done
+
+
+def test_index_request_reports_queued_or_running_job(rag_overrides):
+    from src.services.code_indexer import IndexingProgress
+    from src.services.rag_dependencies import get_code_indexer_dep
+
+    class _FakeIndexer:
+        def __init__(self):
+            self.progress = None
+
+        def start_incremental_indexing(self, **kwargs):
+            if self.progress is not None:
+                return False
+            self.progress = IndexingProgress(workspace_id=kwargs["workspace_id"], status="queued")
+            return True
+
+        def get_progress(self, workspace_id):
+            return self.progress
+
+    indexer = _FakeIndexer()
+    app.dependency_overrides[get_code_indexer_dep] = lambda: indexer
+
+    r = client.post("/rag/index", json={"workspace_id": "ws_rag"})
+    assert r.status_code == 202 and r.json()["status"] == "queued"
+
+    # 이미 실행 중이면 새 작업 대신 현재 진행 상태를 응답
+    indexer.progress.status = "running"
+    indexer.progress.total_files = 10
+    indexer.progress.indexed_files = 5
+    r = client.post("/rag/index", json={"workspace_id": "ws_rag"})
+    assert r.json()["status"] == "running" and r.json()["indexed_files"] == 5
@@ -36,3 +36,90 @@ def test_v1_rag_rejects_workspace_scope_mismatch(monkeypatch):
     # 헤더 ws와 body ws가 다르면 embedding/qdrant 호출 전에 403으로 막아야 한다
     r = client.post("/v1/rag/search", json={"query": "x", "workspace_id": "ws-other"}, headers=_headers(ws_id="ws1"))
     assert r.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_v1_rag_workspace_lookup_uses_bound_statement_and_scope_cache():
+    from types import SimpleNamespace
+    from fastapi import HTTPException
+    from src.routers import rag_v1
+    from src.services.internal_gateway_auth import GatewayRequestIdentity
+    from src.services.workspace_service import workspace_scope_cache
+
+    workspace_scope_cache.clear()
+
+    executed = []
+
+    class _FakeDB:
+        async def execute(self, stmt, params=None):
+            executed.append((stmt, params))
+            ws = SimpleNamespace(workspace_id="ws1", org_id="org1", project_id="prj1")
+            return SimpleNamespace(scalar_one_or_none=lambda: ws)
+
+    ident = GatewayRequestIdentity(user_id="user1", tenant_id="org1", project_id="prj1", workspace_id="ws1")
+    ws = await rag_v1._load_workspace_and_check_scope(_FakeDB(), "ws1", ident)
+    assert ws.project_id == "prj1"
+    assert executed == [(rag_v1._WS_BY_ID_STMT, {"ws_id": "ws1"})]
+
+    # 두 번째 요청부터는 스코프 캐시 사용 (DB 조회 없음)
+    ws = await rag_v1._load_workspace_and_check_scope(_FakeDB(), "ws1", ident)
+    assert ws.project_id == "prj1"
+    assert len(executed) == 1
+
+    other_tenant = GatewayRequestIdentity(user_id="user1", tenant_id="org2", project_id="prj1", workspace_id="ws1")
+    with pytest.raises(HTTPException) as exc:
+        await rag_v1._load_workspace_and_check_scope(_FakeDB(), "ws1", other_tenant)
+    assert exc.value.status_code == 403
+    assert exc.value.detail == "Tenant scope mismatch"
+
+    other_project = GatewayRequestIdentity(user_id="user1", tenant_id="org1", project_id="prj2", workspace_id="ws1")
+    with pytest.raises(HTTPException) as exc:
+        await rag_v1._load_workspace_and_check_scope(_FakeDB(), "ws1", other_project)
+    assert exc.value.detail == "Project scope mismatch"
+    workspace_scope_cache.clear()
+
+
+def test_v1_rag_search_returns_results(monkeypatch):
+    from types import SimpleNamespace
+    from src.db.connection import get_db
+    from src.routers import rag_v1
+    from src.services.vector_store import SearchResult
+    from src.services.workspace_service import workspace_scope_cache
+
+    monkeypatch.setenv("GATEWAY_INTERNAL_TOKEN", "internal-test-token")
+    workspace_scope_cache.clear()
+
+    class _FakeDB:
+        async def execute(self, stmt, params=None):
+            ws = SimpleNamespace(workspace_id="ws1", org_id="org1", project_id="prj1")
+            return SimpleNamespace(scalar_one_or_none=lambda: ws)
+
+    class _FakeBatcher:
+        async def search(self, query, **kwargs):
+            return [
+                SearchResult(
+                    chunk_id="c1", score=0.8, content="x = 1", file_path="a.py",
+                    start_line=1, end_line=1, language="python", workspace_id="ws1",
+                )
+            ]
+
+    async def _fake_get_db():
+        yield _FakeDB()
+
+    monkeypatch.setattr(rag_v1, "get_query_batcher", lambda: _FakeBatcher())
+    saved = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = _fake_get_db
+    try:
+        r = client.post("/v1/rag/search", json={"query": "x", "workspace_id": "ws1"}, headers=_headers())
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved)
+        workspace_scope_cache.clear()
+
+    assert r.status_code == 200
+    data = r.json()
+    assert data["total_results"] == 1
+    assert data["results"][0] == {
+        "chunk_id": "c1", "file_path": "a.py", "content": "x = 1",
+        "start_line": 1, "end_line": 1, "language": "python", "relevance_score": 0.8,
+    }
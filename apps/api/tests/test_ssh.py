@@ -0,0 +1,262 @@
+"""
+SSH 라우터 헬퍼 테스트
+"""
+
+from src.routers import ssh as ssh_router
+
+
+class TestSSHKeyFingerprint:
+    """SSH 공개키 fingerprint"""
+
+    def test_fingerprint_matches_openssh_format(self):
+        import base64
+        import hashlib
+
+        blob = b"\x00\x00\x00\x0bssh-ed25519" + b"\x01" * 32
+        key = f"ssh-ed25519 {base64.b64encode(blob).decode()} user@host"
+        expected = "SHA256:" + base64.b64encode(hashlib.sha256(blob).digest()).decode().rstrip("=")
+
+        assert ssh_router._get_ssh_key_fingerprint(key) == expected
+        assert ssh_router._get_ssh_key_fingerprint(f"  {key}\n") == expected
+
+    def test_invalid_key_returns_unknown(self):
+        assert ssh_router._get_ssh_key_fingerprint("not-a-key") == "unknown"
+        assert ssh_router._get_ssh_key_fingerprint("ssh-rsa !!!invalid!!!") == "unknown"
+        assert ssh_router._get_ssh_key_fingerprint("ssh-rsa 키가아님") == "unknown"
+
+
+class TestGenerateSSHKeypair:
+    """SSH 키 쌍 생성 API"""
+
+    def test_generate_ed25519_keypair(self):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        r = TestClient(app).post("/api/workspaces/ws_gen/ssh/generate", json={"key_type": "ed25519"})
+        assert r.status_code == 200
+        data = r.json()
+        assert data["publicKey"].startswith("ssh-ed25519 ")
+        assert data["publicKey"].endswith(" cursor-workspace-ws_gen")
+        assert "OPENSSH PRIVATE KEY" in data["privateKey"]
+        assert data["fingerprint"] == ssh_router._get_ssh_key_fingerprint(data["publicKey"])
+
+
+class TestRSAKeyPool:
+    """RSA 키 사전 생성 풀"""
+
+    def test_pooled_key_used_and_refilled(self, monkeypatch):
+        import queue
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        pooled = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+        generated = []
+
+        def _fake_new_key():
+            generated.append(1)
+            return pooled
+
+        monkeypatch.setattr(ssh_router, "_rsa_key_pool", queue.Queue(maxsize=2))
+        monkeypatch.setattr(ssh_router, "_new_rsa_key", _fake_new_key)
+        monkeypatch.setattr(ssh_router, "SSH_RSA_KEY_POOL_SIZE", 2)
+        refills = []
+        monkeypatch.setattr(ssh_router, "prewarm_rsa_key_pool", lambda: refills.append(1))
+        ssh_router._rsa_key_pool.put_nowait(pooled)
+
+        public_key, private_key = ssh_router._generate_keypair_sync("rsa", "c")
+        assert public_key.startswith("ssh-rsa ") and public_key.endswith(" c")
+        assert "OPENSSH PRIVATE KEY" in private_key
+        assert generated == [] and refills == [1]
+
+        # 풀이 비었으면 즉시 생성
+        ssh_router._generate_keypair_sync("rsa", "c")
+        assert generated == [1]
+
+    def test_refill_fills_pool_once(self, monkeypatch):
+        import queue
+
+        monkeypatch.setattr(ssh_router, "_rsa_key_pool", queue.Queue(maxsize=3))
+        monkeypatch.setattr(ssh_router, "SSH_RSA_KEY_POOL_SIZE", 3)
+        monkeypatch.setattr(ssh_router, "_new_rsa_key", lambda: object())
+        monkeypatch.setattr(ssh_router, "_rsa_refill_running", True)
+
+        ssh_router._refill_rsa_key_pool()
+        assert ssh_router._rsa_key_pool.qsize() == 3
+        assert ssh_router._rsa_refill_running is False
+
+
+class TestSetupSSHKey:
+    """SSH 공개키 등록 API"""
+
+    def test_public_key_passed_via_env_not_shell_string(self):
+        from types import SimpleNamespace
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.services.workspace_manager import get_workspace_manager
+
+        calls = []
+
+        class _FakeManager:
+            async def get_container(self, ws_id):
+                return object()
+
+            async def execute_command(self, **kwargs):
+                calls.append(kwargs)
+                return SimpleNamespace(exit_code=0, stdout="", stderr="")
+
+        public_key = 'ssh-ed25519 AAAAC3NzaC1lZDI1NTE5AAAAI$(id) "user"'
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_workspace_manager] = lambda: _FakeManager()
+        try:
+            r = TestClient(app).post("/api/workspaces/ws_key/ssh/key", json={"publicKey": public_key})
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        assert r.status_code == 200
+        assert calls[0]["command"] == ssh_router._APPEND_AUTHORIZED_KEY_CMD
+        assert calls[0]["env"] == {"SSH_PUBLIC_KEY": public_key}
+        assert public_key not in calls[0]["command"]
+
+
+class _FakeOwnerDB:
+    def __init__(self, owner_id):
+        self._owner_id = owner_id
+
+    async def execute(self, stmt, params=None):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(scalar_one_or_none=lambda: self._owner_id)
+
+
+class TestCursorCommand:
+    """Cursor Remote SSH 접속 정보 API"""
+
+    def _override(self, app, owner_id="u1"):
+        from types import SimpleNamespace
+        from src.db.connection import get_db
+        from src.services.rbac_service import get_current_user
+
+        async def _fake_get_db():
+            yield _FakeOwnerDB(owner_id)
+
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(user_id="u1", role="developer")
+
+    def test_returns_ssh_config(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        async def _fake_port(db, workspace_id):
+            assert workspace_id == "ws_cur"
+            return 22345
+
+        monkeypatch.setattr(ssh_router, "get_workspace_ssh_port", _fake_port)
+        saved = dict(app.dependency_overrides)
+        self._override(app)
+        try:
+            r = TestClient(app).get("/api/workspaces/ws_cur/ssh/cursor-command")
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        assert r.status_code == 200
+        assert r.headers["content-type"] == "application/json"
+        data = r.json()
+        assert data["workspaceId"] == "ws_cur"
+        assert "Port 22345" in data["sshConfig"]["content"]
+
+    def test_port_exhausted_returns_503(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.services.ssh_port_service import SSHPortExhaustedError
+
+        async def _exhausted(db, workspace_id):
+            raise SSHPortExhaustedError("full")
+
+        monkeypatch.setattr(ssh_router, "get_workspace_ssh_port", _exhausted)
+        saved = dict(app.dependency_overrides)
+        self._override(app)
+        try:
+            r = TestClient(app).get("/api/workspaces/ws_full/ssh/cursor-command")
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        assert r.status_code == 503
+        assert r.json()["detail"]["code"] == "SSH_PORT_EXHAUSTED"
+
+    def test_unknown_or_foreign_workspace_gets_no_port(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        allocated = []
+
+        async def _fake_port(db, workspace_id):
+            allocated.append(workspace_id)
+            return 22345
+
+        monkeypatch.setattr(ssh_router, "get_workspace_ssh_port", _fake_port)
+        saved = dict(app.dependency_overrides)
+        try:
+            self._override(app, owner_id=None)
+            missing = TestClient(app).get("/api/workspaces/ws_random/ssh/cursor-command")
+            self._override(app, owner_id="someone-else")
+            foreign = TestClient(app).get("/api/workspaces/ws_other/ssh/cursor-command")
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        assert missing.status_code == 404
+        assert missing.json()["detail"]["code"] == "WORKSPACE_NOT_FOUND"
+        assert foreign.status_code == 403
+        assert allocated == []
+
+    def test_payload_is_cached_per_workspace(self):
+        first = ssh_router._build_cursor_command_payload("ws_cached", 22001)
+        assert ssh_router._build_cursor_command_payload("ws_cached", 22001) is first
+        command, uri = ssh_router._get_ssh_connection_strings(22001)
+        assert first["directCommand"] == command == f"ssh -p 22001 developer@{ssh_router.SSH_HOST}"
+        assert first["vscodeRemoteUri"] == uri
+
+
+class TestSetupSSHPassword:
+    """SSH 비밀번호 설정 API"""
+
+    def _post(self, password, manager):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.services.workspace_manager import get_workspace_manager
+
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_workspace_manager] = lambda: manager
+        try:
+            return TestClient(app).post("/api/workspaces/ws_pw/ssh/password", json={"password": password})
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+    def _manager(self, calls):
+        from types import SimpleNamespace
+
+        class _FakeManager:
+            async def get_container(self, ws_id):
+                return object()
+
+            async def execute_with_stdin(self, **kwargs):
+                calls.append(kwargs)
+                return SimpleNamespace(exit_code=0, stdout="", stderr="")
+
+        return _FakeManager()
+
+    def test_password_sent_via_stdin(self):
+        calls = []
+        r = self._post('Secret123"; rm -rf /', self._manager(calls))
+        assert r.status_code == 200
+        assert calls[0]["argv"] == ["sudo", "chpasswd"]
+        assert calls[0]["input_data"] == b'developer:Secret123"; rm -rf /\n'
+
+    def test_password_with_line_break_rejected(self):
+        calls = []
+        r = self._post("Secret123\nroot:Owned123", self._manager(calls))
+        assert r.status_code == 422
+        assert calls == []
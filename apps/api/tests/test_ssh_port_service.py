@@ -0,0 +1,93 @@
+"""
+워크스페이스 SSH 포트 할당 서비스 테스트
+
+임시 SQLite(aiosqlite) DB에 workspace_ssh_ports 테이블만 생성해 할당/충돌 처리를 검증한다.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.db.connection import Base
+from src.db.models import WorkspaceSSHPortModel
+from src.services import ssh_port_service
+from src.utils.ttl_cache import TTLCache
+
+
+def _fresh_cache():
+    return TTLCache(maxsize=100, ttl=60)
+
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(ssh_port_service, "_port_cache", _fresh_cache())
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ssh_ports.db'}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[WorkspaceSSHPortModel.__table__])
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestPreferredPort:
+    """해시 기반 우선 포트"""
+
+    def test_port_is_deterministic_and_in_range(self):
+        port = ssh_port_service.preferred_ssh_port("ws_abc")
+        assert port == ssh_port_service.preferred_ssh_port("ws_abc")
+        base = ssh_port_service.SSH_PORT_BASE
+        assert base <= port < base + ssh_port_service.SSH_PORT_RANGE
+
+
+class TestGetWorkspaceSSHPort:
+    """포트 할당/조회"""
+
+    @pytest.mark.asyncio
+    async def test_allocates_preferred_port_and_persists(self, session_factory):
+        async with session_factory() as db:
+            port = await ssh_port_service.get_workspace_ssh_port(db, "ws_a")
+        assert port == ssh_port_service.preferred_ssh_port("ws_a")
+
+        # 프로세스 캐시를 비워도 DB에 저장된 값이 유지됨
+        ssh_port_service._port_cache.clear()
+        async with session_factory() as db:
+            assert await ssh_port_service.get_workspace_ssh_port(db, "ws_a") == port
+            rows = (await db.execute(ssh_port_service._USED_SSH_PORTS_STMT)).scalars().all()
+        assert rows == [port]
+
+    @pytest.mark.asyncio
+    async def test_collision_moves_to_next_free_port(self, session_factory, monkeypatch):
+        monkeypatch.setattr(ssh_port_service, "preferred_ssh_port", lambda ws_id: ssh_port_service.SSH_PORT_BASE + 5)
+        async with session_factory() as db:
+            first = await ssh_port_service.get_workspace_ssh_port(db, "ws_1")
+            second = await ssh_port_service.get_workspace_ssh_port(db, "ws_2")
+        assert first == ssh_port_service.SSH_PORT_BASE + 5
+        assert second == first + 1
+
+    @pytest.mark.asyncio
+    async def test_wraps_around_and_raises_when_exhausted(self, session_factory, monkeypatch):
+        base = ssh_port_service.SSH_PORT_BASE
+        monkeypatch.setattr(ssh_port_service, "SSH_PORT_RANGE", 2)
+        monkeypatch.setattr(ssh_port_service, "preferred_ssh_port", lambda ws_id: base + 1)
+        async with session_factory() as db:
+            assert await ssh_port_service.get_workspace_ssh_port(db, "ws_1") == base + 1
+            assert await ssh_port_service.get_workspace_ssh_port(db, "ws_2") == base
+            with pytest.raises(ssh_port_service.SSHPortExhaustedError):
+                await ssh_port_service.get_workspace_ssh_port(db, "ws_3")
+
+    @pytest.mark.asyncio
+    async def test_cached_port_skips_db(self, monkeypatch):
+        cache = _fresh_cache()
+        cache.set("ws_c", 22010)
+        monkeypatch.setattr(ssh_port_service, "_port_cache", cache)
+        assert await ssh_port_service.get_workspace_ssh_port(None, "ws_c") == 22010
+
+    @pytest.mark.asyncio
+    async def test_release_frees_row_and_cache(self, session_factory, monkeypatch):
+        monkeypatch.setattr(ssh_port_service, "preferred_ssh_port", lambda ws_id: ssh_port_service.SSH_PORT_BASE + 7)
+        async with session_factory() as db:
+            port = await ssh_port_service.get_workspace_ssh_port(db, "ws_old")
+            await ssh_port_service.release_workspace_ssh_port(db, "ws_old")
+            await db.commit()
+            assert ssh_port_service._port_cache.get("ws_old") is None
+            # 해제된 포트는 다른 워크스페이스가 다시 사용할 수 있음
+            assert await ssh_port_service.get_workspace_ssh_port(db, "ws_new") == port
@@ -0,0 +1,167 @@
+"""
+벡터 저장소 검색 캐시 테스트
+
+Qdrant 없이 fake 클라이언트로 캐시 적중/무효화 동작을 검증한다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.vector_store import VectorStoreService
+from src.utils.ttl_cache import TTLCache
+
+
+class _FakeQdrantClient:
+    def __init__(self):
+        self.query_calls = 0
+        self.batch_calls = []
+        self.last_query_kwargs = None
+        self.last_batch_requests = None
+
+    def _points(self, tag):
+        return [SimpleNamespace(id=f"id-{tag}", score=0.9, payload={"content": tag, "workspace_id": "ws1"})]
+
+    def query_points(self, **kwargs):
+        self.query_calls += 1
+        self.last_query_kwargs = kwargs
+        return SimpleNamespace(points=self._points(self.query_calls))
+
+    def query_batch_points(self, collection_name, requests):
+        self.batch_calls.append(len(requests))
+        self.last_batch_requests = requests
+        return [SimpleNamespace(points=self._points(f"b{i}")) for i in range(len(requests))]
+
+    def upsert(self, **kwargs):
+        pass
+
+    def delete(self, **kwargs):
+        self.last_delete_kwargs = kwargs
+
+
+@pytest.fixture
+def store():
+    s = VectorStoreService()
+    s._client = _FakeQdrantClient()
+    s._initialized = True
+    return s
+
+
+class TestTTLCache:
+    """프로세스 내 TTL/LRU 캐시"""
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_expiry(self, monkeypatch):
+        import src.utils.ttl_cache as ttl_module
+
+        now = [1000.0]
+        monkeypatch.setattr(ttl_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl=5)
+        cache.set("k", "v")
+        now[0] += 4
+        assert cache.get("k") == "v"
+        now[0] += 2
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_disabled_when_ttl_zero(self):
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("k", "v")
+        assert cache.get("k") is None
+
+
+class TestVectorSearchCache:
+    """검색 결과 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_hits_cache(self, store):
+        first = await store.search(query_embedding=[0.1, 0.2], workspace_id="ws1", tenant_id="t1")
+        second = await store.search(query_embedding=[0.1, 0.2], workspace_id="ws1", tenant_id="t1")
+        assert store._client.query_calls == 1
+        assert [r.chunk_id for r in first] == [r.chunk_id for r in second]
+
+        # 필터/limit이 다르면 별도 키
+        await store.search(query_embedding=[0.1, 0.2], workspace_id="ws1", tenant_id="t1", limit=5)
+        assert store._client.query_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_workspace_entries(self, store):
+        await store.search(query_embedding=[0.1], workspace_id="ws1")
+        await store.search(query_embedding=[0.1], workspace_id="ws2")
+
+        await store.upsert_embeddings(chunk_ids=["c1"], embeddings=[[0.1]], payloads=[{"workspace_id": "ws1"}])
+        await store.search(query_embedding=[0.1], workspace_id="ws1")
+        await store.search(query_embedding=[0.1], workspace_id="ws2")
+        assert store._client.query_calls == 3  # ws1만 재조회
+
+        await store.delete_by_file("ws2", "a.py")
+        await store.search(query_embedding=[0.1], workspace_id="ws2")
+        assert store._client.query_calls == 4
+
+    @pytest.mark.asyncio
+    async def test_delete_by_files_single_request(self, store):
+        await store.search(query_embedding=[0.1], workspace_id="ws1")
+
+        assert await store.delete_by_files("ws1", ["a.py", "b.py"]) is True
+        conditions = store._client.last_delete_kwargs["points_selector"].filter.must
+        assert conditions[0].match.value == "ws1"
+        assert conditions[1].key == "file_path" and conditions[1].match.any == ["a.py", "b.py"]
+
+        await store.search(query_embedding=[0.1], workspace_id="ws1")
+        assert store._client.query_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_by_files_empty_is_noop(self, store):
+        assert await store.delete_by_files("ws1", []) is True
+        assert not hasattr(store._client, "last_delete_kwargs")
+
+    @pytest.mark.asyncio
+    async def test_batch_search_only_sends_cache_misses(self, store):
+        await store.search(query_embedding=[0.3], workspace_id="ws1")
+
+        results = await store.search_batch([
+            {"query_embedding": [0.3], "workspace_id": "ws1"},
+            {"query_embedding": [0.4], "workspace_id": "ws1"},
+        ])
+        assert store._client.batch_calls == [1]
+        assert len(results) == 2 and all(len(r) == 1 for r in results)
+
+        await store.search_batch([{"query_embedding": [0.4], "workspace_id": "ws1"}])
+        assert store._client.batch_calls == [1]
+
+
+class TestQuantization:
+    """int8 양자화 설정"""
+
+    def test_int8_collection_config(self, monkeypatch):
+        import src.services.vector_store as vs
+
+        monkeypatch.setattr(vs, "QDRANT_QUANTIZATION", "int8")
+        config = VectorStoreService._quantization_config()
+        assert config.scalar.type == "int8"
+        assert config.scalar.always_ram is True
+
+        monkeypatch.setattr(vs, "QDRANT_QUANTIZATION", "none")
+        assert VectorStoreService._quantization_config() is None
+        assert VectorStoreService._search_params() is None
+
+    @pytest.mark.asyncio
+    async def test_searches_request_rescore(self, store, monkeypatch):
+        import src.services.vector_store as vs
+
+        monkeypatch.setattr(vs, "QDRANT_QUANTIZATION", "int8")
+        await store.search(query_embedding=[0.5], workspace_id="ws1")
+        params = store._client.last_query_kwargs["search_params"]
+        assert params.quantization.rescore is True
+        assert params.quantization.oversampling == vs.QDRANT_QUANTIZATION_OVERSAMPLING
+
+        await store.search_batch([{"query_embedding": [0.6], "workspace_id": "ws1"}])
+        assert store._client.last_batch_requests[0].params.quantization.rescore is True
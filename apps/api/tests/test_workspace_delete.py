@@ -114,6 +114,73 @@ class TestWorkspaceDeleteAPI:
         # assert response.status_code == 204
         pass
 
+    def _delete(self, tmp_path, monkeypatch, delete_directory):
+        import asyncio
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.db.connection import get_db
+        from src.routers import workspaces as workspaces_router
+
+        calls = []
+
+        class _FakeManager:
+            async def remove_container(self, workspace_id, force=True, remove_volumes=True):
+                calls.append("container:start")
+                await asyncio.sleep(0.05)
+                calls.append("container:end")
+                return True, "removed"
+
+        class _FakeService:
+            async def hard_delete_workspace(self, workspace_id):
+                calls.append("db:delete")
+                return True
+
+        class _FakeDB:
+            async def commit(self):
+                calls.append("db:commit")
+
+            async def rollback(self):
+                calls.append("db:rollback")
+
+        async def _fake_get_db():
+            yield _FakeDB()
+
+        def _delete_directory(path):
+            calls.append("fs:delete")
+            delete_directory(path)
+
+        (tmp_path / "ws_del").mkdir()
+        monkeypatch.setattr(workspaces_router, "get_workspace_root", lambda ws_id: tmp_path / ws_id)
+        monkeypatch.setattr(workspaces_router, "delete_workspace_directory", _delete_directory)
+
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[workspaces_router.get_workspace_manager] = lambda: _FakeManager()
+        app.dependency_overrides[workspaces_router.get_workspace_service] = lambda: _FakeService()
+        try:
+            response = TestClient(app).delete("/api/workspaces/ws_del")
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+        return response, calls
+
+    def test_container_and_metadata_removed_concurrently(self, tmp_path, monkeypatch):
+        response, calls = self._delete(tmp_path, monkeypatch, lambda path: None)
+
+        assert response.status_code == 204
+        # DB 삭제는 컨테이너 제거 완료를 기다리지 않음, 디렉토리 삭제 후 커밋
+        assert calls.index("db:delete") < calls.index("container:end")
+        assert calls[-2:] == ["fs:delete", "db:commit"]
+
+    def test_directory_error_rolls_back_metadata(self, tmp_path, monkeypatch):
+        def _reject(path):
+            raise ValueError("Cannot delete path outside /workspaces")
+
+        response, calls = self._delete(tmp_path, monkeypatch, _reject)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_PATH"
+        assert "db:rollback" in calls and "db:commit" not in calls
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
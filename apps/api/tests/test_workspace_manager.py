@@ -232,6 +232,47 @@ class TestWorkspaceManagerWithDocker:
         assert success is False
         assert "already exists" in message.lower()
 
+    @pytest.mark.asyncio
+    async def test_execute_with_stdin_sends_input_without_shell(self, manager_with_docker):
+        """stdin 입력 실행 테스트 (sh -c 없이 argv 그대로, 출력 demux)"""
+        import socket
+        import struct
+        import threading
+
+        mock_container = MagicMock()
+        mock_container.id = "abc123456789"
+        mock_container.status = "running"
+        manager_with_docker.client.containers.get.return_value = mock_container
+
+        client_sock, server_sock = socket.socketpair()
+        received = []
+
+        def _fake_exec_server():
+            data = b""
+            while chunk := server_sock.recv(1024):
+                data += chunk
+            received.append(data)
+            for stream, payload in ((1, b"ok\n"), (2, b"warn\n")):
+                server_sock.sendall(struct.pack(">BxxxL", stream, len(payload)) + payload)
+            server_sock.close()
+
+        threading.Thread(target=_fake_exec_server, daemon=True).start()
+        api = manager_with_docker.client.api
+        api.exec_create.return_value = {"Id": "exec1"}
+        api.exec_start.return_value = client_sock
+        api.exec_inspect.return_value = {"ExitCode": 0}
+
+        result = await manager_with_docker.execute_with_stdin(
+            "test-workspace", ["sudo", "chpasswd"], b"developer:Secret123\n", timeout=5
+        )
+
+        assert api.exec_create.call_args.kwargs["cmd"] == ["sudo", "chpasswd"]
+        assert api.exec_create.call_args.kwargs["stdin"] is True
+        assert received == [b"developer:Secret123\n"]
+        assert result.exit_code == 0
+        assert result.stdout == "ok\n"
+        assert result.stderr == "warn\n"
+
 
 class TestContainerModels:
     """컨테이너 모델 테스트"""
@@ -0,0 +1,258 @@
+"""
+워크스페이스 라우터 헬퍼 테스트
+"""
+
+import pytest
+
+from src.routers import workspaces as workspaces_router
+
+
+class TestLegacyWorkspaceScan:
+    """파일시스템 기반(하위 호환) 워크스페이스 목록"""
+
+    def test_lists_only_ws_directories_with_pagination(self, tmp_path, monkeypatch):
+        for name in ["ws_a", "ws_b", "ws_c", "other"]:
+            (tmp_path / name).mkdir()
+        (tmp_path / "ws_file").write_text("x")
+        (tmp_path / "ws_link").symlink_to(tmp_path / "ws_a")
+        monkeypatch.setattr(workspaces_router, "_LEGACY_WORKSPACES_DIR", tmp_path)
+
+        all_items = workspaces_router._scan_legacy_workspaces(offset=0, limit=10)
+        assert sorted(w.workspace_id for w in all_items) == ["ws_a", "ws_b", "ws_c"]
+        item = next(w for w in all_items if w.workspace_id == "ws_b")
+        assert item.name == "b"
+        assert item.root_path == str(tmp_path / "ws_b")
+
+        page = workspaces_router._scan_legacy_workspaces(offset=1, limit=1)
+        assert len(page) == 1
+
+    def test_missing_directory_returns_empty(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(workspaces_router, "_LEGACY_WORKSPACES_DIR", tmp_path / "missing")
+        assert workspaces_router._scan_legacy_workspaces(offset=0, limit=10) == []
+
+    def test_list_endpoint_scans_directory_only_when_requested(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.db.connection import get_db
+        from src.db.models import UserModel
+        from src.services.rbac_service import get_current_user
+
+        (tmp_path / "ws_legacy").mkdir()
+        monkeypatch.setattr(workspaces_router, "_LEGACY_WORKSPACES_DIR", tmp_path)
+
+        class _EmptyDB:
+            async def execute(self, *args, **kwargs):
+                return SimpleNamespace(all=lambda: [])
+
+        async def _fake_get_db():
+            yield _EmptyDB()
+
+        async def _fake_user():
+            return UserModel(user_id="u-list", org_id="org_default", email="l@example.com", name="L", role="developer")
+
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[get_current_user] = _fake_user
+        try:
+            client = TestClient(app)
+            default = client.get("/api/workspaces")
+            with_orphans = client.get("/api/workspaces", params={"include_orphans": "true"})
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        # 기본 경로는 DB 조회만 수행
+        assert default.status_code == 200 and default.json() == []
+        assert with_orphans.status_code == 200
+        assert [w["workspaceId"] for w in with_orphans.json()] == ["ws_legacy"]
+
+
+
+
+class TestCloneEndpoint:
+    """GitHub 클론 API (백그라운드 작업)"""
+
+    def test_clone_returns_accepted_and_status_is_pollable(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.db.connection import get_db
+        from src.db.models import UserModel
+        from src.services.git_clone_service import CloneJob, GitCloneService
+        from src.services.rbac_service import get_current_user
+
+        started = []
+
+        class _RecordingCloneService(GitCloneService):
+            # TestClient는 요청마다 이벤트 루프가 달라지므로 태스크를 띄우지 않고 작업만 등록
+            def start_clone(self, workspace_id, owner_id, repository_url, branch, workspace_root, on_success, full_history=False):
+                started.append((workspace_id, repository_url, workspace_root, on_success))
+                job = CloneJob(workspace_id=workspace_id, owner_id=owner_id, repository_url=repository_url, branch=branch)
+                self._jobs[workspace_id] = job
+                self._active_by_source[(owner_id, repository_url, branch, full_history)] = workspace_id
+                return job
+
+        async def _fake_get_db():
+            yield None
+
+        async def _fake_user():
+            return UserModel(user_id="u-clone", org_id="org_default", email="c@example.com", name="C", role="developer")
+
+        service = _RecordingCloneService()
+        monkeypatch.setattr(workspaces_router, "get_git_clone_service", lambda: service)
+        monkeypatch.setattr(workspaces_router, "get_workspace_root", lambda ws_id: tmp_path / ws_id)
+
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[get_current_user] = _fake_user
+        try:
+            client = TestClient(app)
+            body = {"repositoryUrl": "https://github.com/owner/repo"}
+            r = client.post("/api/workspaces/clone", json=body)
+            assert r.status_code == 202
+            data = r.json()
+            assert data["status"] == "pending"
+            assert data["workspaceId"].startswith("ws_repo_")
+            assert data["projectId"].startswith("prj_repo_")
+            assert (tmp_path / data["workspaceId"]).is_dir()
+
+            # 같은 저장소 클론이 진행 중이면 기존 작업 반환
+            again = client.post("/api/workspaces/clone", json=body)
+            assert again.status_code == 202
+            assert again.json()["workspaceId"] == data["workspaceId"]
+            assert len(started) == 1
+
+            # 전체 히스토리 요청은 얕은 클론 작업을 재사용하지 않음
+            full = client.post("/api/workspaces/clone", json={**body, "fullHistory": True})
+            assert full.status_code == 202
+            assert full.json()["workspaceId"] != data["workspaceId"]
+            assert len(started) == 2
+
+            service.get_job(data["workspaceId"]).status = "cloning"
+            status_r = client.get(f"/api/workspaces/clone/status/{data['workspaceId']}")
+            assert status_r.status_code == 200
+            assert status_r.json()["status"] == "cloning"
+            assert status_r.json()["workspaceId"] == data["workspaceId"]
+
+            missing = client.get("/api/workspaces/clone/status/ws_unknown")
+            assert missing.status_code == 404
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+    def test_clone_rejects_unsafe_workspace_name(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        from src.db.connection import get_db
+        from src.db.models import UserModel
+        from src.services.rbac_service import get_current_user
+
+        async def _fake_get_db():
+            yield None
+
+        async def _fake_user():
+            return UserModel(user_id="u-clone", org_id="org_default", email="c@example.com", name="C", role="developer")
+
+        monkeypatch.setattr(workspaces_router, "get_git_clone_service", lambda: None)
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[get_current_user] = _fake_user
+        try:
+            r = TestClient(app).post(
+                "/api/workspaces/clone",
+                json={"repositoryUrl": "https://github.com/owner/repo", "name": "../etc"},
+            )
+        finally:
+            app.dependency_overrides.clear()
+            app.dependency_overrides.update(saved)
+
+        assert r.status_code == 400
+        assert r.json()["detail"]["code"] == "INVALID_WORKSPACE_NAME"
+        assert workspaces_router._REPO_NAME_RE.search("git@github.com:owner/my-repo.git").group(1) == "my-repo"
+
+
+class TestCreateWorkspace:
+    """워크스페이스 생성 API (DB UNIQUE 제약 기반 중복 판정)"""
+
+    @pytest.fixture
+    def workspace_db(self, tmp_path, monkeypatch):
+        import asyncio
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import NullPool
+        from src.main import app
+        from src.db.connection import Base, get_db
+        from src.db.models import OrganizationModel, ProjectModel, UserModel, WorkspaceModel
+        from src.services.rbac_service import get_current_user
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ws.db'}", poolclass=NullPool)
+
+        async def _create_tables():
+            async with engine.begin() as conn:
+                await conn.run_sync(
+                    Base.metadata.create_all,
+                    tables=[OrganizationModel.__table__, UserModel.__table__, ProjectModel.__table__, WorkspaceModel.__table__],
+                )
+
+        asyncio.run(_create_tables())
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def _fake_get_db():
+            async with session_factory() as session:
+                yield session
+                await session.commit()
+
+        async def _fake_user():
+            return UserModel(user_id="u-create", org_id="org_default", email="w@example.com", name="W", role="developer")
+
+        async def _no_provision(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(workspaces_router, "get_workspace_root", lambda ws_id: tmp_path / "workspaces" / ws_id)
+        monkeypatch.setattr(workspaces_router, "_provision_ide_container", _no_provision)
+        monkeypatch.setattr(workspaces_router.secrets, "token_urlsafe", lambda n: "fixed")
+
+        saved = dict(app.dependency_overrides)
+        app.dependency_overrides[get_db] = _fake_get_db
+        app.dependency_overrides[get_current_user] = _fake_user
+        yield tmp_path / "workspaces"
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved)
+
+    def test_duplicate_workspace_id_returns_conflict(self, workspace_db):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        client = TestClient(app)
+        r = client.post("/api/workspaces", json={"name": "demo", "projectName": "P"})
+        assert r.status_code == 201
+        assert r.json()["workspaceId"] == "ws_demo_fixed"
+        assert (workspace_db / "ws_demo_fixed").is_dir()
+
+        # 같은 suffix → workspace_id UNIQUE 위반 → 409 (파일시스템은 건드리지 않음)
+        dup = client.post("/api/workspaces", json={"name": "demo", "projectId": r.json()["projectId"]})
+        assert dup.status_code == 409
+        assert dup.json()["detail"]["code"] == "WS_ALREADY_EXISTS"
+
+        listed = client.get("/api/workspaces")
+        assert listed.status_code == 200
+        assert listed.json() == [{
+            "workspaceId": "ws_demo_fixed",
+            "projectId": r.json()["projectId"],
+            "name": "demo",
+            "rootPath": str(workspace_db / "ws_demo_fixed"),
+        }]
+
+    def test_orphan_directory_returns_conflict_and_rolls_back(self, workspace_db):
+        from fastapi.testclient import TestClient
+        from src.main import app
+
+        # DB에 없는 디렉토리가 남아 있으면 재사용하지 않고 409, 메타데이터도 남기지 않음
+        (workspace_db / "ws_orphan_fixed").mkdir(parents=True)
+        (workspace_db / "ws_orphan_fixed" / "old.txt").write_text("old")
+
+        client = TestClient(app)
+        r = client.post("/api/workspaces", json={"name": "orphan", "projectName": "P"})
+        assert r.status_code == 409
+        assert r.json()["detail"]["code"] == "WS_ALREADY_EXISTS"
+        assert (workspace_db / "ws_orphan_fixed" / "old.txt").read_text() == "old"
+        assert client.get("/api/workspaces").json() == []
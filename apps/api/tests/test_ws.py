@@ -0,0 +1,538 @@
+"""
+WebSocket 연결 관리자 테스트
+
+실제 소켓 없이 fake WebSocket으로 브로드캐스트 동작을 검증한다.
+"""
+
+import json
+
+import pytest
+
+from src.routers.ws import ConnectionManager
+
+
+class _FakeWebSocket:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(json.loads(text))
+
+
+def _register(manager, workspace_id, *sockets):
+    for ws in sockets:
+        manager._add_connection(ws, workspace_id)
+
+
+class TestBroadcastLocal:
+    """로컬 브로드캐스트"""
+
+    @pytest.mark.asyncio
+    async def test_sends_to_all_except_sender(self):
+        manager = ConnectionManager()
+        sender, a, b = _FakeWebSocket(), _FakeWebSocket(), _FakeWebSocket()
+        _register(manager, "ws1", sender, a, b)
+
+        await manager._broadcast_local('{"type":"file_change"}', "ws1", exclude=sender)
+
+        assert sender.sent == []
+        assert a.sent == b.sent == [{"type": "file_change"}]
+
+    @pytest.mark.asyncio
+    async def test_dead_connections_are_pruned(self):
+        manager = ConnectionManager()
+        alive, dead = _FakeWebSocket(), _FakeWebSocket(fail=True)
+        _register(manager, "ws1", alive, dead)
+
+        await manager._broadcast_local('{"type":"cursor_move"}', "ws1")
+
+        assert alive.sent == [{"type": "cursor_move"}]
+        assert manager.active_connections["ws1"] == [alive]
+
+        # 마지막 연결까지 끊기면 워크스페이스 항목 제거
+        alive.fail = True
+        await manager._broadcast_local('{"type":"cursor_move"}', "ws1")
+        assert "ws1" not in manager.active_connections
+        assert "ws1" not in manager._index
+
+
+class TestConnectionRegistry:
+    """로컬 연결 목록"""
+
+    def test_swap_remove_keeps_index_consistent(self):
+        manager = ConnectionManager()
+        sockets = [_FakeWebSocket() for _ in range(4)]
+        assert manager._add_connection(sockets[0], "ws1") is True
+        _register(manager, "ws1", *sockets[1:])
+        _register(manager, "ws1", sockets[1])  # 중복 등록 무시
+
+        assert manager._remove_connection(sockets[1], "ws1") is False
+        assert manager._remove_connection(sockets[1], "ws1") is False  # 이미 제거됨
+
+        connections = manager.active_connections["ws1"]
+        assert sorted(map(id, connections)) == sorted(map(id, [sockets[0], sockets[2], sockets[3]]))
+        assert manager._index["ws1"] == {id(ws): i for i, ws in enumerate(connections)}
+
+        for ws in (sockets[3], sockets[0]):
+            assert manager._remove_connection(ws, "ws1") is False
+        assert manager._remove_connection(sockets[2], "ws1") is True
+        assert manager.active_connections == {} and manager._index == {}
+
+
+class TestConnectedMessage:
+    """연결 성공 메시지"""
+
+    @pytest.mark.asyncio
+    async def test_serialized_once_per_workspace_and_dropped_with_last_connection(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "redis_client", None)
+        calls = []
+        real_dumps = ws_module._dumps
+        monkeypatch.setattr(ws_module, "_dumps", lambda m: calls.append(m) or real_dumps(m))
+
+        manager = ConnectionManager()
+        a, b = _FakeWebSocket(), _FakeWebSocket()
+        for ws in (a, b):
+            await manager.connect(ws, "ws1")
+            await manager.send_connected(ws, "ws1")
+
+        assert len(calls) == 1
+        assert a.sent == b.sent
+        assert a.sent[0]["payload"] == {
+            "event": "connected",
+            "workspace_id": "ws1",
+            "message": "WebSocket connected (stub)",
+        }
+
+        await manager.disconnect(a, "ws1")
+        assert "ws1" in manager._connected_messages
+        await manager.disconnect(b, "ws1")
+        assert "ws1" not in manager._connected_messages
+
+
+class TestBroadcast:
+    """브로드캐스트 직렬화"""
+
+    @pytest.mark.asyncio
+    async def test_serializes_once_for_all_recipients(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        calls = []
+        real_dumps = ws_module._dumps
+        monkeypatch.setattr(ws_module, "_dumps", lambda m: calls.append(m) or real_dumps(m))
+        monkeypatch.setattr(ws_module, "redis_client", None)
+
+        manager = ConnectionManager()
+        clients = [_FakeWebSocket() for _ in range(3)]
+        _register(manager, "ws1", *clients)
+        message = {"type": "file_change", "payload": {"file_path": "한글.py"}}
+
+        await manager.broadcast(message, "ws1")
+
+        assert len(calls) == 1
+        assert all(c.sent == [message] for c in clients)
+
+
+class TestCursorBatching:
+    """커서 이동 묶음 전송"""
+
+    @pytest.mark.asyncio
+    async def test_latest_position_per_user_in_one_frame(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "CURSOR_FLUSH_MS", 10)
+        monkeypatch.setattr(ws_module, "redis_client", None)
+
+        manager = ConnectionManager()
+        viewer = _FakeWebSocket()
+        _register(manager, "ws1", viewer)
+
+        for line in range(5):
+            await manager.queue_cursor_move({"user_id": "alice", "line": line}, "ws1")
+        await manager.queue_cursor_move({"user_id": "bob", "line": 7}, "ws1")
+        assert viewer.sent == []
+
+        await manager._flush_tasks["ws1"]
+
+        assert len(viewer.sent) == 1
+        frame = viewer.sent[0]
+        assert frame["type"] == "cursor_move_batch"
+        assert sorted((c["user_id"], c["line"]) for c in frame["payload"]["cursors"]) == [("alice", 4), ("bob", 7)]
+        assert manager._flush_tasks == {} and manager._cursor_buffers == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_excludes_senders_own_cursor(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "CURSOR_FLUSH_MS", 10)
+        monkeypatch.setattr(ws_module, "redis_client", None)
+
+        manager = ConnectionManager()
+        alice, bob, viewer = _FakeWebSocket(), _FakeWebSocket(), _FakeWebSocket()
+        _register(manager, "ws1", alice, bob, viewer)
+
+        await manager.queue_cursor_move({"user_id": "alice", "line": 1}, "ws1", exclude=alice)
+        await manager.queue_cursor_move({"user_id": "bob", "line": 2}, "ws1", exclude=bob)
+        await manager._flush_tasks["ws1"]
+
+        def _users(ws):
+            return [c["user_id"] for frame in ws.sent for c in frame["payload"]["cursors"]]
+
+        assert _users(alice) == ["bob"]
+        assert _users(bob) == ["alice"]
+        assert sorted(_users(viewer)) == ["alice", "bob"]
+
+    @pytest.mark.asyncio
+    async def test_only_own_cursor_sends_nothing_back(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "CURSOR_FLUSH_MS", 10)
+        monkeypatch.setattr(ws_module, "redis_client", None)
+
+        manager = ConnectionManager()
+        alice = _FakeWebSocket()
+        _register(manager, "ws1", alice)
+
+        await manager.queue_cursor_move({"user_id": "alice", "line": 1}, "ws1", exclude=alice)
+        await manager._flush_tasks["ws1"]
+        assert alice.sent == []
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_immediately(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "CURSOR_FLUSH_MS", 0)
+        monkeypatch.setattr(ws_module, "redis_client", None)
+
+        manager = ConnectionManager()
+        sender, viewer = _FakeWebSocket(), _FakeWebSocket()
+        _register(manager, "ws1", sender, viewer)
+
+        await manager.queue_cursor_move({"user_id": "alice", "line": 1}, "ws1", exclude=sender)
+
+        assert sender.sent == []
+        assert viewer.sent == [{"type": "cursor_move", "payload": {"user_id": "alice", "line": 1}}]
+
+
+async def _stop(task):
+    import asyncio
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+class _FakePipeline:
+    def __init__(self, executed, delay=0):
+        self._executed = executed
+        self._delay = delay
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, channel, text):
+        self._commands.append((channel, text))
+        return self
+
+    async def execute(self):
+        import asyncio
+
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        self._executed.append(list(self._commands))
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.calls = []
+        self.messages = []
+
+    async def subscribe(self, channel):
+        self.calls.append(("subscribe", channel))
+
+    async def unsubscribe(self, channel):
+        self.calls.append(("unsubscribe", channel))
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.executed = []
+        self.execute_delay = 0
+        self.pubsub_instance = _FakePubSub()
+
+    def pubsub(self):
+        return self.pubsub_instance
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return _FakePipeline(self.executed, self.execute_delay)
+
+
+class TestRedisPublish:
+    """Redis 발행 파이프라인"""
+
+    @pytest.mark.asyncio
+    async def test_queued_publishes_share_one_pipeline(self, monkeypatch):
+        import asyncio
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+
+        manager = ConnectionManager()
+        for i in range(3):
+            await manager.broadcast({"type": "file_change", "payload": {"n": i}}, "ws1")
+        assert fake_redis.executed == []  # broadcast는 발행을 기다리지 않음
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        manager._publisher_task.cancel()
+        await manager._publisher_task
+
+        assert len(fake_redis.executed) == 1
+        assert [ch for ch, _ in fake_redis.executed[0]] == ["ws:workspace:ws1"] * 3
+        assert [json.loads(t)["payload"]["n"] for _, t in fake_redis.executed[0]] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_publishes_pending_messages(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change"}, "ws1")
+        await manager.broadcast({"type": "file_change"}, "ws2")
+        # 발행 태스크가 실행되기 전에 종료
+        await manager.shutdown()
+
+        assert manager._publisher_task is None
+        assert [ch for ch, _ in fake_redis.executed[0]] == ["ws:workspace:ws1", "ws:workspace:ws2"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_cursor_moves_but_waits_for_file_changes(self, monkeypatch):
+        import asyncio
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+        monkeypatch.setattr(ws_module, "WS_PUBLISH_QUEUE_MAX", 1)
+
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change", "payload": {"n": 0}}, "ws1")
+        # 대기열이 가득 참 → 커서 이동은 버림
+        await manager.broadcast({"type": "cursor_move_batch"}, "ws1", droppable=True)
+        assert manager._pub_queue.qsize() == 1
+
+        # 파일 변경은 발행 태스크가 대기열을 비울 때까지 기다린 뒤 등록
+        await asyncio.wait_for(manager.broadcast({"type": "file_change", "payload": {"n": 1}}, "ws1"), 1)
+        await manager.shutdown()
+
+        published = [json.loads(text) for batch in fake_redis.executed for _, text in batch]
+        assert [m["type"] for m in published] == ["file_change", "file_change"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_in_flight_pipeline(self, monkeypatch):
+        import asyncio
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        fake_redis.execute_delay = 0.02
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+
+        manager = ConnectionManager()
+        await manager.broadcast({"type": "file_change", "payload": {"n": 0}}, "ws1")
+        await asyncio.sleep(0.005)  # 첫 파이프라인 실행 중
+        await manager.broadcast({"type": "file_change", "payload": {"n": 1}}, "ws1")
+        await manager.shutdown()
+
+        published = [json.loads(text)["payload"]["n"] for batch in fake_redis.executed for _, text in batch]
+        assert published == [0, 1]
+        assert manager._pub_queue.empty()
+
+
+class TestReceiveFrame:
+    """클라이언트 프레임 수신"""
+
+    class _Socket:
+        def __init__(self, message):
+            self._message = message
+
+        async def receive(self):
+            return self._message
+
+    @pytest.mark.asyncio
+    async def test_text_and_binary_frames_parse(self):
+        from src.routers.ws import _loads, _receive_frame
+
+        text = await _receive_frame(self._Socket({"type": "websocket.receive", "text": '{"type":"cursor_move"}'}))
+        raw = await _receive_frame(self._Socket({"type": "websocket.receive", "bytes": b'{"type":"file_change"}'}))
+
+        assert _loads(text) == {"type": "cursor_move"}
+        assert _loads(raw) == {"type": "file_change"}
+
+    @pytest.mark.asyncio
+    async def test_disconnect_raises(self):
+        from fastapi import WebSocketDisconnect
+        from src.routers.ws import _receive_frame
+
+        with pytest.raises(WebSocketDisconnect):
+            await _receive_frame(self._Socket({"type": "websocket.disconnect", "code": 1001}))
+
+    def test_invalid_json_raises_stdlib_decode_error(self):
+        from src.routers.ws import _loads
+
+        with pytest.raises(json.JSONDecodeError):
+            _loads("{not json")
+
+
+class TestRedisSubscription:
+    """워크스페이스 채널 구독"""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_on_first_and_unsubscribes_on_last_connection(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+
+        manager = ConnectionManager()
+        a, b = _FakeWebSocket(), _FakeWebSocket()
+        await manager.connect(a, "ws1")
+        await manager.connect(b, "ws1")
+        await manager.disconnect(a, "ws1")
+        assert fake_redis.pubsub_instance.calls == [("subscribe", "ws:workspace:ws1")]
+        assert manager._channels == {"ws1": "ws:workspace:ws1"}
+
+        await manager.disconnect(b, "ws1")
+        assert fake_redis.pubsub_instance.calls[-1] == ("unsubscribe", "ws:workspace:ws1")
+        assert manager._channels == {}
+
+        await _stop(manager._publisher_task)
+
+    @pytest.mark.asyncio
+    async def test_subscriber_forwards_channel_messages(self, monkeypatch):
+        import src.routers.ws as ws_module
+
+        fake_redis = _FakeRedis()
+        fake_redis.pubsub_instance.messages = [
+            {"type": "subscribe", "channel": "ws:workspace:ws1", "data": 1},
+            {"type": "message", "channel": "ws:workspace:ws1", "data": '{"type":"file_change"}'},
+        ]
+        monkeypatch.setattr(ws_module, "redis_client", fake_redis)
+
+        manager = ConnectionManager()
+        client = _FakeWebSocket()
+        await manager.connect(client, "ws1")
+        await manager._pubsub_task
+
+        assert client.sent == [{"type": "file_change"}]
+        await _stop(manager._publisher_task)
+
+
+class TestWebSocketEndpoint:
+    """WS /ws/workspaces/{ws_id}"""
+
+    def test_message_handling(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        import src.routers.ws as ws_module
+
+        monkeypatch.setattr(ws_module, "redis_client", None)
+        async def _validate(token):
+            return {"sub": "u1"} if token else None
+
+        monkeypatch.setattr(ws_module, "_validate_token", _validate)
+        monkeypatch.setattr(ws_module, "manager", ConnectionManager())
+
+        with TestClient(app).websocket_connect("/ws/workspaces/ws_e2e?token=t") as ws:
+            assert ws.receive_json()["payload"]["event"] == "connected"
+
+            ws.send_text("{not json")
+            assert ws.receive_json()["payload"]["code"] == "WS_INVALID_JSON"
+
+            ws.send_bytes(b'{"type":"file_change","payload":{"file_path":"../etc/passwd"}}')
+            assert ws.receive_json()["payload"]["code"] == "WS_INVALID_PATH"
+
+            ws.send_text('{"type":"nope"}')
+            assert ws.receive_json()["payload"]["code"] == "WS_UNKNOWN_TYPE"
+
+            # JSON이지만 메시지 형식이 아닌 프레임은 연결을 끊지 않고 에러 응답
+            for frame in ("[1, 2]", '{"type":"file_change","payload":"x"}'):
+                ws.send_text(frame)
+                assert ws.receive_json()["payload"]["code"] == "WS_INVALID_JSON"
+
+            ws.send_text('{"type":"file_change","payload":{"file_path":123}}')
+            assert ws.receive_json()["payload"]["code"] == "WS_INVALID_PATH"
+
+    def test_oversized_frame_rejected_before_parse(self, monkeypatch):
+        from fastapi.testclient import TestClient
+        from src.main import app
+        import src.routers.ws as ws_module
+
+        parsed = []
+        monkeypatch.setattr(ws_module, "redis_client", None)
+        async def _validate(token):
+            return {"sub": "u1"}
+
+        monkeypatch.setattr(ws_module, "_validate_token", _validate)
+        monkeypatch.setattr(ws_module, "manager", ConnectionManager())
+        monkeypatch.setattr(ws_module, "WS_MAX_FRAME_BYTES", 64)
+        monkeypatch.setattr(ws_module, "_loads", lambda data: parsed.append(data) or json.loads(data))
+
+        with TestClient(app).websocket_connect("/ws/workspaces/ws_big?token=t") as ws:
+            ws.receive_json()
+            ws.send_text('{"type":"file_change","payload":{"content":"' + "x" * 100 + '"}}')
+            assert ws.receive_json()["payload"]["code"] == "WS_MESSAGE_TOO_LARGE"
+            assert parsed == []
+
+
+class TestFilePathValidation:
+    """file_change 경로 검증"""
+
+    @pytest.mark.parametrize("path", ["/etc/passwd", "..", "../a", "a/../b", "a/..", "\\windows", "a\\..\\b"])
+    def test_rejects_absolute_and_parent_segments(self, path):
+        from src.routers.ws import _BAD_PATH_RE
+
+        assert _BAD_PATH_RE.search(path)
+
+    @pytest.mark.parametrize("path", ["src/main.py", "a..b/c.py", ".../x", "dir/..hidden", ""])
+    def test_allows_relative_paths(self, path):
+        from src.routers.ws import _BAD_PATH_RE
+
+        assert _BAD_PATH_RE.search(path) is None
+
+
+class TestTokenValidation:
+    """WebSocket JWT 검증"""
+
+    @pytest.mark.asyncio
+    async def test_offload_runs_verification_in_thread(self, monkeypatch):
+        import threading
+        import src.routers.ws as ws_module
+
+        threads = []
+
+        def _verify(token):
+            threads.append(threading.current_thread())
+            return {"sub": "u1"}
+
+        monkeypatch.setattr(ws_module.jwt_auth_service, "verify_token", _verify)
+        monkeypatch.setattr(ws_module, "WS_JWT_OFFLOAD", True)
+
+        assert (await ws_module._validate_token("t"))["sub"] == "u1"
+        assert threads[0] is not threading.main_thread()
@@ -149,8 +149,32 @@ export interface CloneGitHubRequest {
   branch?: string;
   projectId?: string;
   projectName?: string;
+  fullHistory?: boolean;
 }
 
+export interface CloneStatus {
+  workspaceId: string;
+  status: "pending" | "cloning" | "ready" | "failed";
+  error?: string | null;
+  progress?: string | null;
+  startedAt: string;
+  completedAt?: string | null;
+}
+
+export async function getCloneStatus(workspaceId: string): Promise<CloneStatus> {
+  const response = await fetch(`${API_BASE_URL}/api/workspaces/clone/status/${workspaceId}`, {
+    headers: getAuthHeaders(),
+  });
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ error: response.statusText }));
+    throw new Error(error.detail?.error || `Failed to get clone status: ${response.statusText}`);
+  }
+  return response.json();
+}
+
+// 클론은 서버에서 백그라운드로 진행되므로 완료(ready)될 때까지 상태를 폴링
+const CLONE_POLL_INTERVAL_MS = 1000;
+
 export async function cloneGitHubRepository(
   request: CloneGitHubRequest
 ): Promise<Workspace> {
@@ -165,7 +189,18 @@ export async function cloneGitHubRepository(
       error.detail?.error || error.detail?.detail || `Failed to clone repository: ${response.statusText}`
     );
   }
-  return response.json();
+  const { status, ...workspace } = await response.json();
+
+  let current: CloneStatus["status"] = status;
+  while (current !== "ready") {
+    await new Promise((resolve) => setTimeout(resolve, CLONE_POLL_INTERVAL_MS));
+    const cloneStatus = await getCloneStatus(workspace.workspaceId);
+    if (cloneStatus.status === "failed") {
+      throw new Error(cloneStatus.error || "Failed to clone repository");
+    }
+    current = cloneStatus.status;
+  }
+  return workspace as Workspace;
 }
 
 export async function deleteWorkspace(workspaceId: string): Promise<void> {